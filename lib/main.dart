@@ -6,6 +6,7 @@ import 'dart:io';
 import 'utils/app_theme.dart';
 import 'utils/adaptive_theme.dart';
 import 'utils/app_router.dart';
+import 'services/formula_service.dart';
 import 'services/hive_service.dart';
 import 'services/ads_service.dart';
 import 'services/iap_service.dart';
@@ -23,11 +24,23 @@ void main() async {
   }
   
   // Initialize Hive
+  var hiveReady = false;
   try {
     await HiveService.init();
+    hiveReady = true;
   } catch (e) {
     debugPrint('Hive initialization error: $e');
   }
+
+  // Move bookmarks of formulas dropped as duplicates to the kept ids
+  if (hiveReady) {
+    try {
+      await FormulaService.loadFormulas();
+      await HiveService.migrateBookmarks(FormulaService.resolveId);
+    } catch (e) {
+      debugPrint('Bookmark migration skipped: $e');
+    }
+  }
   
   // Initialize AdMob (optional - wrap in try-catch for iOS)
   try {
@@ -54,14 +54,16 @@ final bookmarkedIdsProvider = StateProvider<Set<String>>((ref) {
 final bookmarkedFormulasProvider = FutureProvider<List<Formula>>((ref) async {
   final bookmarkedIds = ref.watch(bookmarkedIdsProvider);
   final allFormulas = await ref.watch(formulasProvider.future);
-  
-  return allFormulas.where((f) => bookmarkedIds.contains(f.id)).toList();
+  // Bookmarks of dropped duplicates show the formula they repeat
+  final resolvedIds = FormulaService.resolveIds(bookmarkedIds);
+
+  return allFormulas.where((f) => resolvedIds.contains(f.id)).toList();
 });
 
 /// Provider for checking if formula is bookmarked
 final isBookmarkedProvider = Provider.family<bool, String>((ref, formulaId) {
   final bookmarkedIds = ref.watch(bookmarkedIdsProvider);
-  return bookmarkedIds.contains(formulaId);
+  return FormulaService.resolveIds(bookmarkedIds).contains(formulaId);
 });
 
 /// Provider for dark mode
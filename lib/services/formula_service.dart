@@ -6,6 +6,7 @@ import '../models/formula.dart';
 class FormulaService {
   static List<Formula>? _formulas;
   static List<String>? _categories;
+  static Map<String, String> _aliases = const {};
 
   /// Load formulas from JSON asset file
   static Future<List<Formula>> loadFormulas() async {
@@ -13,19 +14,34 @@ class FormulaService {
 
     try {
       final String jsonString = await rootBundle.loadString('assets/formulas.json');
-      final Map<String, dynamic> jsonData = json.decode(jsonString);
-      final List<dynamic> formulasJson = jsonData['formulas'] as List<dynamic>;
-
-      _formulas = formulasJson
-          .map((json) => Formula.fromJson(json as Map<String, dynamic>))
-          .toList();
-
-      return _formulas!;
+      return parseFormulas(jsonString);
     } catch (e) {
       throw Exception('Failed to load formulas: $e');
     }
   }
 
+  /// Parse and cache a formulas document, including its alias map
+  static List<Formula> parseFormulas(String jsonString) {
+    final Map<String, dynamic> jsonData = json.decode(jsonString);
+    final List<dynamic> formulasJson = jsonData['formulas'] as List<dynamic>;
+
+    _formulas = formulasJson
+        .map((json) => Formula.fromJson(json as Map<String, dynamic>))
+        .toList();
+    _categories = null;
+    _aliases = (jsonData['aliases'] as Map<String, dynamic>? ?? const {})
+        .map((id, target) => MapEntry(id, target as String));
+
+    return _formulas!;
+  }
+
+  /// The id a formula is kept under; ids of dropped duplicates map to the
+  /// formula they repeat
+  static String resolveId(String id) => _aliases[id] ?? id;
+
+  /// Resolve saved ids (such as bookmarks) to the ids formulas are kept under
+  static Set<String> resolveIds(Iterable<String> ids) => ids.map(resolveId).toSet();
+
   /// Get all unique categories
   static Future<List<String>> getCategories() async {
     if (_categories != null) return _categories!;
@@ -54,11 +70,12 @@ class FormulaService {
     return formulas.where((f) => f.category == category).toList();
   }
 
-  /// Get formula by ID
+  /// Get formula by ID (ids of dropped duplicates resolve through aliases)
   static Future<Formula?> getFormulaById(String id) async {
     final formulas = await loadFormulas();
+    final resolved = resolveId(id);
     try {
-      return formulas.firstWhere((f) => f.id == id);
+      return formulas.firstWhere((f) => f.id == resolved);
     } catch (e) {
       return null;
     }
@@ -68,6 +85,7 @@ class FormulaService {
   static void clearCache() {
     _formulas = null;
     _categories = null;
+    _aliases = const {};
   }
 }
 
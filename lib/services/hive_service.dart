@@ -38,6 +38,18 @@ class HiveService {
     return _bookmarksBox?.values.toList() ?? [];
   }
 
+  /// Rewrite bookmarked ids that [resolve] maps to another id, e.g. ids of
+  /// formulas dropped as duplicates
+  static Future<void> migrateBookmarks(String Function(String) resolve) async {
+    for (final id in getBookmarkedIds()) {
+      final resolved = resolve(id);
+      if (resolved != id) {
+        await removeBookmark(id);
+        await addBookmark(resolved);
+      }
+    }
+  }
+
   /// Clear all bookmarks
   static Future<void> clearBookmarks() async {
     await _bookmarksBox?.clear();
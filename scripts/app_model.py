@@ -0,0 +1,167 @@
+"""Python model of the app's formula loading and search path
+
+Mirrors lib/models/formula.dart and lib/services/formula_service.dart closely
+enough to benchmark them off-device: a full JSON decode into model objects
+followed by linear lowercase `contains` scans.
+"""
+
+import json
+import os
+
+
+class Variable:
+    __slots__ = ("name", "type", "unit", "description")
+
+    def __init__(self, name, type, unit=None, description=None):
+        self.name = name
+        self.type = type
+        self.unit = unit
+        self.description = description
+
+    @classmethod
+    def from_json(cls, data):
+        return cls(data["name"], data["type"], data.get("unit"), data.get("description"))
+
+
+class CalculatorConfig:
+    __slots__ = ("inputs", "output", "formula")
+
+    def __init__(self, inputs, output, formula=None):
+        self.inputs = inputs
+        self.output = output
+        self.formula = formula
+
+    @classmethod
+    def from_json(cls, data):
+        return cls(list(data["inputs"]), data["output"], data.get("formula"))
+
+
+class Formula:
+    __slots__ = ("id", "title", "category", "latex", "description", "variables", "calculator")
+
+    def __init__(self, id, title, category, latex, description, variables, calculator=None):
+        self.id = id
+        self.title = title
+        self.category = category
+        self.latex = latex
+        self.description = description
+        self.variables = variables
+        self.calculator = calculator
+
+    @classmethod
+    def from_json(cls, data):
+        calculator = data.get("calculator")
+        return cls(
+            data["id"],
+            data["title"],
+            data["category"],
+            data["latex"],
+            data["description"],
+            [Variable.from_json(v) for v in data.get("variables") or []],
+            CalculatorConfig.from_json(calculator) if calculator is not None else None,
+        )
+
+
+def decode_formulas(text):
+    """FormulaService.loadFormulas: decode the whole asset, then build models"""
+    data = json.loads(text)
+    return [Formula.from_json(f) for f in data["formulas"]]
+
+
+def load_formulas(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return decode_formulas(f.read())
+
+
+def get_categories(formulas):
+    return sorted({f.category for f in formulas})
+
+
+def search_formulas(formulas, query):
+    """FormulaService.searchFormulas: lowercase substring scan of every formula"""
+    if not query:
+        return formulas
+    lower_query = query.lower()
+    return [
+        f for f in formulas
+        if lower_query in f.title.lower()
+        or lower_query in f.description.lower()
+        or lower_query in f.category.lower()
+    ]
+
+
+def get_formulas_by_category(formulas, category):
+    return [f for f in formulas if f.category == category]
+
+
+def get_formula_by_id(formulas, formula_id):
+    for f in formulas:
+        if f.id == formula_id:
+            return f
+    return None
+
+
+class ShardedFormulas:
+    """FormulaService over a shard directory
+
+    Categories come from the manifest; a shard is decoded the first time its
+    category is needed.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, "manifest.json"), "r", encoding="utf-8") as f:
+            self.manifest = json.load(f)
+        self._entries = {entry["name"]: entry for entry in self.manifest["categories"]}
+        self._loaded = {}
+
+    def get_categories(self):
+        return [entry["name"] for entry in self.manifest["categories"]]
+
+    def count(self, category=None):
+        if category is None:
+            return self.manifest["count"]
+        return self._entries[category]["count"]
+
+    def get_formulas_by_category(self, category):
+        if category not in self._loaded:
+            entry = self._entries.get(category)
+            if entry is None:
+                return []
+            path = os.path.join(self.directory, entry["file"])
+            self._loaded[category] = load_formulas(path)
+        return self._loaded[category]
+
+    def load_formulas(self):
+        formulas = []
+        for category in self.get_categories():
+            formulas.extend(self.get_formulas_by_category(category))
+        return formulas
+
+
+class SplitFormulas:
+    """FormulaService over a head/body split
+
+    The list is served from the head file; the body file is decoded the
+    first time a formula's detail fields are needed.
+    """
+
+    def __init__(self, head_path, body_path):
+        self.body_path = body_path
+        with open(head_path, "r", encoding="utf-8") as f:
+            head = json.load(f)
+        self.heads = head["formulas"]
+        self.aliases = head.get("aliases", {})
+        self._bodies = None
+
+    def get_formula_by_id(self, formula_id):
+        """The full Formula, loading bodies on first use"""
+        if self._bodies is None:
+            with open(self.body_path, "r", encoding="utf-8") as f:
+                self._bodies = json.load(f)["bodies"]
+        formula_id = self.aliases.get(formula_id, formula_id)
+        body = self._bodies.get(formula_id)
+        if body is None:
+            return None
+        head = next(h for h in self.heads if h["id"] == formula_id)
+        return Formula.from_json({**head, **body})
@@ -0,0 +1,68 @@
+"""Helpers shared by the JSON variant documents and their benchmarks
+
+Every variant next to formulas.json is compact JSON (dumps()) carrying a
+"format" name and "version" (check_format()), read through a class built
+from the parsed document (DocumentReader.load()). Posting lists are stored
+as gaps between ascending ordinals (gaps() / ungap()).
+"""
+
+import json
+import statistics
+import time
+
+
+def dumps(doc):
+    return json.dumps(doc, ensure_ascii=False, separators=(",", ":"))
+
+
+def check_format(doc, name, version, kind="document"):
+    """Raise ValueError unless doc is version version of format name"""
+    if doc.get("format") != name or doc.get("version") != version:
+        raise ValueError(f"Not a {name} v{version} {kind}")
+
+
+class DocumentReader:
+    """Base for readers constructed from a parsed document: cls(doc)"""
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+
+def gaps(values):
+    """[3, 5, 9] -> [3, 2, 4]"""
+    flat = []
+    last = 0
+    for value in values:
+        flat.append(value - last)
+        last = value
+    return flat
+
+
+def ungap(flat):
+    values = []
+    total = 0
+    for gap in flat:
+        total += gap
+        values.append(total)
+    return values
+
+
+def _median_s(fn, runs):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def median_ms(fn, runs):
+    """Median wall time of runs calls of fn, in milliseconds"""
+    return _median_s(fn, runs) * 1000
+
+
+def median_us(fn, runs):
+    """Median wall time of runs calls of fn, in microseconds"""
+    return _median_s(fn, runs) * 1e6
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""Benchmark the formula pipeline and app load/search path on synthetic corpora
+
+Synthesizes corpora shaped like generate_formulas() output (real LaTeX with
+perturbed variables, variable lists and calculator specs on a share of the
+records), streams them through the build pipeline, then decodes and searches
+them with the app model. Each phase runs in a fresh subprocess so peak RSS is
+attributable to it. Results are written as JSON for comparison across commits:
+
+    python3 scripts/bench_corpus.py --sizes 1000 10000
+    python3 scripts/bench_corpus.py --compare build/bench/old.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import app_model
+import columnar
+from fileio import write_atomic, write_stream_if_changed
+from pipeline import iter_document, iter_source, normalize, serialize, validate
+from records import read_records
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+DEFAULT_OUTPUT = os.path.join("build", "bench", "corpus_scale.json")
+SEARCH_QUERIES = ["energy", "area", "law of", "velocity", "e", "no such formula"]
+
+GREEK = ["\\alpha", "\\beta", "\\gamma", "\\theta", "\\lambda", "\\mu", "\\sigma", "\\omega", "\\phi", "\\rho"]
+LETTERS = "abcdfghkmnpqrstuvwxyzABCDFGHKLMNPQRSTUVWXYZ"
+QUALIFIERS = [
+    "Form", "Variant", "General Case", "Special Case", "Identity", "Rule",
+    "Approximation", "Limit", "Expansion", "Corollary", "Derivation", "Relation",
+]
+_SINGLE_LETTER = re.compile(r"(?<![\\A-Za-z])[A-Za-z](?![A-Za-z])")
+
+
+class SyntheticSource:
+    """Stands in for a corpus.CorpusSource in the pipeline stages"""
+
+    def __init__(self, prefix, category):
+        self.prefix = prefix
+        self.category = category
+
+
+def _templates():
+    return [(source, entry) for _, source, entry in iter_source()]
+
+
+def _perturb_latex(rng, latex):
+    def swap(match):
+        if rng.random() >= 0.3:
+            return match.group(0)
+        symbol = rng.choice(GREEK) if rng.random() < 0.3 else rng.choice(LETTERS)
+        if rng.random() < 0.2:
+            symbol += f"_{{{rng.randint(0, 9)}}}"
+        return symbol
+
+    return _SINGLE_LETTER.sub(swap, latex)
+
+
+def _variables(rng, latex):
+    names = sorted(set(_SINGLE_LETTER.findall(latex))) or ["x"]
+    rng.shuffle(names)
+    names = names[: rng.randint(1, min(5, len(names)))]
+    variables = []
+    for name in names:
+        variable = {"name": name, "type": "int" if rng.random() < 0.15 else "double"}
+        if rng.random() < 0.25:
+            variable["description"] = f"Value of {name}"
+        variables.append(variable)
+    output = latex.split("=", 1)[0].strip() if "=" in latex else "result"
+    calculator = {"inputs": [v["name"] for v in variables], "output": output[:12] or "result"}
+    return variables, calculator
+
+
+def synthesize(count, seed=0):
+    """Yield count (record_id, source, entry) triples for the pipeline"""
+    rng = random.Random(seed)
+    templates = _templates()
+    sources = {}
+    for formula_id in range(1, count + 1):
+        template_source, template = rng.choice(templates)
+        source = sources.setdefault(
+            template_source.category,
+            SyntheticSource(template_source.prefix, template_source.category),
+        )
+        latex = _perturb_latex(rng, template["latex"])
+        if rng.random() < 0.35:
+            variables, calculator = _variables(rng, latex)
+        else:
+            variables, calculator = [], None
+        yield f"{source.prefix}_{formula_id}", source, {
+            "title": f"{template['title']} {rng.choice(QUALIFIERS)} {rng.randint(1, 999)}",
+            "latex": latex,
+            "description": f"{template['description']} ({rng.choice(QUALIFIERS).lower()})",
+            "variables": variables,
+            "calculator": calculator,
+        }
+
+
+def _peak_rss_bytes():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _timed(fn):
+    wall, cpu = time.perf_counter(), time.process_time()
+    result = fn()
+    return result, time.perf_counter() - wall, time.process_time() - cpu
+
+
+def run_generate(count, path, seed):
+    stream = iter_document(serialize(validate(normalize(synthesize(count, seed)))))
+    _, wall, cpu = _timed(lambda: write_stream_if_changed(path, stream))
+    return {
+        "generate_wall_s": wall,
+        "generate_cpu_s": cpu,
+        "output_bytes": os.path.getsize(path),
+        "generate_peak_rss_bytes": _peak_rss_bytes(),
+    }
+
+
+def run_load(path, repeats):
+    formulas, wall, cpu = _timed(lambda: app_model.load_formulas(path))
+    search = {}
+    for query in SEARCH_QUERIES:
+        samples = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            hits = app_model.search_formulas(formulas, query)
+            samples.append(time.perf_counter() - start)
+        search[query] = {"median_ms": statistics.median(samples) * 1000, "hits": len(hits)}
+    return {
+        "decode_wall_s": wall,
+        "decode_cpu_s": cpu,
+        "decode_peak_rss_bytes": _peak_rss_bytes(),
+        "search": search,
+        "search_median_ms": statistics.median(s["median_ms"] for s in search.values()),
+    }
+
+
+def run_columnar(path):
+    """Encode the columnar variant, then time decoding it the way the app would"""
+    columnar_path = path + ".columnar"
+    with open(columnar_path, "w", encoding="utf-8") as f:
+        f.write(columnar.dumps(columnar.encode(read_records(path))))
+    try:
+        def decode():
+            with open(columnar_path, "r", encoding="utf-8") as f:
+                return columnar.decode(json.load(f))
+
+        _, wall, cpu = _timed(decode)
+        return {
+            "columnar_bytes": os.path.getsize(columnar_path),
+            "columnar_decode_wall_s": wall,
+            "columnar_decode_cpu_s": cpu,
+        }
+    finally:
+        os.unlink(columnar_path)
+
+
+def _worker(args):
+    if args.worker == "generate":
+        result = run_generate(args.count, args.path, args.seed)
+    elif args.worker == "columnar":
+        result = run_columnar(args.path)
+    else:
+        result = run_load(args.path, args.repeats)
+    json.dump(result, sys.stdout)
+
+
+def _spawn(*worker_args):
+    cmd = [sys.executable, os.path.abspath(__file__), "--worker", *map(str, worker_args)]
+    out = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+    return json.loads(out)
+
+
+def bench_size(count, seed, workdir):
+    path = os.path.join(workdir, f"formulas_{count}.json")
+    try:
+        result = {"count": count}
+        result.update(_spawn("generate", "--count", count, "--path", path, "--seed", seed))
+        repeats = max(3, min(50, 1_000_000 // count))
+        result.update(_spawn("load", "--path", path, "--repeats", repeats))
+        result.update(_spawn("columnar", "--path", path))
+        return result
+    finally:
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], check=True, capture_output=True, text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+COMPARED_METRICS = [
+    "generate_wall_s", "generate_peak_rss_bytes", "output_bytes",
+    "decode_wall_s", "decode_peak_rss_bytes", "search_median_ms",
+    "columnar_bytes", "columnar_decode_wall_s",
+]
+
+
+def compare(baseline, current):
+    """Print metric ratios (current / baseline) for sizes present in both runs"""
+    base_by_count = {r["count"]: r for r in baseline["results"]}
+    print(f"vs {baseline.get('commit') or 'baseline'}:")
+    for result in current["results"]:
+        base = base_by_count.get(result["count"])
+        if base is None:
+            continue
+        ratios = []
+        for metric in COMPARED_METRICS:
+            if base.get(metric) and result.get(metric) is not None:
+                ratios.append(f"{metric}={result[metric] / base[metric]:.2f}x")
+        print(f"  {result['count']:>9,}: " + " ".join(ratios))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT, help=f"results path (default: {DEFAULT_OUTPUT})")
+    parser.add_argument("--compare", metavar="RESULTS", help="earlier results file to compare against")
+    parser.add_argument("--worker", choices=["generate", "load", "columnar"], help=argparse.SUPPRESS)
+    parser.add_argument("--count", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--path", help=argparse.SUPPRESS)
+    parser.add_argument("--repeats", type=int, default=5, help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.worker:
+        _worker(args)
+        return
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="formula_bench_") as workdir:
+        for count in args.sizes:
+            result = bench_size(count, args.seed, workdir)
+            results.append(result)
+            rss = result["generate_peak_rss_bytes"]
+            peak = f" ({rss / 2**20:.0f} MiB peak)" if rss else ""
+            print(
+                f"{count:>9,} formulas: generate {result['generate_wall_s']:.2f}s{peak}"
+                f" | {result['output_bytes'] / 2**20:.1f} MiB"
+                f" | decode {result['decode_wall_s']:.2f}s"
+                f" | search {result['search_median_ms']:.2f} ms"
+                f" | columnar {result['columnar_bytes'] / 2**20:.1f} MiB,"
+                f" decode {result['columnar_decode_wall_s']:.2f}s"
+            )
+
+    report = {
+        "benchmark": "corpus_scale",
+        "commit": _git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "results": results,
+    }
+    write_atomic(args.output, json.dumps(report, indent=2).encode("utf-8"))
+    print(f"Results saved to {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            compare(json.load(f), report)
+
+
+if __name__ == "__main__":
+    main()
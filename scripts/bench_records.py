@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Compare memory held per record: nested dicts vs records.FormulaRecord
+
+Materializes synthetic corpora (see bench_corpus.synthesize) in both layouts
+and reports traced bytes per record, including the shared flyweight tables.
+
+    python3 scripts/bench_records.py --sizes 10000 100000
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+
+from bench_corpus import synthesize
+from records import Calculator, FormulaRecord, Variable
+
+
+def dict_record(record_id, source, entry):
+    """The dict-of-dicts layout the generator used before FormulaRecord"""
+    return {
+        "id": record_id,
+        "title": entry["title"],
+        "category": source.category,
+        "latex": entry["latex"],
+        "description": entry["description"],
+        "variables": [dict(v) for v in entry["variables"]],
+        "calculator": dict(entry["calculator"], inputs=list(entry["calculator"]["inputs"]))
+        if entry["calculator"] is not None else None,
+    }
+
+
+def slots_record(record_id, source, entry):
+    return FormulaRecord.from_entry(record_id, source.category, entry)
+
+
+def measure(count, build, seed):
+    """Traced bytes retained by count records built with build()"""
+    # Strings in synthetic entries are freshly built, as if decoded from a
+    # source file, so both layouts start from unshared input.
+    entries = list(synthesize(count, seed))
+    Variable._shared.clear()
+    Calculator._shared.clear()
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [build(record_id, source, entry) for record_id, source, entry in entries]
+    del entries
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del kept
+    return retained
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    results = []
+    for count in args.sizes:
+        dict_bytes = measure(count, dict_record, args.seed)
+        slots_bytes = measure(count, slots_record, args.seed)
+        results.append({
+            "count": count,
+            "dict_bytes_per_record": dict_bytes / count,
+            "slots_bytes_per_record": slots_bytes / count,
+            "ratio": dict_bytes / slots_bytes,
+        })
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for r in results:
+        print(
+            f"{r['count']:>9,} records: dicts {r['dict_bytes_per_record']:.0f} B/record, "
+            f"FormulaRecord {r['slots_bytes_per_record']:.0f} B/record ({r['ratio']:.1f}x smaller)"
+        )
+
+
+if __name__ == "__main__":
+    main()
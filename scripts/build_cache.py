@@ -0,0 +1,116 @@
+"""Content-hashed cache of serialized corpus sections
+
+Each (source, section) entry is keyed by a hash of the source module plus
+the files that shape serialization. It stores the source's prefix and
+category, the section's records serialized without ids, their
+(title, latex) keys and their LaTeX issues. Ids come from the id ledger
+and are spliced in at assembly time, so a fully cached source is never
+imported or parsed.
+"""
+
+import hashlib
+import json
+import os
+
+from fileio import write_atomic
+from latex_check import Issue
+
+CACHE_VERSION = 3
+DEFAULT_CACHE_PATH = os.path.join("build", "formula_cache.json")
+
+_SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Changes to these files can change the serialized bytes or LaTeX issues of every record
+BUILDER_FILES = [
+    os.path.join(_SCRIPTS_DIR, "generate_formulas.py"),
+    os.path.join(_SCRIPTS_DIR, "build_cache.py"),
+    os.path.join(_SCRIPTS_DIR, "pipeline.py"),
+    os.path.join(_SCRIPTS_DIR, "records.py"),
+    os.path.join(_SCRIPTS_DIR, "latex.py"),
+    os.path.join(_SCRIPTS_DIR, "latex_check.py"),
+    os.path.join(_SCRIPTS_DIR, "corpus", "__init__.py"),
+]
+
+_builder_digest = None
+
+
+def builder_digest():
+    global _builder_digest
+    if _builder_digest is None:
+        h = hashlib.sha256(f"v{CACHE_VERSION}".encode())
+        for path in BUILDER_FILES:
+            with open(path, "rb") as f:
+                h.update(f.read())
+        _builder_digest = h.hexdigest()
+    return _builder_digest
+
+
+def source_hash(source):
+    """Hash of a corpus source module, salted with the builder digest"""
+    h = hashlib.sha256(builder_digest().encode())
+    with open(source.path, "rb") as f:
+        h.update(f.read())
+    return h.hexdigest()
+
+
+class BuildCache:
+    def __init__(self, path=DEFAULT_CACHE_PATH):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._hashes = {}
+        self._checked = set()
+        self._sections = self._read()
+
+    def _read(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+        if data.get("version") != CACHE_VERSION:
+            return {}
+        return data.get("sections", {})
+
+    def _hash(self, source):
+        if source.name not in self._hashes:
+            self._hashes[source.name] = source_hash(source)
+        return self._hashes[source.name]
+
+    def lookup(self, source, section):
+        """Return the cached {"prefix", "category", "fragments", "keys", "issues"} entry if current, else None"""
+        key = f"{source.name}:{section}"
+        entry = self._sections.get(key)
+        if entry is not None and entry["hash"] != self._hash(source):
+            entry = None
+        if key not in self._checked:
+            self._checked.add(key)
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return entry
+
+    @staticmethod
+    def issues(entry):
+        """The cached LaTeX issues of an entry, per record, as latex_check.Issues"""
+        return [[Issue(*issue) for issue in found] for found in entry["issues"]]
+
+    def store(self, source, section, fragments, keys, issues, prefix=None, category=None):
+        self._sections[f"{source.name}:{section}"] = {
+            "hash": self._hash(source),
+            "prefix": prefix if prefix is not None else source.prefix,
+            "category": category if category is not None else source.category,
+            "fragments": fragments,
+            "keys": [list(key) for key in keys],
+            "issues": [[list(issue) for issue in found] for found in issues],
+        }
+        self._dirty = True
+
+    def save(self):
+        if not self._dirty:
+            return
+        data = {"version": CACHE_VERSION, "sections": self._sections}
+        write_atomic(self.path, json.dumps(data, ensure_ascii=False).encode("utf-8"))
+        self._dirty = False
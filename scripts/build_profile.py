@@ -0,0 +1,157 @@
+"""Per-stage wall time, CPU time and traced-memory peaks for formula builds
+
+Pipeline stages are nested generators, so a stage's next() call runs every
+stage upstream of it. Profiler keeps a stack of active spans and charges
+each one only its exclusive time; memory peaks are inclusive (the highest
+traced allocation while the span or anything it called was running).
+"""
+
+import contextlib
+import time
+import tracemalloc
+
+
+class _Frame:
+    __slots__ = ("key", "wall", "cpu", "child_wall", "child_cpu", "peak")
+
+    def __init__(self, key):
+        self.key = key
+        self.wall = time.perf_counter()
+        self.cpu = time.process_time()
+        self.child_wall = 0.0
+        self.child_cpu = 0.0
+        self.peak = 0
+
+
+class _Stats:
+    __slots__ = ("wall", "cpu", "peak", "calls")
+
+    def __init__(self):
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.peak = 0
+        self.calls = 0
+
+
+class Profiler:
+    """Accumulates exclusive time and peak traced memory per (stage, category)"""
+
+    def __init__(self, trace_memory=True):
+        self.trace_memory = trace_memory
+        self._stack = []
+        self._stats = {}
+        self._started = None
+
+    def start(self):
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self._started = (time.perf_counter(), time.process_time())
+
+    def stop(self):
+        wall = time.perf_counter() - self._started[0]
+        cpu = time.process_time() - self._started[1]
+        peak = 0
+        if self.trace_memory and tracemalloc.is_tracing():
+            peak = tracemalloc.get_traced_memory()[1]
+            peak = max([peak] + [s.peak for s in self._stats.values()])
+            tracemalloc.stop()
+        self.total = {"wall_s": wall, "cpu_s": cpu, "peak_traced_bytes": peak}
+
+    def _enter(self, key):
+        if self.trace_memory and tracemalloc.is_tracing():
+            peak = tracemalloc.get_traced_memory()[1]
+            if self._stack:
+                parent = self._stack[-1]
+                parent.peak = max(parent.peak, peak)
+            tracemalloc.reset_peak()
+        self._stack.append(_Frame(key))
+
+    def _exit(self):
+        frame = self._stack.pop()
+        wall = time.perf_counter() - frame.wall
+        cpu = time.process_time() - frame.cpu
+        if self.trace_memory and tracemalloc.is_tracing():
+            frame.peak = max(frame.peak, tracemalloc.get_traced_memory()[1])
+
+        stats = self._stats.get(frame.key)
+        if stats is None:
+            stats = self._stats[frame.key] = _Stats()
+        stats.wall += wall - frame.child_wall
+        stats.cpu += cpu - frame.child_cpu
+        stats.peak = max(stats.peak, frame.peak)
+        stats.calls += 1
+
+        if self._stack:
+            parent = self._stack[-1]
+            parent.child_wall += wall
+            parent.child_cpu += cpu
+            parent.peak = max(parent.peak, frame.peak)
+
+    @contextlib.contextmanager
+    def span(self, stage, category=None):
+        self._enter((stage, category))
+        try:
+            yield
+        finally:
+            self._exit()
+
+    def stage(self, stage, category, iterable):
+        """Wrap a generator stage so each next() call is charged to (stage, category)"""
+        iterator = iter(iterable)
+        while True:
+            self._enter((stage, category))
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self._exit()
+            yield item
+
+    def report(self):
+        """Machine-readable report: totals plus one row per (stage, category)"""
+        rows = [
+            {
+                "stage": stage,
+                "category": category,
+                "wall_s": stats.wall,
+                "cpu_s": stats.cpu,
+                "peak_traced_bytes": stats.peak if self.trace_memory else None,
+                "calls": stats.calls,
+            }
+            for (stage, category), stats in self._stats.items()
+        ]
+        rows.sort(key=lambda row: row["wall_s"], reverse=True)
+        return {"total": getattr(self, "total", None), "stages": rows}
+
+    def format_table(self, limit=None):
+        report = self.report()
+        lines = [f"{'stage':<12} {'category':<16} {'wall ms':>9} {'cpu ms':>9} {'peak KiB':>9} {'calls':>7}"]
+        for row in report["stages"][:limit]:
+            peak = row["peak_traced_bytes"]
+            lines.append(
+                f"{row['stage']:<12} {row['category'] or '-':<16} "
+                f"{row['wall_s'] * 1000:>9.2f} {row['cpu_s'] * 1000:>9.2f} "
+                f"{(peak or 0) / 1024:>9.0f} {row['calls']:>7}"
+            )
+        total = report["total"]
+        if total:
+            lines.append(
+                f"{'total':<12} {'':<16} {total['wall_s'] * 1000:>9.2f} "
+                f"{total['cpu_s'] * 1000:>9.2f} {total['peak_traced_bytes'] / 1024:>9.0f}"
+            )
+        return "\n".join(lines)
+
+
+class NullProfiler:
+    """Profiler stand-in that adds no overhead"""
+
+    @contextlib.contextmanager
+    def span(self, stage, category=None):
+        yield
+
+    def stage(self, stage, category, iterable):
+        return iterable
+
+
+NULL_PROFILER = NullProfiler()
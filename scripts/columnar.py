@@ -0,0 +1,160 @@
+"""Columnar (struct-of-arrays) variant of the formulas asset
+
+Layout, all integers indexing into "strings" unless noted:
+
+    strings        every distinct string, once
+    categories     category names; "category" holds indices into this list
+    id, title, latex, description
+                   one entry per record
+    variableStart  count + 1 offsets into variableRefs; record i owns
+                   variableRefs[variableStart[i]:variableStart[i + 1]]
+    variableRefs   indices into variables
+    variables      shared [name, type, unit, description] rows (-1 = absent)
+    calculator     per record, index into calculators or -1
+    calculators    shared [output, formula, inputStart, inputEnd] rows; the
+                   inputs are calculatorInputs[inputStart:inputEnd]
+    aliases        the asset's {dropped id: kept id} map, when it has one
+
+Keys are written once and repeated values collapse into the string and
+variable tables, which is where most of the row format's bytes go.
+"""
+
+import json
+
+from assetdoc import check_format, dumps
+from fileio import write_if_changed
+from records import Calculator, FormulaRecord, Records, Variable, aliases_of
+
+FORMAT = "formulas.columnar"
+VERSION = 1
+
+
+class _StringTable:
+    def __init__(self):
+        self.strings = []
+        self._index = {}
+
+    def __call__(self, value):
+        if value is None:
+            return -1
+        index = self._index.get(value)
+        if index is None:
+            index = self._index[value] = len(self.strings)
+            self.strings.append(value)
+        return index
+
+
+def encode(records):
+    """Encode FormulaRecords into the columnar document"""
+    string = _StringTable()
+    categories, category_index = [], {}
+    columns = {key: [] for key in ("id", "title", "latex", "description", "category", "calculator")}
+    variable_start, variable_refs = [0], []
+    variables, variable_index = [], {}
+    calculators, calculator_index, calculator_inputs = [], {}, []
+
+    for record in records:
+        columns["id"].append(string(record.id))
+        columns["title"].append(string(record.title))
+        columns["latex"].append(string(record.latex))
+        columns["description"].append(string(record.description))
+
+        if record.category not in category_index:
+            category_index[record.category] = len(categories)
+            categories.append(record.category)
+        columns["category"].append(category_index[record.category])
+
+        for variable in record.variables:
+            row = (string(variable.name), string(variable.type),
+                   string(variable.unit), string(variable.description))
+            if row not in variable_index:
+                variable_index[row] = len(variables)
+                variables.append(list(row))
+            variable_refs.append(variable_index[row])
+        variable_start.append(len(variable_refs))
+
+        calculator = record.calculator
+        if calculator is None:
+            columns["calculator"].append(-1)
+            continue
+        key = (calculator.inputs, calculator.output, calculator.formula)
+        if key not in calculator_index:
+            start = len(calculator_inputs)
+            calculator_inputs.extend(string(name) for name in calculator.inputs)
+            calculator_index[key] = len(calculators)
+            calculators.append([string(calculator.output), string(calculator.formula),
+                                start, len(calculator_inputs)])
+        columns["calculator"].append(calculator_index[key])
+
+    doc = {
+        "format": FORMAT,
+        "version": VERSION,
+        "count": len(columns["id"]),
+        "strings": string.strings,
+        "categories": categories,
+        **{key: columns[key] for key in ("id", "title", "category", "latex", "description")},
+        "variableStart": variable_start,
+        "variableRefs": variable_refs,
+        "variables": variables,
+        "calculator": columns["calculator"],
+        "calculators": calculators,
+        "calculatorInputs": calculator_inputs,
+    }
+    aliases = aliases_of(records)
+    if aliases:
+        doc["aliases"] = aliases
+    return doc
+
+
+def decode(doc):
+    """Rebuild Records from a columnar document"""
+    check_format(doc, FORMAT, VERSION)
+    strings = doc["strings"]
+
+    def text(index):
+        return strings[index] if index >= 0 else None
+
+    variables = [
+        Variable.of(text(name), text(type), text(unit), text(description))
+        for name, type, unit, description in doc["variables"]
+    ]
+    inputs = doc["calculatorInputs"]
+    calculators = [
+        Calculator.of([strings[i] for i in inputs[start:end]], text(output), text(formula))
+        for output, formula, start, end in doc["calculators"]
+    ]
+    categories = doc["categories"]
+    refs, starts = doc["variableRefs"], doc["variableStart"]
+
+    records = Records(aliases=doc.get("aliases"))
+    for i in range(doc["count"]):
+        calculator = doc["calculator"][i]
+        records.append(FormulaRecord(
+            strings[doc["id"][i]],
+            strings[doc["title"][i]],
+            categories[doc["category"][i]],
+            strings[doc["latex"][i]],
+            strings[doc["description"][i]],
+            tuple(variables[r] for r in refs[starts[i]:starts[i + 1]]),
+            calculators[calculator] if calculator >= 0 else None,
+        ))
+    return records
+
+
+def check_roundtrip(records, doc):
+    """Raise ValueError unless doc decodes to exactly the given records"""
+    decoded = decode(json.loads(dumps(doc)))
+    if len(decoded) != len(records):
+        raise ValueError(f"Columnar round trip: {len(decoded)} records, expected {len(records)}")
+    for original, restored in zip(records, decoded):
+        if original.to_dict() != restored.to_dict():
+            raise ValueError(f"Columnar round trip changed record {original.id!r}")
+    if decoded.aliases != aliases_of(records):
+        raise ValueError("Columnar round trip changed the aliases")
+
+
+def emit(records, path):
+    """Write the columnar variant after proving it round-trips; returns whether it changed"""
+    doc = encode(records)
+    check_roundtrip(records, doc)
+    return write_if_changed(path, dumps(doc).encode("utf-8"))
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""Precomputed search-as-you-type completions: prefix -> top-k formulas
+
+The generator's "completion" variant writes formulas.completion.json:
+
+    {"format": "formulas.completion", "version": 1, "k": 8,
+     "ids": [...], "titles": [normalized title per formula],
+     "keys": [sorted prefixes], "top": [[ordinal, ...] per key],
+     "leaf": [key indexes whose list is every match]}
+
+Titles are normalized to lowercase words joined by single spaces, and every
+word suffix of a title ("law of cosines", "of cosines", "cosines") is
+completable. So "cos" and "law of c" both reach Law of Cosines. Candidates
+are ordered by a static rank: titles that start with the query come first,
+then shorter titles, then asset order.
+
+The table is a trie cut off where it stops paying: a prefix gets a key
+while more than k formulas match it, and the first prefix with k or fewer
+matches becomes a leaf listing all of them. A keystroke is one dict lookup
+on the typed prefix, or, past a leaf, a startswith filter over at most k
+titles. Run this script to benchmark lookups:
+
+    python3 scripts/completion.py --sizes 10000 100000
+"""
+
+import argparse
+import bisect
+import heapq
+import json
+import random
+import statistics
+import time
+
+from assetdoc import DocumentReader, check_format, dumps
+from fileio import write_if_changed
+from search_index import tokenize
+
+FORMAT = "formulas.completion"
+VERSION = 1
+DEFAULT_K = 8
+
+
+def normalize(text):
+    return " ".join(tokenize(text))
+
+
+def _suffixes(title):
+    """(suffix, starts_title) for every word suffix of a normalized title"""
+    words = title.split(" ")
+    return [(" ".join(words[i:]), i == 0) for i in range(len(words)) if words[i]]
+
+
+def build(records, k=DEFAULT_K):
+    """Return the completion document for records, in asset order"""
+    titles = [normalize(record.title) for record in records]
+    entries = []
+    for ordinal, title in enumerate(titles):
+        word_count = title.count(" ") + 1
+        for suffix, starts_title in _suffixes(title):
+            entries.append((suffix, (not starts_title, word_count, ordinal)))
+    entries.sort()
+    strings = [suffix for suffix, _ in entries]
+
+    table = {}
+    leaves = set()
+    # Depth-first over the implicit trie; entries sharing a prefix are a
+    # contiguous run of the sorted suffixes.
+    stack = [("", 0, len(entries))]
+    while stack:
+        prefix, lo, hi = stack.pop()
+        if prefix:
+            best = {}
+            for _, rank in entries[lo:hi]:
+                ordinal = rank[2]
+                if ordinal not in best or rank < best[ordinal]:
+                    best[ordinal] = rank
+            table[prefix] = [rank[2] for rank in heapq.nsmallest(k, best.values())]
+            if len(best) <= k:
+                leaves.add(prefix)
+                continue
+        depth = len(prefix)
+        i = lo
+        # Suffixes equal to the prefix itself end here.
+        while i < hi and len(strings[i]) == depth:
+            i += 1
+        while i < hi:
+            child = strings[i][: depth + 1]
+            end = bisect.bisect_left(strings, child + "\U0010ffff", i, hi)
+            stack.append((child, i, end))
+            i = end
+
+    keys = sorted(table)
+    return {
+        "format": FORMAT,
+        "version": VERSION,
+        "k": k,
+        "ids": [record.id for record in records],
+        "titles": titles,
+        "keys": keys,
+        "top": [table[key] for key in keys],
+        "leaf": [i for i, key in enumerate(keys) if key in leaves],
+    }
+
+
+def emit(records, path):
+    return write_if_changed(path, dumps(build(records)).encode("utf-8"))
+
+
+class CompletionTable(DocumentReader):
+    """Top-k completions for a typed query"""
+
+    def __init__(self, doc):
+        check_format(doc, FORMAT, VERSION)
+        self.k = doc["k"]
+        self.ids = doc["ids"]
+        self.titles = doc["titles"]
+        leaves = set(doc["leaf"])
+        self._table = {
+            key: (top, i in leaves)
+            for i, (key, top) in enumerate(zip(doc["keys"], doc["top"]))
+        }
+
+    def _ordinals(self, prefix):
+        entry = self._table.get(prefix)
+        if entry is not None:
+            return entry[0]
+        # Past a leaf: find it, then filter its (at most k) formulas.
+        for end in range(len(prefix) - 1, 0, -1):
+            entry = self._table.get(prefix[:end])
+            if entry is None:
+                continue
+            top, is_leaf = entry
+            if not is_leaf:
+                return []
+            return [
+                ordinal for ordinal in top
+                if any(s.startswith(prefix) for s, _ in _suffixes(self.titles[ordinal]))
+            ]
+        return []
+
+    def complete(self, query, limit=None):
+        """Ids of up to k formulas whose titles complete query, best first"""
+        prefix = normalize(query)
+        if not prefix:
+            return []
+        ordinals = self._ordinals(prefix)
+        if limit is not None:
+            ordinals = ordinals[:limit]
+        return [self.ids[ordinal] for ordinal in ordinals]
+
+
+def keystrokes(queries):
+    """Every prefix a user types on the way to each query"""
+    return [query[:end] for query in queries for end in range(1, len(query) + 1)]
+
+
+def bench(count, runs, sample=200, seed=0):
+    import app_model
+    from bench_corpus import SEARCH_QUERIES, synthesize
+    from pipeline import normalize as normalize_records
+
+    records = list(normalize_records(synthesize(count)))
+    formulas = [app_model.Formula.from_json(record.to_dict()) for record in records]
+
+    start = time.perf_counter()
+    text = dumps(build(records))
+    build_ms = (time.perf_counter() - start) * 1000
+    table = CompletionTable(json.loads(text))
+
+    rng = random.Random(seed)
+    typed = [record.title for record in rng.sample(records, min(sample // 10, count))]
+    prefixes = keystrokes(SEARCH_QUERIES + typed)
+    samples = []
+    for _ in range(runs):
+        for prefix in prefixes:
+            start = time.perf_counter()
+            table.complete(prefix)
+            samples.append(time.perf_counter() - start)
+    samples.sort()
+
+    scan_prefixes = keystrokes(SEARCH_QUERIES)
+    scan_samples = []
+    for prefix in scan_prefixes:
+        start = time.perf_counter()
+        app_model.search_formulas(formulas, prefix)
+        scan_samples.append(time.perf_counter() - start)
+    return {
+        "count": count,
+        "build_ms": build_ms,
+        "table_bytes": len(text.encode("utf-8")),
+        "keys": len(table._table),
+        "lookups": len(samples),
+        "median_us": statistics.median(samples) * 1e6,
+        "p99_us": samples[int(len(samples) * 0.99)] * 1e6,
+        "scan_median_ms": statistics.median(scan_samples) * 1000,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark per-keystroke completion lookups")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    results = [bench(count, args.runs) for count in args.sizes]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for r in results:
+        print(
+            f"{r['count']:>9,} formulas: table {r['table_bytes'] / 1024:.0f} KiB, "
+            f"{r['keys']:,} keys, built in {r['build_ms']:.0f} ms; "
+            f"{r['lookups']:,} keystrokes: median {r['median_us']:.1f} us, "
+            f"p99 {r['p99_us']:.1f} us (full scan per keystroke {r['scan_median_ms']:.2f} ms)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Minified and compressed asset variants, and the size/decode-time budget gate
+
+The compressed variants wrap the minified document. gzip output is written
+with a zero mtime so unchanged input produces unchanged bytes; "deflate"
+is a raw DEFLATE stream (Dart: ZLibDecoder(raw: true)).
+"""
+
+import gzip
+import json
+import zlib
+
+from assetdoc import dumps, median_ms
+from fileio import write_if_changed
+from records import aliases_of
+
+DECODE_RUNS = 5
+
+
+def minify(records):
+    doc = {"formulas": [record.to_dict() for record in records]}
+    aliases = aliases_of(records)
+    if aliases:
+        doc["aliases"] = aliases
+    return dumps(doc).encode("utf-8")
+
+
+def gzip_bytes(data):
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def deflate_bytes(data):
+    compressor = zlib.compressobj(9, zlib.DEFLATED, -15)
+    return compressor.compress(data) + compressor.flush()
+
+
+def inflate_bytes(data):
+    return zlib.decompress(data, -15)
+
+
+def emit_min(records, path):
+    return write_if_changed(path, minify(records))
+
+
+def emit_gzip(records, path):
+    return write_if_changed(path, gzip_bytes(minify(records)))
+
+
+def emit_deflate(records, path):
+    return write_if_changed(path, deflate_bytes(minify(records)))
+
+
+def decode_ms(compressed, decompress=gzip.decompress, runs=DECODE_RUNS):
+    """Median wall time in ms to decompress and JSON-decode a variant"""
+    return median_ms(lambda: json.loads(decompress(compressed)), runs)
+
+
+def category_sizes(records):
+    """Per-category minified and standalone gzip bytes, in first-seen order"""
+    by_category = {}
+    for record in records:
+        by_category.setdefault(record.category, []).append(record)
+    rows = []
+    for category, members in by_category.items():
+        data = minify(members)
+        rows.append({
+            "category": category,
+            "records": len(members),
+            "min_bytes": len(data),
+            "gzip_bytes": len(gzip_bytes(data)),
+        })
+    return rows
+
+
+def size_report(records, pretty_bytes=None):
+    """Sizes of each variant, gzip decode time and the per-category breakdown"""
+    data = minify(records)
+    compressed = gzip_bytes(data)
+    return {
+        "records": len(records),
+        "pretty_bytes": pretty_bytes,
+        "min_bytes": len(data),
+        "gzip_bytes": len(compressed),
+        "deflate_bytes": len(deflate_bytes(data)),
+        "gzip_decode_ms": decode_ms(compressed),
+        "categories": category_sizes(records),
+    }
+
+
+def check_budget(report, max_compressed_bytes=None, max_decode_ms=None):
+    """Return budget violations for a size_report() (empty when within budget)"""
+    failures = []
+    if max_compressed_bytes is not None and report["gzip_bytes"] > max_compressed_bytes:
+        failures.append(
+            f"gzip size {report['gzip_bytes']:,} B exceeds budget of {max_compressed_bytes:,} B"
+        )
+    if max_decode_ms is not None and report["gzip_decode_ms"] > max_decode_ms:
+        failures.append(
+            f"decompress+decode {report['gzip_decode_ms']:.2f} ms exceeds budget of {max_decode_ms:.2f} ms"
+        )
+    return failures
+
+
+def format_report(report):
+    lines = []
+    if report["pretty_bytes"] is not None:
+        lines.append(f"pretty   {report['pretty_bytes']:>10,} B")
+    lines += [
+        f"minified {report['min_bytes']:>10,} B",
+        f"gzip     {report['gzip_bytes']:>10,} B  (decompress+decode {report['gzip_decode_ms']:.2f} ms)",
+        f"deflate  {report['deflate_bytes']:>10,} B",
+        "",
+        f"{'category':<16} {'records':>7} {'min B':>9} {'gzip B':>8} {'share':>6}",
+    ]
+    total = sum(row["min_bytes"] for row in report["categories"]) or 1
+    for row in sorted(report["categories"], key=lambda r: r["min_bytes"], reverse=True):
+        lines.append(
+            f"{row['category']:<16} {row['records']:>7} {row['min_bytes']:>9,} "
+            f"{row['gzip_bytes']:>8,} {row['min_bytes'] / total:>6.1%}"
+        )
+    return "\n".join(lines)
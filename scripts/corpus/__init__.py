@@ -0,0 +1,111 @@
+"""Registry of per-category formula corpus sources
+
+Each source is a module in this package named after its category. A module
+declares its id PREFIX and CATEGORY plus three record lists:
+
+    DETAILED    dicts with title/latex/description/variables/calculator
+    CORE        (title, latex, description) tuples
+    ADDITIONAL  (title, latex, description) tuples
+
+Modules are imported only when a build asks for their records, so a build
+of one category does not evaluate the rest of the corpus.
+"""
+
+import importlib
+import os
+
+# Build order. Formula ids are numbered through every source's core
+# section first and then through every source's additional section.
+SOURCE_NAMES = [
+    "algebra",
+    "geometry",
+    "trigonometry",
+    "calculus",
+    "mechanics",
+    "electricity",
+    "waves",
+    "thermodynamics",
+    "chemistry",
+    "statistics",
+]
+
+SECTIONS = ("core", "additional")
+
+
+class CorpusSource:
+    """A lazily imported category module"""
+
+    def __init__(self, name):
+        self.name = name
+        self._module = None
+
+    def __repr__(self):
+        return f"CorpusSource({self.name!r})"
+
+    @property
+    def path(self):
+        return os.path.join(os.path.dirname(__file__), f"{self.name}.py")
+
+    def load(self):
+        if self._module is None:
+            self._module = importlib.import_module(f"{__name__}.{self.name}")
+        return self._module
+
+    @property
+    def prefix(self):
+        return self.load().PREFIX
+
+    @property
+    def category(self):
+        return self.load().CATEGORY
+
+    def entries(self, section):
+        """Return the section's entries as title/latex/description/variables/calculator dicts"""
+        module = self.load()
+        if section == "core":
+            detailed = [dict(entry) for entry in module.DETAILED]
+            return detailed + [_from_tuple(entry) for entry in module.CORE]
+        if section == "additional":
+            return [_from_tuple(entry) for entry in module.ADDITIONAL]
+        raise ValueError(f"Unknown corpus section: {section}")
+
+    def count(self, section):
+        module = self.load()
+        if section == "core":
+            return len(module.DETAILED) + len(module.CORE)
+        if section == "additional":
+            return len(module.ADDITIONAL)
+        raise ValueError(f"Unknown corpus section: {section}")
+
+
+def _from_tuple(entry):
+    title, latex, description = entry
+    return {
+        "title": title,
+        "latex": latex,
+        "description": description,
+        "variables": [],
+        "calculator": None,
+    }
+
+
+SOURCES = [CorpusSource(name) for name in SOURCE_NAMES]
+
+
+def get_source(name):
+    """Look up a source by module name or category name (case-insensitive)"""
+    key = name.strip().lower()
+    for source in SOURCES:
+        if source.name == key:
+            return source
+    raise ValueError(
+        f"Unknown category: {name} (expected one of: {', '.join(SOURCE_NAMES)})"
+    )
+
+
+def select_sources(names=None):
+    """Return the sources to emit, in build order; all of them when names is empty"""
+    if not names:
+        return list(SOURCES)
+    wanted = {get_source(name).name for name in names}
+    return [source for source in SOURCES if source.name in wanted]
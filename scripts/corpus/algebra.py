@@ -0,0 +1,123 @@
+"""Algebra formulas"""
+
+PREFIX = "alg"
+CATEGORY = "Algebra"
+
+# Algebra Formulas (50+)
+DETAILED = [
+    {
+        "title": "Quadratic Formula",
+        "latex": "x=\\frac{-b \\pm \\sqrt{b^2-4ac}}{2a}",
+        "description": "Solves quadratic equations of form ax²+bx+c=0",
+        "variables": [{"name": "a", "type": "double"}, {"name": "b", "type": "double"}, {"name": "c", "type": "double"}],
+        "calculator": {"inputs": ["a", "b", "c"], "output": "x"}
+    },
+    {
+        "title": "Distance Formula",
+        "latex": "d=\\sqrt{(x_2-x_1)^2+(y_2-y_1)^2}",
+        "description": "Distance between two points in coordinate plane",
+        "variables": [{"name": "x1", "type": "double"}, {"name": "y1", "type": "double"}, {"name": "x2", "type": "double"}, {"name": "y2", "type": "double"}],
+        "calculator": {"inputs": ["x1", "y1", "x2", "y2"], "output": "d"}
+    },
+    {
+        "title": "Midpoint Formula",
+        "latex": "M=\\left(\\frac{x_1+x_2}{2},\\frac{y_1+y_2}{2}\\right)",
+        "description": "Midpoint between two points",
+        "variables": [{"name": "x1", "type": "double"}, {"name": "y1", "type": "double"}, {"name": "x2", "type": "double"}, {"name": "y2", "type": "double"}],
+        "calculator": {"inputs": ["x1", "y1", "x2", "y2"], "output": "M"}
+    },
+    {
+        "title": "Slope Formula",
+        "latex": "m=\\frac{y_2-y_1}{x_2-x_1}",
+        "description": "Slope of a line through two points",
+        "variables": [{"name": "x1", "type": "double"}, {"name": "y1", "type": "double"}, {"name": "x2", "type": "double"}, {"name": "y2", "type": "double"}],
+        "calculator": {"inputs": ["x1", "y1", "x2", "y2"], "output": "m"}
+    },
+    {
+        "title": "Arithmetic Mean",
+        "latex": "\\bar{x}=\\frac{1}{n}\\sum_{i=1}^{n}x_i",
+        "description": "Average of n numbers",
+        "variables": [{"name": "n", "type": "int"}, {"name": "sum", "type": "double"}],
+        "calculator": {"inputs": ["n", "sum"], "output": "mean"}
+    },
+    {
+        "title": "Geometric Mean",
+        "latex": "GM=\\sqrt[n]{x_1 \\cdot x_2 \\cdot ... \\cdot x_n}",
+        "description": "Geometric mean of n positive numbers",
+        "variables": [{"name": "n", "type": "int"}, {"name": "product", "type": "double"}],
+        "calculator": {"inputs": ["n", "product"], "output": "GM"}
+    },
+    {
+        "title": "Simple Interest",
+        "latex": "I=\\frac{P \\times R \\times T}{100}",
+        "description": "Simple interest calculation",
+        "variables": [{"name": "P", "type": "double", "description": "Principal"}, {"name": "R", "type": "double", "description": "Rate"}, {"name": "T", "type": "double", "description": "Time"}],
+        "calculator": {"inputs": ["P", "R", "T"], "output": "I"}
+    },
+    {
+        "title": "Compound Interest",
+        "latex": "A=P\\left(1+\\frac{r}{n}\\right)^{nt}",
+        "description": "Compound interest formula",
+        "variables": [{"name": "P", "type": "double"}, {"name": "r", "type": "double"}, {"name": "n", "type": "double"}, {"name": "t", "type": "double"}],
+        "calculator": {"inputs": ["P", "r", "n", "t"], "output": "A"}
+    },
+]
+
+# Add more algebra formulas (factoring, logarithms, etc.)
+CORE = [
+    ("Factoring Difference of Squares", "a^2-b^2=(a+b)(a-b)", "Factoring formula for difference of squares"),
+    ("Factoring Sum of Cubes", "a^3+b^3=(a+b)(a^2-ab+b^2)", "Factoring formula for sum of cubes"),
+    ("Factoring Difference of Cubes", "a^3-b^3=(a-b)(a^2+ab+b^2)", "Factoring formula for difference of cubes"),
+    ("Logarithm Product Rule", "\\log(ab)=\\log(a)+\\log(b)", "Product rule for logarithms"),
+    ("Logarithm Quotient Rule", "\\log\\left(\\frac{a}{b}\\right)=\\log(a)-\\log(b)", "Quotient rule for logarithms"),
+    ("Logarithm Power Rule", "\\log(a^n)=n\\log(a)", "Power rule for logarithms"),
+    ("Change of Base Formula", "\\log_b(a)=\\frac{\\log_c(a)}{\\log_c(b)}", "Change of base for logarithms"),
+    ("Exponential Growth", "A=A_0e^{rt}", "Exponential growth formula"),
+    ("Exponential Decay", "A=A_0e^{-rt}", "Exponential decay formula"),
+    ("Sum of Arithmetic Series", "S_n=\\frac{n}{2}(a_1+a_n)", "Sum of arithmetic series"),
+    ("Sum of Geometric Series", "S_n=\\frac{a(1-r^n)}{1-r}", "Sum of geometric series"),
+    ("Infinite Geometric Series", "S=\\frac{a}{1-r}", "Sum of infinite geometric series when |r|<1"),
+    ("Binomial Theorem", "(a+b)^n=\\sum_{k=0}^{n}\\binom{n}{k}a^{n-k}b^k", "Binomial expansion"),
+    ("Permutation", "P(n,r)=\\frac{n!}{(n-r)!}", "Number of permutations"),
+    ("Combination", "C(n,r)=\\binom{n}{r}=\\frac{n!}{r!(n-r)!}", "Number of combinations"),
+]
+
+# Additional Algebra variations (50+)
+ADDITIONAL = [
+    ("Quadratic Discriminant", "\\Delta=b^2-4ac", "Discriminant of quadratic equation"),
+    ("Vertex Form", "y=a(x-h)^2+k", "Vertex form of parabola"),
+    ("Standard Form", "y=ax^2+bx+c", "Standard form of quadratic"),
+    ("Factored Form", "y=a(x-r_1)(x-r_2)", "Factored form of quadratic"),
+    ("Sum of Roots", "r_1+r_2=-\\frac{b}{a}", "Sum of quadratic roots"),
+    ("Product of Roots", "r_1r_2=\\frac{c}{a}", "Product of quadratic roots"),
+    ("Completing the Square", "x^2+bx+\\left(\\frac{b}{2}\\right)^2=\\left(x+\\frac{b}{2}\\right)^2", "Completing the square method"),
+    ("Absolute Value", "|x|=\\begin{cases} x & \\text{if } x\\geq 0 \\\\ -x & \\text{if } x<0 \\end{cases}", "Absolute value definition"),
+    ("Distance from Point to Line", "d=\\frac{|Ax_0+By_0+C|}{\\sqrt{A^2+B^2}}", "Distance from point to line"),
+    ("Equation of Circle", "(x-h)^2+(y-k)^2=r^2", "Standard equation of circle"),
+    ("Equation of Ellipse", "\\frac{(x-h)^2}{a^2}+\\frac{(y-k)^2}{b^2}=1", "Standard equation of ellipse"),
+    ("Equation of Hyperbola", "\\frac{(x-h)^2}{a^2}-\\frac{(y-k)^2}{b^2}=1", "Standard equation of hyperbola"),
+    ("Equation of Parabola", "(x-h)^2=4p(y-k)", "Standard equation of parabola"),
+    ("Matrix Determinant 2x2", "\\det\\begin{pmatrix}a&b\\\\c&d\\end{pmatrix}=ad-bc", "Determinant of 2x2 matrix"),
+    ("Matrix Multiplication", "C_{ij}=\\sum_{k}A_{ik}B_{kj}", "Matrix multiplication"),
+    ("Inverse Matrix 2x2", "A^{-1}=\\frac{1}{\\det(A)}\\begin{pmatrix}d&-b\\\\-c&a\\end{pmatrix}", "Inverse of 2x2 matrix"),
+    ("Cramer's Rule", "x_i=\\frac{\\det(A_i)}{\\det(A)}", "Cramer's rule for solving systems"),
+    ("Gaussian Elimination", "Row operations to solve systems", "Method for solving linear systems"),
+    ("Vector Magnitude", "|\\vec{v}|=\\sqrt{v_x^2+v_y^2+v_z^2}", "Magnitude of 3D vector"),
+    ("Dot Product", "\\vec{a}\\cdot\\vec{b}=a_xb_x+a_yb_y+a_zb_z", "Dot product of vectors"),
+    ("Cross Product", "\\vec{a}\\times\\vec{b}=\\begin{vmatrix}\\hat{i}&\\hat{j}&\\hat{k}\\\\a_x&a_y&a_z\\\\b_x&b_y&b_z\\end{vmatrix}", "Cross product of vectors"),
+    ("Angle Between Vectors", "\\cos(\\theta)=\\frac{\\vec{a}\\cdot\\vec{b}}{|\\vec{a}||\\vec{b}|}", "Angle between two vectors"),
+    ("Projection of Vector", "\\text{proj}_{\\vec{b}}\\vec{a}=\\frac{\\vec{a}\\cdot\\vec{b}}{|\\vec{b}|^2}\\vec{b}", "Vector projection"),
+    ("Complex Number Addition", "(a+bi)+(c+di)=(a+c)+(b+d)i", "Addition of complex numbers"),
+    ("Complex Number Multiplication", "(a+bi)(c+di)=(ac-bd)+(ad+bc)i", "Multiplication of complex numbers"),
+    ("Complex Conjugate", "\\overline{a+bi}=a-bi", "Complex conjugate"),
+    ("Modulus of Complex", "|a+bi|=\\sqrt{a^2+b^2}", "Modulus of complex number"),
+    ("Euler's Formula", "e^{i\\theta}=\\cos(\\theta)+i\\sin(\\theta)", "Euler's formula"),
+    ("De Moivre's Theorem", "(\\cos(\\theta)+i\\sin(\\theta))^n=\\cos(n\\theta)+i\\sin(n\\theta)", "De Moivre's theorem"),
+    ("Partial Fractions", "\\frac{P(x)}{Q(x)}=\\sum\\frac{A_i}{(x-r_i)}", "Partial fraction decomposition"),
+    ("Synthetic Division", "Polynomial division method", "Method for dividing polynomials"),
+    ("Remainder Theorem", "P(a)=remainder when P(x) divided by (x-a)", "Remainder theorem"),
+    ("Factor Theorem", "If P(a)=0, then (x-a) is a factor", "Factor theorem"),
+    ("Rational Root Theorem", "Possible rational roots are factors of constant/leading coefficient", "Finding rational roots"),
+    ("Descartes' Rule of Signs", "Number of positive/negative roots", "Rule for determining roots"),
+    ("Vieta's Formulas", "Relationships between roots and coefficients", "Vieta's formulas for polynomials"),
+]
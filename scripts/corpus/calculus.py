@@ -0,0 +1,79 @@
+"""Calculus formulas"""
+
+PREFIX = "calc"
+CATEGORY = "Calculus"
+
+DETAILED = []
+
+# Calculus Formulas (70+)
+CORE = [
+    ("Derivative - Power Rule", "\\frac{d}{dx}(x^n)=nx^{n-1}", "Power rule for derivatives"),
+    ("Derivative - Product Rule", "\\frac{d}{dx}(fg)=f'g+fg'", "Product rule for derivatives"),
+    ("Derivative - Quotient Rule", "\\frac{d}{dx}\\left(\\frac{f}{g}\\right)=\\frac{f'g-fg'}{g^2}", "Quotient rule for derivatives"),
+    ("Derivative - Chain Rule", "\\frac{d}{dx}(f(g(x)))=f'(g(x))g'(x)", "Chain rule for derivatives"),
+    ("Derivative of Sine", "\\frac{d}{dx}(\\sin(x))=\\cos(x)", "Derivative of sine function"),
+    ("Derivative of Cosine", "\\frac{d}{dx}(\\cos(x))=-\\sin(x)", "Derivative of cosine function"),
+    ("Derivative of Exponential", "\\frac{d}{dx}(e^x)=e^x", "Derivative of exponential function"),
+    ("Derivative of Logarithm", "\\frac{d}{dx}(\\ln(x))=\\frac{1}{x}", "Derivative of natural logarithm"),
+    ("Fundamental Theorem of Calculus", "\\int_a^b f(x)dx=F(b)-F(a)", "Fundamental theorem of calculus"),
+    ("Integration by Parts", "\\int u dv=uv-\\int v du", "Integration by parts formula"),
+    ("L'Hôpital's Rule", "\\lim_{x\\to a}\\frac{f(x)}{g(x)}=\\lim_{x\\to a}\\frac{f'(x)}{g'(x)}", "L'Hôpital's rule for limits"),
+]
+
+# Additional Calculus formulas (80+)
+ADDITIONAL = [
+    ("Derivative - Constant", "\\frac{d}{dx}(c)=0", "Derivative of constant"),
+    ("Derivative - Sum Rule", "\\frac{d}{dx}(f+g)=f'+g'", "Derivative of sum"),
+    ("Derivative - Difference Rule", "\\frac{d}{dx}(f-g)=f'-g'", "Derivative of difference"),
+    ("Derivative - Constant Multiple", "\\frac{d}{dx}(cf)=cf'", "Derivative of constant multiple"),
+    ("Derivative of Tangent", "\\frac{d}{dx}(\\tan(x))=\\sec^2(x)", "Derivative of tangent"),
+    ("Derivative of Secant", "\\frac{d}{dx}(\\sec(x))=\\sec(x)\\tan(x)", "Derivative of secant"),
+    ("Derivative of Cosecant", "\\frac{d}{dx}(\\csc(x))=-\\csc(x)\\cot(x)", "Derivative of cosecant"),
+    ("Derivative of Cotangent", "\\frac{d}{dx}(\\cot(x))=-\\csc^2(x)", "Derivative of cotangent"),
+    ("Derivative of Arcsin", "\\frac{d}{dx}(\\arcsin(x))=\\frac{1}{\\sqrt{1-x^2}}", "Derivative of arcsin"),
+    ("Derivative of Arccos", "\\frac{d}{dx}(\\arccos(x))=-\\frac{1}{\\sqrt{1-x^2}}", "Derivative of arccos"),
+    ("Derivative of Arctan", "\\frac{d}{dx}(\\arctan(x))=\\frac{1}{1+x^2}", "Derivative of arctan"),
+    ("Derivative of a^x", "\\frac{d}{dx}(a^x)=a^x\\ln(a)", "Derivative of exponential base a"),
+    ("Derivative of log_a(x)", "\\frac{d}{dx}(\\log_a(x))=\\frac{1}{x\\ln(a)}", "Derivative of logarithm base a"),
+    ("Second Derivative", "f''(x)=\\frac{d^2}{dx^2}f(x)", "Second derivative"),
+    ("Higher Order Derivative", "f^{(n)}(x)=\\frac{d^n}{dx^n}f(x)", "nth derivative"),
+    ("Implicit Differentiation", "\\frac{dy}{dx}=-\\frac{F_x}{F_y}", "Implicit differentiation"),
+    ("Related Rates", "\\frac{dy}{dt}=\\frac{dy}{dx}\\cdot\\frac{dx}{dt}", "Related rates formula"),
+    ("Linear Approximation", "f(x)\\approx f(a)+f'(a)(x-a)", "Linear approximation"),
+    ("Taylor Series", "f(x)=\\sum_{n=0}^{\\infty}\\frac{f^{(n)}(a)}{n!}(x-a)^n", "Taylor series expansion"),
+    ("Maclaurin Series", "f(x)=\\sum_{n=0}^{\\infty}\\frac{f^{(n)}(0)}{n!}x^n", "Maclaurin series"),
+    ("Riemann Sum", "\\int_a^b f(x)dx=\\lim_{n\\to\\infty}\\sum_{i=1}^n f(x_i^*)\\Delta x", "Riemann sum"),
+    ("Fundamental Theorem Part 1", "\\frac{d}{dx}\\int_a^x f(t)dt=f(x)", "FTC part 1"),
+    ("Fundamental Theorem Part 2", "\\int_a^b f(x)dx=F(b)-F(a)", "FTC part 2"),
+    ("U-Substitution", "\\int f(g(x))g'(x)dx=\\int f(u)du", "U-substitution method"),
+    ("Integration by Parts", "\\int u dv=uv-\\int v du", "Integration by parts"),
+    ("Partial Fractions Integration", "\\int\\frac{P(x)}{Q(x)}dx", "Integration using partial fractions"),
+    ("Trigonometric Substitution", "x=a\\sin(\\theta), x=a\\tan(\\theta), x=a\\sec(\\theta)", "Trig substitution"),
+    ("Improper Integral Type 1", "\\int_a^{\\infty} f(x)dx=\\lim_{b\\to\\infty}\\int_a^b f(x)dx", "Improper integral infinite limit"),
+    ("Improper Integral Type 2", "\\int_a^b f(x)dx=\\lim_{t\\to a^+}\\int_t^b f(x)dx", "Improper integral discontinuity"),
+    ("Arc Length", "L=\\int_a^b\\sqrt{1+[f'(x)]^2}dx", "Arc length formula"),
+    ("Surface Area of Revolution", "SA=2\\pi\\int_a^b f(x)\\sqrt{1+[f'(x)]^2}dx", "Surface area of revolution"),
+    ("Volume by Disks", "V=\\pi\\int_a^b [f(x)]^2dx", "Volume by disk method"),
+    ("Volume by Washers", "V=\\pi\\int_a^b ([f(x)]^2-[g(x)]^2)dx", "Volume by washer method"),
+    ("Volume by Shells", "V=2\\pi\\int_a^b xf(x)dx", "Volume by shell method"),
+    ("Average Value", "f_{avg}=\\frac{1}{b-a}\\int_a^b f(x)dx", "Average value of function"),
+    ("Mean Value Theorem for Integrals", "f(c)=\\frac{1}{b-a}\\int_a^b f(x)dx", "MVT for integrals"),
+    ("Trapezoidal Rule", "\\int_a^b f(x)dx\\approx\\frac{\\Delta x}{2}[f(x_0)+2f(x_1)+...+2f(x_{n-1})+f(x_n)]", "Trapezoidal approximation"),
+    ("Simpson's Rule", "\\int_a^b f(x)dx\\approx\\frac{\\Delta x}{3}[f(x_0)+4f(x_1)+2f(x_2)+...+4f(x_{n-1})+f(x_n)]", "Simpson's rule"),
+    ("Limit Definition", "\\lim_{x\\to a}f(x)=L", "Limit definition"),
+    ("Continuity", "\\lim_{x\\to a}f(x)=f(a)", "Continuity definition"),
+    ("Squeeze Theorem", "If g(x)\\leq f(x)\\leq h(x) and \\lim g=\\lim h=L, then \\lim f=L", "Squeeze theorem"),
+    ("Intermediate Value Theorem", "If f continuous on [a,b] and k between f(a) and f(b), then f(c)=k", "IVT"),
+    ("Extreme Value Theorem", "Continuous function on [a,b] attains max and min", "EVT"),
+    ("Rolle's Theorem", "If f(a)=f(b) and f differentiable, then f'(c)=0", "Rolle's theorem"),
+    ("Mean Value Theorem", "f'(c)=\\frac{f(b)-f(a)}{b-a}", "Mean value theorem"),
+    ("Critical Point", "f'(c)=0 or f'(c) undefined", "Critical point definition"),
+    ("First Derivative Test", "Sign change of f' indicates local extrema", "First derivative test"),
+    ("Second Derivative Test", "f''(c)>0 implies local min, f''(c)<0 implies local max", "Second derivative test"),
+    ("Concavity", "f''(x)>0 implies concave up, f''(x)<0 implies concave down", "Concavity test"),
+    ("Inflection Point", "Point where concavity changes", "Inflection point"),
+    ("Optimization", "Find max/min of function subject to constraints", "Optimization problem"),
+    ("Newton's Method", "x_{n+1}=x_n-\\frac{f(x_n)}{f'(x_n)}", "Newton's method for roots"),
+    ("Differential", "dy=f'(x)dx", "Differential definition"),
+    ("Error Approximation", "\\Delta y\\approx f'(x)\\Delta x", "Error approximation using differentials"),
+]
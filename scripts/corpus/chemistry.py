@@ -0,0 +1,54 @@
+"""Chemistry formulas"""
+
+PREFIX = "chem"
+CATEGORY = "Chemistry"
+
+DETAILED = []
+
+# Chemistry Formulas (40+)
+CORE = [
+    ("Molarity", "M=\\frac{n}{V}", "Molarity formula"),
+    ("Dilution", "M_1V_1=M_2V_2", "Dilution equation"),
+    ("Ideal Gas Law (Chemistry)", "PV=nRT", "Ideal gas law"),
+    ("pH", "pH=-\\log[H^+]", "pH calculation"),
+    ("pOH", "pOH=-\\log[OH^-]", "pOH calculation"),
+    ("pH + pOH", "pH+pOH=14", "Relationship at 25°C"),
+    ("Rate Law", "rate=k[A]^m[B]^n", "Rate law expression"),
+    ("Arrhenius Equation", "k=Ae^{-E_a/RT}", "Temperature dependence of rate"),
+    ("Nernst Equation", "E=E^0-\\frac{RT}{nF}\\ln(Q)", "Cell potential"),
+    ("Henderson-Hasselbalch", "pH=pK_a+\\log\\left(\\frac{[A^-]}{[HA]}\\right)", "Buffer pH calculation"),
+]
+
+# Additional Chemistry formulas (30+)
+ADDITIONAL = [
+    ("Mole Fraction", "X_i=\\frac{n_i}{n_{total}}", "Mole fraction"),
+    ("Mass Percent", "\\%=\\frac{mass_{solute}}{mass_{solution}}\\times100", "Mass percent"),
+    ("Volume Percent", "\\%=\\frac{volume_{solute}}{volume_{solution}}\\times100", "Volume percent"),
+    ("Parts Per Million", "ppm=\\frac{mass_{solute}}{mass_{solution}}\\times10^6", "Parts per million"),
+    ("Molality", "m=\\frac{moles_{solute}}{kg_{solvent}}", "Molality"),
+    ("Normality", "N=\\frac{equivalents}{L}", "Normality"),
+    ("Raoult's Law", "P_i=X_iP_i^0", "Raoult's law"),
+    ("Henry's Law", "C=kP", "Henry's law"),
+    ("Colligative Properties - Boiling Point", "\\Delta T_b=K_bm", "Boiling point elevation"),
+    ("Colligative Properties - Freezing Point", "\\Delta T_f=K_fm", "Freezing point depression"),
+    ("Osmotic Pressure", "\\Pi=MRT", "Osmotic pressure"),
+    ("Van't Hoff Factor", "i=\\frac{actual\\ particles}{formula\\ units}", "Van't Hoff factor"),
+    ("Rate Constant", "k=Ae^{-E_a/RT}", "Arrhenius equation"),
+    ("Half-Life - First Order", "t_{1/2}=\\frac{\\ln(2)}{k}", "First order half-life"),
+    ("Half-Life - Second Order", "t_{1/2}=\\frac{1}{k[A]_0}", "Second order half-life"),
+    ("Integrated Rate Law - First Order", "\\ln[A]=-kt+\\ln[A]_0", "First order integrated"),
+    ("Integrated Rate Law - Second Order", "\\frac{1}{[A]}=kt+\\frac{1}{[A]_0}", "Second order integrated"),
+    ("Equilibrium Constant", "K=\\frac{[C]^c[D]^d}{[A]^a[B]^b}", "Equilibrium constant"),
+    ("Reaction Quotient", "Q=\\frac{[C]^c[D]^d}{[A]^a[B]^b}", "Reaction quotient"),
+    ("Le Chatelier's Principle", "System shifts to counteract change", "Le Chatelier's principle"),
+    ("Acid Dissociation Constant", "K_a=\\frac{[H^+][A^-]}{[HA]}", "Acid dissociation constant"),
+    ("Base Dissociation Constant", "K_b=\\frac{[OH^-][BH^+]}{[B]}", "Base dissociation constant"),
+    ("Water Ion Product", "K_w=[H^+][OH^-]=10^{-14}", "Water ion product"),
+    ("pKa", "pK_a=-\\log(K_a)", "pKa definition"),
+    ("Buffer Capacity", "\\beta=\\frac{dC_b}{dpH}", "Buffer capacity"),
+    ("Titration - Equivalence Point", "M_aV_a=M_bV_b", "Equivalence point"),
+    ("Redox - Nernst Equation", "E=E^0-\\frac{RT}{nF}\\ln(Q)", "Nernst equation"),
+    ("Standard Cell Potential", "E^0_{cell}=E^0_{cathode}-E^0_{anode}", "Standard cell potential"),
+    ("Faraday's Constant", "F=96485\\ C/mol", "Faraday's constant"),
+    ("Electrolysis", "m=\\frac{MIt}{nF}", "Mass deposited in electrolysis"),
+]
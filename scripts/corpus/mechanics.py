@@ -0,0 +1,137 @@
+"""Mechanics formulas"""
+
+PREFIX = "mech"
+CATEGORY = "Mechanics"
+
+# Mechanics Formulas (80+)
+DETAILED = [
+    {
+        "title": "Velocity",
+        "latex": "v=\\frac{d}{t}",
+        "description": "Average velocity formula",
+        "variables": [{"name": "d", "type": "double"}, {"name": "t", "type": "double"}],
+        "calculator": {"inputs": ["d", "t"], "output": "v"}
+    },
+    {
+        "title": "Acceleration",
+        "latex": "a=\\frac{v-u}{t}",
+        "description": "Acceleration formula",
+        "variables": [{"name": "v", "type": "double"}, {"name": "u", "type": "double"}, {"name": "t", "type": "double"}],
+        "calculator": {"inputs": ["v", "u", "t"], "output": "a"}
+    },
+    {
+        "title": "Force (Newton's Second Law)",
+        "latex": "F=ma",
+        "description": "Newton's second law of motion",
+        "variables": [{"name": "m", "type": "double"}, {"name": "a", "type": "double"}],
+        "calculator": {"inputs": ["m", "a"], "output": "F"}
+    },
+    {
+        "title": "Kinetic Energy",
+        "latex": "KE=\\frac{1}{2}mv^2",
+        "description": "Kinetic energy formula",
+        "variables": [{"name": "m", "type": "double"}, {"name": "v", "type": "double"}],
+        "calculator": {"inputs": ["m", "v"], "output": "KE"}
+    },
+    {
+        "title": "Potential Energy",
+        "latex": "PE=mgh",
+        "description": "Gravitational potential energy",
+        "variables": [{"name": "m", "type": "double"}, {"name": "g", "type": "double"}, {"name": "h", "type": "double"}],
+        "calculator": {"inputs": ["m", "g", "h"], "output": "PE"}
+    },
+    {
+        "title": "Momentum",
+        "latex": "p=mv",
+        "description": "Linear momentum formula",
+        "variables": [{"name": "m", "type": "double"}, {"name": "v", "type": "double"}],
+        "calculator": {"inputs": ["m", "v"], "output": "p"}
+    },
+    {
+        "title": "Work",
+        "latex": "W=Fd\\cos(\\theta)",
+        "description": "Work done by a force",
+        "variables": [{"name": "F", "type": "double"}, {"name": "d", "type": "double"}, {"name": "theta", "type": "double"}],
+        "calculator": {"inputs": ["F", "d", "theta"], "output": "W"}
+    },
+    {
+        "title": "Power",
+        "latex": "P=\\frac{W}{t}",
+        "description": "Power formula",
+        "variables": [{"name": "W", "type": "double"}, {"name": "t", "type": "double"}],
+        "calculator": {"inputs": ["W", "t"], "output": "P"}
+    },
+]
+
+# Add more mechanics formulas
+CORE = [
+    ("Newton's First Law", "\\sum F=0", "Object at rest stays at rest"),
+    ("Newton's Third Law", "F_{12}=-F_{21}", "Action-reaction pairs"),
+    ("Centripetal Force", "F_c=\\frac{mv^2}{r}", "Centripetal force"),
+    ("Centripetal Acceleration", "a_c=\\frac{v^2}{r}", "Centripetal acceleration"),
+    ("Torque", "\\tau=rF\\sin(\\theta)", "Torque formula"),
+    ("Angular Velocity", "\\omega=\\frac{\\theta}{t}", "Angular velocity"),
+    ("Angular Acceleration", "\\alpha=\\frac{\\Delta\\omega}{t}", "Angular acceleration"),
+    ("Rotational Kinetic Energy", "KE_{rot}=\\frac{1}{2}I\\omega^2", "Rotational kinetic energy"),
+    ("Moment of Inertia - Point Mass", "I=mr^2", "Moment of inertia for point mass"),
+    ("Conservation of Momentum", "m_1v_1+m_2v_2=m_1v_1'+m_2v_2'", "Conservation of linear momentum"),
+    ("Impulse", "J=F\\Delta t", "Impulse formula"),
+    ("Hooke's Law", "F=-kx", "Spring force"),
+    ("Simple Harmonic Motion", "x=A\\cos(\\omega t+\\phi)", "SHM displacement"),
+    ("Period of Pendulum", "T=2\\pi\\sqrt{\\frac{L}{g}}", "Period of simple pendulum"),
+    ("Escape Velocity", "v_e=\\sqrt{\\frac{2GM}{r}}", "Escape velocity from planet"),
+]
+
+# Additional Mechanics formulas (50+)
+ADDITIONAL = [
+    ("Uniform Motion", "s=ut+\\frac{1}{2}at^2", "Displacement with constant acceleration"),
+    ("Velocity-Time Relation", "v=u+at", "Final velocity formula"),
+    ("Velocity-Displacement", "v^2=u^2+2as", "Velocity squared formula"),
+    ("Average Velocity", "v_{avg}=\\frac{u+v}{2}", "Average velocity"),
+    ("Free Fall", "h=\\frac{1}{2}gt^2", "Height in free fall"),
+    ("Projectile Motion - Range", "R=\\frac{v^2\\sin(2\\theta)}{g}", "Range of projectile"),
+    ("Projectile Motion - Max Height", "H=\\frac{v^2\\sin^2(\\theta)}{2g}", "Maximum height of projectile"),
+    ("Projectile Motion - Time of Flight", "T=\\frac{2v\\sin(\\theta)}{g}", "Time of flight"),
+    ("Circular Motion - Period", "T=\\frac{2\\pi r}{v}", "Period of circular motion"),
+    ("Circular Motion - Frequency", "f=\\frac{1}{T}", "Frequency of circular motion"),
+    ("Banking Angle", "\\tan(\\theta)=\\frac{v^2}{rg}", "Banking angle for curves"),
+    ("Friction Force", "f=\\mu N", "Friction force"),
+    ("Static Friction", "f_s\\leq\\mu_s N", "Static friction"),
+    ("Kinetic Friction", "f_k=\\mu_k N", "Kinetic friction"),
+    ("Coefficient of Restitution", "e=\\frac{v_2-v_1}{u_1-u_2}", "Coefficient of restitution"),
+    ("Elastic Collision", "m_1u_1+m_2u_2=m_1v_1+m_2v_2", "Momentum conservation"),
+    ("Inelastic Collision", "m_1u_1+m_2u_2=(m_1+m_2)v", "Perfectly inelastic collision"),
+    ("Rocket Equation", "\\Delta v=v_e\\ln\\left(\\frac{m_0}{m_f}\\right)", "Tsiolkovsky rocket equation"),
+    ("Kepler's First Law", "Planets move in elliptical orbits", "Kepler's first law"),
+    ("Kepler's Second Law", "\\frac{dA}{dt}=\\frac{L}{2m}", "Equal areas in equal times"),
+    ("Kepler's Third Law", "T^2\\propto a^3", "Period squared proportional to semi-major axis cubed"),
+    ("Orbital Velocity", "v=\\sqrt{\\frac{GM}{r}}", "Orbital velocity"),
+    ("Escape Velocity (General)", "v_e=\\sqrt{\\frac{2GM}{r}}", "Escape velocity formula"),
+    ("Gravitational Potential Energy (General)", "U=-\\frac{GMm}{r}", "Gravitational potential energy"),
+    ("Gravitational Field", "g=\\frac{GM}{r^2}", "Gravitational field strength"),
+    ("Tidal Force", "F_{tidal}\\approx\\frac{2GMmr}{R^3}", "Tidal force approximation"),
+    ("Rigid Body Rotation", "\\tau=I\\alpha", "Torque and angular acceleration"),
+    ("Parallel Axis Theorem", "I=I_{cm}+md^2", "Moment of inertia parallel axis"),
+    ("Perpendicular Axis Theorem", "I_z=I_x+I_y", "Perpendicular axis theorem"),
+    ("Rolling Without Slipping", "v=r\\omega", "Condition for rolling"),
+    ("Rolling Kinetic Energy", "KE=\\frac{1}{2}mv^2+\\frac{1}{2}I\\omega^2", "Total kinetic energy of rolling"),
+    ("Precession", "\\Omega=\\frac{mgr}{I\\omega}", "Precession angular velocity"),
+    ("Elastic Potential Energy", "U=\\frac{1}{2}kx^2", "Spring potential energy"),
+    ("Damped Harmonic Motion", "x=Ae^{-\\gamma t}\\cos(\\omega t+\\phi)", "Damped oscillation"),
+    ("Natural Frequency", "\\omega_0=\\sqrt{\\frac{k}{m}}", "Natural frequency of oscillator"),
+    ("Damping Coefficient", "\\gamma=\\frac{b}{2m}", "Damping coefficient"),
+    ("Quality Factor", "Q=\\frac{\\omega_0}{\\gamma}", "Quality factor of oscillator"),
+    ("Resonance Frequency", "\\omega_r=\\sqrt{\\omega_0^2-\\gamma^2}", "Resonance frequency"),
+    ("Forced Oscillation", "x=\\frac{F_0/m}{\\sqrt{(\\omega_0^2-\\omega^2)^2+(\\gamma\\omega)^2}}\\cos(\\omega t-\\delta)", "Forced oscillation"),
+    ("Wave on String", "v=\\sqrt{\\frac{T}{\\mu}}", "Wave speed on string"),
+    ("Standing Wave", "f_n=\\frac{nv}{2L}", "Frequency of standing wave"),
+    ("Beat Frequency", "f_{beat}=|f_1-f_2|", "Beat frequency"),
+    ("Doppler Effect (Sound)", "f'=f\\frac{v\\pm v_o}{v\\mp v_s}", "Doppler effect for sound"),
+    ("Mach Number", "M=\\frac{v}{v_s}", "Mach number"),
+    ("Shock Wave Angle", "\\sin(\\theta)=\\frac{v_s}{v}", "Shock wave angle"),
+    ("Bernoulli's Principle", "P+\\frac{1}{2}\\rho v^2+\\rho gh=constant", "Bernoulli's equation"),
+    ("Continuity Equation", "A_1v_1=A_2v_2", "Continuity equation for fluids"),
+    ("Poiseuille's Law", "Q=\\frac{\\pi r^4\\Delta P}{8\\eta L}", "Flow rate in pipe"),
+    ("Stokes' Law", "F=6\\pi\\eta rv", "Drag force on sphere"),
+    ("Reynolds Number", "Re=\\frac{\\rho vL}{\\eta}", "Reynolds number"),
+]
@@ -0,0 +1,43 @@
+"""Statistics formulas"""
+
+PREFIX = "stat"
+CATEGORY = "Statistics"
+
+DETAILED = []
+
+# Statistics Formulas (30+)
+CORE = [
+    ("Mean", "\\bar{x}=\\frac{1}{n}\\sum_{i=1}^{n}x_i", "Arithmetic mean"),
+    ("Variance", "\\sigma^2=\\frac{1}{n}\\sum_{i=1}^{n}(x_i-\\bar{x})^2", "Population variance"),
+    ("Standard Deviation", "\\sigma=\\sqrt{\\frac{1}{n}\\sum_{i=1}^{n}(x_i-\\bar{x})^2}", "Population standard deviation"),
+    ("Z-Score", "z=\\frac{x-\\mu}{\\sigma}", "Standard score"),
+    ("Correlation Coefficient", "r=\\frac{\\sum(x_i-\\bar{x})(y_i-\\bar{y})}{\\sqrt{\\sum(x_i-\\bar{x})^2\\sum(y_i-\\bar{y})^2}}", "Pearson correlation"),
+    ("Binomial Probability", "P(X=k)=\\binom{n}{k}p^k(1-p)^{n-k}", "Binomial distribution"),
+    ("Normal Distribution", "f(x)=\\frac{1}{\\sigma\\sqrt{2\\pi}}e^{-\\frac{(x-\\mu)^2}{2\\sigma^2}}", "Normal probability density"),
+]
+
+# Additional Statistics formulas (20+)
+ADDITIONAL = [
+    ("Sample Mean", "\\bar{x}=\\frac{1}{n}\\sum_{i=1}^{n}x_i", "Sample mean"),
+    ("Sample Variance", "s^2=\\frac{1}{n-1}\\sum_{i=1}^{n}(x_i-\\bar{x})^2", "Sample variance"),
+    ("Sample Standard Deviation", "s=\\sqrt{\\frac{1}{n-1}\\sum_{i=1}^{n}(x_i-\\bar{x})^2}", "Sample standard deviation"),
+    ("Standard Error", "SE=\\frac{\\sigma}{\\sqrt{n}}", "Standard error of mean"),
+    ("Confidence Interval", "\\bar{x}\\pm z\\frac{\\sigma}{\\sqrt{n}}", "Confidence interval"),
+    ("T-Statistic", "t=\\frac{\\bar{x}-\\mu}{s/\\sqrt{n}}", "T-statistic"),
+    ("Chi-Square Statistic", "\\chi^2=\\sum\\frac{(O-E)^2}{E}", "Chi-square statistic"),
+    ("F-Statistic", "F=\\frac{s_1^2}{s_2^2}", "F-statistic"),
+    ("Regression Line", "y=a+bx", "Linear regression"),
+    ("Slope of Regression", "b=\\frac{\\sum(x_i-\\bar{x})(y_i-\\bar{y})}{\\sum(x_i-\\bar{x})^2}", "Regression slope"),
+    ("Y-Intercept", "a=\\bar{y}-b\\bar{x}", "Y-intercept"),
+    ("Coefficient of Determination", "R^2=1-\\frac{SS_{res}}{SS_{tot}}", "R-squared"),
+    ("Poisson Distribution", "P(X=k)=\\frac{\\lambda^ke^{-\\lambda}}{k!}", "Poisson distribution"),
+    ("Exponential Distribution", "f(x)=\\lambda e^{-\\lambda x}", "Exponential distribution"),
+    ("Gamma Distribution", "f(x)=\\frac{\\lambda^r x^{r-1}e^{-\\lambda x}}{\\Gamma(r)}", "Gamma distribution"),
+    ("Beta Distribution", "f(x)=\\frac{x^{\\alpha-1}(1-x)^{\\beta-1}}{B(\\alpha,\\beta)}", "Beta distribution"),
+    ("Central Limit Theorem", "\\bar{X}\\sim N(\\mu,\\frac{\\sigma^2}{n})", "Central limit theorem"),
+    ("Law of Large Numbers", "\\lim_{n\\to\\infty}\\bar{X}_n=\\mu", "Law of large numbers"),
+    ("Bayes' Theorem", "P(A|B)=\\frac{P(B|A)P(A)}{P(B)}", "Bayes' theorem"),
+    ("Conditional Probability", "P(A|B)=\\frac{P(A\\cap B)}{P(B)}", "Conditional probability"),
+    ("Independent Events", "P(A\\cap B)=P(A)P(B)", "Independent events"),
+    ("Mutually Exclusive", "P(A\\cup B)=P(A)+P(B)", "Mutually exclusive events"),
+]
@@ -0,0 +1,64 @@
+"""Thermodynamics formulas"""
+
+PREFIX = "thermo"
+CATEGORY = "Thermodynamics"
+
+DETAILED = []
+
+# Thermodynamics Formulas (50+)
+CORE = [
+    ("Ideal Gas Law", "PV=nRT", "Ideal gas equation"),
+    ("First Law of Thermodynamics", "\\Delta U=Q-W", "Conservation of energy"),
+    ("Efficiency", "\\eta=\\frac{W_{out}}{Q_{in}}", "Thermal efficiency"),
+    ("Carnot Efficiency", "\\eta=1-\\frac{T_c}{T_h}", "Maximum possible efficiency"),
+    ("Heat Transfer - Conduction", "Q=\\frac{kA\\Delta T}{d}", "Conductive heat transfer"),
+    ("Specific Heat", "Q=mc\\Delta T", "Heat capacity formula"),
+    ("Latent Heat", "Q=mL", "Latent heat formula"),
+    ("Entropy Change", "\\Delta S=\\frac{Q}{T}", "Entropy change"),
+    ("RMS Speed", "v_{rms}=\\sqrt{\\frac{3RT}{M}}", "Root mean square speed"),
+    ("Average Kinetic Energy", "KE_{avg}=\\frac{3}{2}kT", "Average kinetic energy of gas"),
+]
+
+# Additional Thermodynamics formulas (40+)
+ADDITIONAL = [
+    ("Boyle's Law", "P_1V_1=P_2V_2", "Pressure-volume relationship"),
+    ("Charles's Law", "\\frac{V_1}{T_1}=\\frac{V_2}{T_2}", "Volume-temperature relationship"),
+    ("Gay-Lussac's Law", "\\frac{P_1}{T_1}=\\frac{P_2}{T_2}", "Pressure-temperature relationship"),
+    ("Combined Gas Law", "\\frac{P_1V_1}{T_1}=\\frac{P_2V_2}{T_2}", "Combined gas law"),
+    ("Avogadro's Law", "\\frac{V_1}{n_1}=\\frac{V_2}{n_2}", "Volume-mole relationship"),
+    ("Van der Waals Equation", "\\left(P+\\frac{an^2}{V^2}\\right)(V-nb)=nRT", "Van der Waals equation"),
+    ("Maxwell-Boltzmann Distribution", "f(v)=4\\pi n\\left(\\frac{m}{2\\pi kT}\\right)^{3/2}v^2e^{-mv^2/2kT}", "Speed distribution"),
+    ("Most Probable Speed", "v_{mp}=\\sqrt{\\frac{2kT}{m}}", "Most probable speed"),
+    ("Average Speed", "\\bar{v}=\\sqrt{\\frac{8kT}{\\pi m}}", "Average speed"),
+    ("RMS Speed", "v_{rms}=\\sqrt{\\frac{3kT}{m}}", "Root mean square speed"),
+    ("Mean Free Path", "\\lambda=\\frac{1}{\\sqrt{2}\\pi d^2n}", "Mean free path"),
+    ("Collision Frequency", "Z=\\sqrt{2}\\pi d^2\\bar{v}n", "Collision frequency"),
+    ("Heat Capacity", "C=\\frac{Q}{\\Delta T}", "Heat capacity"),
+    ("Specific Heat Capacity", "c=\\frac{Q}{m\\Delta T}", "Specific heat capacity"),
+    ("Molar Heat Capacity", "C_m=\\frac{Q}{n\\Delta T}", "Molar heat capacity"),
+    ("Latent Heat of Fusion", "Q=mL_f", "Latent heat of fusion"),
+    ("Latent Heat of Vaporization", "Q=mL_v", "Latent heat of vaporization"),
+    ("Heat of Combustion", "\\Delta H_{comb}", "Heat of combustion"),
+    ("Enthalpy", "H=U+PV", "Enthalpy definition"),
+    ("Enthalpy Change", "\\Delta H=\\Delta U+P\\Delta V", "Enthalpy change"),
+    ("Hess's Law", "\\Delta H_{total}=\\sum\\Delta H_i", "Hess's law"),
+    ("Bond Energy", "\\Delta H=\\sum BE_{reactants}-\\sum BE_{products}", "Bond energy calculation"),
+    ("Entropy", "\\Delta S=\\int\\frac{dQ_{rev}}{T}", "Entropy definition"),
+    ("Entropy Change - Isothermal", "\\Delta S=\\frac{Q}{T}", "Entropy change isothermal"),
+    ("Entropy Change - Adiabatic", "\\Delta S=0", "Entropy change adiabatic"),
+    ("Entropy Change - Ideal Gas", "\\Delta S=nR\\ln\\left(\\frac{V_2}{V_1}\\right)", "Entropy change ideal gas"),
+    ("Gibbs Free Energy", "G=H-TS", "Gibbs free energy"),
+    ("Gibbs Free Energy Change", "\\Delta G=\\Delta H-T\\Delta S", "Gibbs free energy change"),
+    ("Spontaneity", "\\Delta G<0 implies spontaneous", "Spontaneity criterion"),
+    ("Clausius-Clapeyron Equation", "\\ln\\left(\\frac{P_2}{P_1}\\right)=\\frac{\\Delta H_{vap}}{R}\\left(\\frac{1}{T_1}-\\frac{1}{T_2}\\right)", "Vapor pressure"),
+    ("Heat Engine Efficiency", "\\eta=\\frac{W}{Q_h}=1-\\frac{Q_c}{Q_h}", "Heat engine efficiency"),
+    ("Carnot Efficiency", "\\eta=1-\\frac{T_c}{T_h}", "Carnot efficiency"),
+    ("Coefficient of Performance", "COP=\\frac{Q_c}{W}", "Refrigerator COP"),
+    ("Heat Pump COP", "COP_{HP}=\\frac{Q_h}{W}", "Heat pump coefficient"),
+    ("Otto Cycle Efficiency", "\\eta=1-\\frac{1}{r^{\\gamma-1}}", "Otto cycle efficiency"),
+    ("Diesel Cycle Efficiency", "\\eta=1-\\frac{1}{r^{\\gamma-1}}\\frac{\\rho^{\\gamma}-1}{\\gamma(\\rho-1)}", "Diesel cycle"),
+    ("Brayton Cycle", "\\eta=1-\\frac{1}{r_p^{(\\gamma-1)/\\gamma}}", "Brayton cycle efficiency"),
+    ("Stefan-Boltzmann Law", "P=\\sigma AT^4", "Radiated power"),
+    ("Wien's Displacement Law", "\\lambda_{max}T=b", "Wien's law"),
+    ("Planck's Law", "B(\\lambda,T)=\\frac{2hc^2}{\\lambda^5}\\frac{1}{e^{hc/\\lambda kT}-1}", "Blackbody radiation"),
+]
@@ -0,0 +1,56 @@
+"""Trigonometry formulas"""
+
+PREFIX = "trig"
+CATEGORY = "Trigonometry"
+
+DETAILED = []
+
+# Trigonometry Formulas (60+)
+CORE = [
+    ("Sine", "\\sin(\\theta)=\\frac{opposite}{hypotenuse}", "Sine function definition"),
+    ("Cosine", "\\cos(\\theta)=\\frac{adjacent}{hypotenuse}", "Cosine function definition"),
+    ("Tangent", "\\tan(\\theta)=\\frac{opposite}{adjacent}", "Tangent function definition"),
+    ("Pythagorean Identity", "\\sin^2(\\theta)+\\cos^2(\\theta)=1", "Fundamental trigonometric identity"),
+    ("Sum of Angles - Sine", "\\sin(A+B)=\\sin(A)\\cos(B)+\\cos(A)\\sin(B)", "Sine of sum of angles"),
+    ("Sum of Angles - Cosine", "\\cos(A+B)=\\cos(A)\\cos(B)-\\sin(A)\\sin(B)", "Cosine of sum of angles"),
+    ("Double Angle - Sine", "\\sin(2\\theta)=2\\sin(\\theta)\\cos(\\theta)", "Sine of double angle"),
+    ("Double Angle - Cosine", "\\cos(2\\theta)=\\cos^2(\\theta)-\\sin^2(\\theta)", "Cosine of double angle"),
+    ("Half Angle - Sine", "\\sin\\left(\\frac{\\theta}{2}\\right)=\\pm\\sqrt{\\frac{1-\\cos(\\theta)}{2}}", "Sine of half angle"),
+    ("Half Angle - Cosine", "\\cos\\left(\\frac{\\theta}{2}\\right)=\\pm\\sqrt{\\frac{1+\\cos(\\theta)}{2}}", "Cosine of half angle"),
+    ("Product to Sum - Sine", "\\sin(A)\\sin(B)=\\frac{1}{2}[\\cos(A-B)-\\cos(A+B)]", "Product to sum for sine"),
+    ("Product to Sum - Cosine", "\\cos(A)\\cos(B)=\\frac{1}{2}[\\cos(A-B)+\\cos(A+B)]", "Product to sum for cosine"),
+]
+
+# Additional Trigonometry formulas (60+)
+ADDITIONAL = [
+    ("Cosecant", "\\csc(\\theta)=\\frac{1}{\\sin(\\theta)}", "Cosecant function"),
+    ("Secant", "\\sec(\\theta)=\\frac{1}{\\cos(\\theta)}", "Secant function"),
+    ("Cotangent", "\\cot(\\theta)=\\frac{1}{\\tan(\\theta)}", "Cotangent function"),
+    ("Inverse Sine", "\\arcsin(x)", "Inverse sine function"),
+    ("Inverse Cosine", "\\arccos(x)", "Inverse cosine function"),
+    ("Inverse Tangent", "\\arctan(x)", "Inverse tangent function"),
+    ("Sum to Product - Sine", "\\sin(A)+\\sin(B)=2\\sin\\left(\\frac{A+B}{2}\\right)\\cos\\left(\\frac{A-B}{2}\\right)", "Sum to product for sine"),
+    ("Sum to Product - Cosine", "\\cos(A)+\\cos(B)=2\\cos\\left(\\frac{A+B}{2}\\right)\\cos\\left(\\frac{A-B}{2}\\right)", "Sum to product for cosine"),
+    ("Difference to Product - Sine", "\\sin(A)-\\sin(B)=2\\cos\\left(\\frac{A+B}{2}\\right)\\sin\\left(\\frac{A-B}{2}\\right)", "Difference to product"),
+    ("Difference to Product - Cosine", "\\cos(A)-\\cos(B)=-2\\sin\\left(\\frac{A+B}{2}\\right)\\sin\\left(\\frac{A-B}{2}\\right)", "Difference to product"),
+    ("Tangent Sum", "\\tan(A+B)=\\frac{\\tan(A)+\\tan(B)}{1-\\tan(A)\\tan(B)}", "Tangent of sum"),
+    ("Tangent Difference", "\\tan(A-B)=\\frac{\\tan(A)-\\tan(B)}{1+\\tan(A)\\tan(B)}", "Tangent of difference"),
+    ("Tangent Double Angle", "\\tan(2\\theta)=\\frac{2\\tan(\\theta)}{1-\\tan^2(\\theta)}", "Tangent of double angle"),
+    ("Power Reduction - Sine", "\\sin^2(\\theta)=\\frac{1-\\cos(2\\theta)}{2}", "Power reduction for sine"),
+    ("Power Reduction - Cosine", "\\cos^2(\\theta)=\\frac{1+\\cos(2\\theta)}{2}", "Power reduction for cosine"),
+    ("Triple Angle - Sine", "\\sin(3\\theta)=3\\sin(\\theta)-4\\sin^3(\\theta)", "Sine of triple angle"),
+    ("Triple Angle - Cosine", "\\cos(3\\theta)=4\\cos^3(\\theta)-3\\cos(\\theta)", "Cosine of triple angle"),
+    ("Sine Law Alternative", "\\frac{a}{\\sin(A)}=\\frac{b}{\\sin(B)}=\\frac{c}{\\sin(C)}=2R", "Extended sine law"),
+    ("Cosine Law Alternative", "a^2=b^2+c^2-2bc\\cos(A)", "Alternative form of cosine law"),
+    ("Area using Trig", "A=\\frac{1}{2}ab\\sin(C)", "Area of triangle using trigonometry"),
+    ("Mollweide's Formula", "\\frac{a+b}{c}=\\frac{\\cos\\left(\\frac{A-B}{2}\\right)}{\\sin\\left(\\frac{C}{2}\\right)}", "Mollweide's formula"),
+    ("Napier's Analogies", "\\tan\\left(\\frac{A-B}{2}\\right)=\\frac{a-b}{a+b}\\cot\\left(\\frac{C}{2}\\right)", "Napier's analogies"),
+    ("Spherical Law of Cosines", "\\cos(a)=\\cos(b)\\cos(c)+\\sin(b)\\sin(c)\\cos(A)", "Spherical triangle"),
+    ("Spherical Law of Sines", "\\frac{\\sin(a)}{\\sin(A)}=\\frac{\\sin(b)}{\\sin(B)}=\\frac{\\sin(c)}{\\sin(C)}", "Spherical law of sines"),
+    ("Hyperbolic Sine", "\\sinh(x)=\\frac{e^x-e^{-x}}{2}", "Hyperbolic sine"),
+    ("Hyperbolic Cosine", "\\cosh(x)=\\frac{e^x+e^{-x}}{2}", "Hyperbolic cosine"),
+    ("Hyperbolic Tangent", "\\tanh(x)=\\frac{\\sinh(x)}{\\cosh(x)}", "Hyperbolic tangent"),
+    ("Inverse Hyperbolic Sine", "\\sinh^{-1}(x)=\\ln(x+\\sqrt{x^2+1})", "Inverse hyperbolic sine"),
+    ("Inverse Hyperbolic Cosine", "\\cosh^{-1}(x)=\\ln(x+\\sqrt{x^2-1})", "Inverse hyperbolic cosine"),
+    ("Inverse Hyperbolic Tangent", "\\tanh^{-1}(x)=\\frac{1}{2}\\ln\\left(\\frac{1+x}{1-x}\\right)", "Inverse hyperbolic tangent"),
+]
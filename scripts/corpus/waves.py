@@ -0,0 +1,57 @@
+"""Waves formulas"""
+
+PREFIX = "wave"
+CATEGORY = "Waves"
+
+DETAILED = []
+
+# Waves & Optics Formulas (60+)
+CORE = [
+    ("Wave Speed", "v=f\\lambda", "Wave speed formula"),
+    ("Wave Equation", "y(x,t)=A\\sin(kx-\\omega t+\\phi)", "General wave equation"),
+    ("Frequency", "f=\\frac{1}{T}", "Frequency from period"),
+    ("Angular Frequency", "\\omega=2\\pi f", "Angular frequency"),
+    ("Wave Number", "k=\\frac{2\\pi}{\\lambda}", "Wave number"),
+    ("Doppler Effect", "f'=f\\frac{v\\pm v_o}{v\\mp v_s}", "Doppler effect formula"),
+    ("Snell's Law", "n_1\\sin(\\theta_1)=n_2\\sin(\\theta_2)", "Refraction law"),
+    ("Critical Angle", "\\sin(\\theta_c)=\\frac{n_2}{n_1}", "Total internal reflection"),
+    ("Lens Equation", "\\frac{1}{f}=\\frac{1}{d_o}+\\frac{1}{d_i}", "Thin lens equation"),
+    ("Magnification", "m=-\\frac{d_i}{d_o}", "Magnification formula"),
+    ("Mirror Equation", "\\frac{1}{f}=\\frac{1}{d_o}+\\frac{1}{d_i}", "Spherical mirror equation"),
+    ("Double Slit Interference", "d\\sin(\\theta)=m\\lambda", "Constructive interference"),
+    ("Single Slit Diffraction", "a\\sin(\\theta)=m\\lambda", "Diffraction pattern"),
+]
+
+# Additional Waves formulas (30+)
+ADDITIONAL = [
+    ("Standing Wave - String", "\\lambda_n=\\frac{2L}{n}", "Wavelength of standing wave"),
+    ("Beat Frequency", "f_{beat}=|f_1-f_2|", "Beat frequency"),
+    ("Intensity", "I=\\frac{P}{A}", "Wave intensity"),
+    ("Intensity Level", "\\beta=10\\log\\left(\\frac{I}{I_0}\\right)", "Sound intensity level in dB"),
+    ("Doppler Effect - Light", "f'=f\\sqrt{\\frac{1+v/c}{1-v/c}}", "Relativistic Doppler effect"),
+    ("Bragg's Law", "n\\lambda=2d\\sin(\\theta)", "X-ray diffraction"),
+    ("Diffraction Grating", "d\\sin(\\theta)=m\\lambda", "Diffraction grating equation"),
+    ("Resolving Power", "R=\\frac{\\lambda}{\\Delta\\lambda}", "Resolving power"),
+    ("Rayleigh Criterion", "\\theta=1.22\\frac{\\lambda}{D}", "Angular resolution"),
+    ("Thin Film Interference", "2nt=m\\lambda", "Constructive interference"),
+    ("Brewster's Angle", "\\tan(\\theta_B)=\\frac{n_2}{n_1}", "Brewster's angle"),
+    ("Malus's Law", "I=I_0\\cos^2(\\theta)", "Polarized light intensity"),
+    ("Refractive Index", "n=\\frac{c}{v}", "Refractive index"),
+    ("Critical Angle", "\\sin(\\theta_c)=\\frac{n_2}{n_1}", "Total internal reflection"),
+    ("Lensmaker's Equation", "\\frac{1}{f}=(n-1)\\left(\\frac{1}{R_1}-\\frac{1}{R_2}\\right)", "Lensmaker's equation"),
+    ("Angular Magnification", "M=\\frac{\\theta'}{\\theta}", "Angular magnification"),
+    ("Numerical Aperture", "NA=n\\sin(\\theta)", "Numerical aperture"),
+    ("Fresnel Equations", "r=\\frac{n_1-n_2}{n_1+n_2}", "Reflection coefficient"),
+    ("Group Velocity", "v_g=\\frac{d\\omega}{dk}", "Group velocity"),
+    ("Phase Velocity", "v_p=\\frac{\\omega}{k}", "Phase velocity"),
+    ("Dispersion Relation", "\\omega(k)", "Dispersion relation"),
+    ("Wave Packet", "\\Delta x\\Delta k\\geq\\frac{1}{2}", "Wave packet uncertainty"),
+    ("Coherence Length", "l_c=\\frac{c}{\\Delta\\nu}", "Coherence length"),
+    ("Coherence Time", "\\tau_c=\\frac{1}{\\Delta\\nu}", "Coherence time"),
+    ("Huygens' Principle", "Every point on wavefront is source of spherical waves", "Huygens' principle"),
+    ("Fermat's Principle", "Light takes path of least time", "Fermat's principle"),
+    ("Optical Path Length", "OPL=\\int n(s)ds", "Optical path length"),
+    ("Abbe Number", "V=\\frac{n_D-1}{n_F-n_C}", "Abbe number for dispersion"),
+    ("Chromatic Aberration", "\\Delta f=\\frac{f}{V}", "Chromatic aberration"),
+    ("Spherical Aberration", "SA=\\frac{h^4}{8f^3}", "Spherical aberration"),
+]
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""Delta patches between two generated formula corpora
+
+    python3 scripts/corpus_patch.py diff old/formulas.json assets/formulas.json -o update.patch.json
+    python3 scripts/corpus_patch.py apply old/formulas.json update.patch.json -o formulas.json
+
+A patch records, by id, the removed ids, the added records and, for
+modified records, only the top-level fields that changed. Added records
+carry the id they follow in the new corpus; if surviving records were
+reordered the full id order is included instead. A changed "aliases" map
+(see dedupe) is carried whole. baseHash and targetHash are corpus hashes
+over records and aliases (see snapshot_cache.corpus_hash); apply refuses a
+base that does not match and verifies the rebuilt corpus against
+targetHash. Corpora with other top-level fields are refused, since a patch
+could not rebuild them.
+"""
+
+import argparse
+import json
+import sys
+
+from assetdoc import check_format, dumps
+from fileio import write_if_changed, write_stream_if_changed
+from pipeline import iter_document, serialize
+from records import FormulaRecord, Records
+from snapshot_cache import corpus_hash
+
+FORMAT = "formulas.patch"
+VERSION = 2
+DOCUMENT_KEYS = ("formulas", "aliases")
+
+
+def _records(items, aliases=None):
+    return Records((FormulaRecord.from_dict(item) for item in items), aliases)
+
+
+def _load(path):
+    """(record dicts, aliases) of a formulas.json document"""
+    with open(path, "r", encoding="utf-8") as f:
+        doc = json.load(f)
+    unknown = [key for key in doc if key not in DOCUMENT_KEYS]
+    if unknown:
+        raise ValueError(f"{path}: patches cannot carry field(s) {', '.join(unknown)}")
+    return doc["formulas"], doc.get("aliases", {})
+
+
+def diff(old, new, old_aliases=None, new_aliases=None):
+    """Return the patch turning record dicts old (and aliases) into new"""
+    old_aliases = old_aliases or {}
+    new_aliases = new_aliases or {}
+    old_by_id = {item["id"]: item for item in old}
+    new_by_id = {item["id"]: item for item in new}
+
+    removed = [item["id"] for item in old if item["id"] not in new_by_id]
+    modified = {}
+    for item in new:
+        before = old_by_id.get(item["id"])
+        if before is None:
+            continue
+        changes = {key: value for key, value in item.items() if before.get(key) != value}
+        dropped = [key for key in before if key not in item]
+        if dropped:
+            raise ValueError(f"{item['id']}: fields removed ({', '.join(dropped)})")
+        if changes:
+            modified[item["id"]] = changes
+
+    added = []
+    previous = None
+    for item in new:
+        if item["id"] not in old_by_id:
+            added.append({"after": previous, "record": item})
+        previous = item["id"]
+
+    patch = {
+        "format": FORMAT,
+        "version": VERSION,
+        "baseHash": corpus_hash(_records(old, old_aliases)),
+        "targetHash": corpus_hash(_records(new, new_aliases)),
+        "removed": removed,
+        "added": added,
+        "modified": modified,
+    }
+    surviving_old = [item["id"] for item in old if item["id"] in new_by_id]
+    surviving_new = [item["id"] for item in new if item["id"] in old_by_id]
+    if surviving_old != surviving_new:
+        patch["order"] = [item["id"] for item in new]
+    if old_aliases != new_aliases:
+        patch["aliases"] = new_aliases
+    return patch
+
+
+def apply(old, patch, old_aliases=None):
+    """Rebuild (record dicts, aliases) from old and a patch, verifying both hashes"""
+    old_aliases = old_aliases or {}
+    check_format(patch, FORMAT, VERSION, "patch")
+    if corpus_hash(_records(old, old_aliases)) != patch["baseHash"]:
+        raise ValueError("Patch does not apply: base corpus hash mismatch")
+
+    removed = set(patch["removed"])
+    by_id = {}
+    surviving = []
+    for item in old:
+        if item["id"] in removed:
+            continue
+        changes = patch["modified"].get(item["id"])
+        by_id[item["id"]] = {**item, **changes} if changes else item
+        surviving.append(item["id"])
+
+    following = {}
+    for addition in patch["added"]:
+        record = addition["record"]
+        by_id[record["id"]] = record
+        following.setdefault(addition["after"], []).append(record["id"])
+
+    order = []
+
+    def place_after(anchor):
+        stack = following.get(anchor, [])[::-1]
+        while stack:
+            record_id = stack.pop()
+            order.append(record_id)
+            stack.extend(following.get(record_id, [])[::-1])
+
+    place_after(None)
+    for record_id in surviving:
+        order.append(record_id)
+        place_after(record_id)
+
+    if "order" in patch:
+        order = patch["order"]
+    new = [by_id[record_id] for record_id in order]
+    aliases = patch.get("aliases", old_aliases)
+    if corpus_hash(_records(new, aliases)) != patch["targetHash"]:
+        raise ValueError("Patched corpus does not match the target hash")
+    return new, aliases
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    diff_parser = commands.add_parser("diff", help="write the patch from OLD to NEW")
+    diff_parser.add_argument("old")
+    diff_parser.add_argument("new")
+    diff_parser.add_argument("-o", "--output", required=True)
+    apply_parser = commands.add_parser("apply", help="rebuild a corpus from OLD and PATCH")
+    apply_parser.add_argument("old")
+    apply_parser.add_argument("patch")
+    apply_parser.add_argument("-o", "--output", required=True)
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == "diff":
+            old, old_aliases = _load(args.old)
+            new, new_aliases = _load(args.new)
+            patch = diff(old, new, old_aliases, new_aliases)
+            data = dumps(patch).encode("utf-8")
+            write_if_changed(args.output, data)
+            print(
+                f"{len(patch['added'])} added, {len(patch['removed'])} removed, "
+                f"{len(patch['modified'])} modified; patch is {len(data):,} B"
+            )
+        else:
+            with open(args.patch, "r", encoding="utf-8") as f:
+                patch = json.load(f)
+            old, old_aliases = _load(args.old)
+            new, aliases = apply(old, patch, old_aliases)
+            write_stream_if_changed(args.output, iter_document(serialize(_records(new)), aliases))
+            print(f"Rebuilt {len(new)} formulas into {args.output} (hash verified)")
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""Duplicate detection by canonical LaTeX and title hashing
+
+canonical_latex() rewrites a formula into a form that ignores notation-only
+differences:
+
+    - whitespace and \\left / \\right (and \\big-style sizing) are dropped
+    - a script group holding one token loses its braces: x^{2} == x^2,
+      but x^{10} != x^10, which KaTeX reads as x^{1}0
+    - runs of plain factors (letters, numbers, Greek letters) are sorted,
+      except a last factor that carries a script or argument:
+      2\\pi r == r2\\pi, and in mc^2 only m moves
+    - terms of a top-level sum without subtraction are sorted: a+b == b+a
+    - the two sides of a single "=" are sorted: a=b == b=a
+
+Formulas are grouped by hash, never compared pairwise:
+
+    exact duplicate   same category, title and canonical LaTeX. The build
+                      keeps the first in build order and emits an alias
+                      from the later id to it (the "aliases" map in
+                      formulas.json), so saved ids keep resolving.
+    same formula      same canonical LaTeX under another title or
+                      category; reported only (Mean / Sample Mean)
+    same title        same title, different LaTeX; reported only
+                      (Euler's Formula for polyhedra and for e^{i theta})
+
+Run this script for the report:
+
+    python3 scripts/dedupe.py
+"""
+
+import argparse
+import hashlib
+import re
+
+import latex
+
+SIZING_COMMANDS = frozenset((
+    "\\left", "\\right", "\\big", "\\Big", "\\bigg", "\\Bigg",
+    "\\bigl", "\\bigr", "\\Bigl", "\\Bigr",
+))
+_TITLE_WORD = re.compile(r"[^\W_]+")
+
+
+def _tokens(source):
+    tokens = []
+    for kind, text, _ in latex.tokenize(source):
+        if kind == "space" or text in SIZING_COMMANDS:
+            continue
+        if kind == "number" and tokens and tokens[-1] in ("^", "_"):
+            # A script takes one digit: x^10 is x^{1}0, not x^{10}.
+            tokens.append(text[0])
+            tokens.extend(rest for _, rest, _ in latex.tokenize(text[1:]))
+            continue
+        tokens.append(text)
+    return tokens
+
+
+def _unwrap_scripts(tokens):
+    """Drop the braces of one-token superscripts and subscripts
+
+    Command arguments keep theirs: \\frac{a}{b}c must not read as \\frac a bc,
+    and so do numbers of more than one digit: x^{10} is not x^10.
+    """
+    out = []
+    i = 0
+    while i < len(tokens):
+        if (
+            tokens[i] == "{" and out and out[-1] in ("^", "_")
+            and i + 2 < len(tokens) and tokens[i + 2] == "}" and tokens[i + 1] not in "{}"
+            and not (tokens[i + 1][0].isdigit() and len(tokens[i + 1]) > 1)
+        ):
+            out.append(tokens[i + 1])
+            i += 3
+        else:
+            out.append(tokens[i])
+            i += 1
+    return out
+
+
+def _is_factor(token):
+    return (
+        token.isdigit()
+        or (len(token) == 1 and token.isalpha())
+        or (token.startswith("\\") and latex.is_greek(token))
+    )
+
+
+def _sort_factors(tokens):
+    """Sort runs of plain factors not followed by a script, group or bracket"""
+    out = []
+    run = []
+
+    def flush(next_token):
+        # The last factor of a run binds to a following ^, _ or (, so it stays put.
+        if next_token in ("^", "_", "(", "{", "["):
+            tail = run[-1:] if run else []
+            out.extend(sorted(run[:-1]) + tail)
+        else:
+            out.extend(sorted(run))
+        run.clear()
+
+    # Script and \text groups (v_{rms}, e^{rt}) are left exactly as written.
+    groups = []
+    for i, token in enumerate(tokens):
+        previous = tokens[i - 1] if i else ""
+        # A factor right after a command (\frac, \sqrt, \sin) or a script
+        # marker is that command's argument, not part of a product.
+        bound = previous in ("^", "_") or (previous.startswith("\\") and not latex.is_greek(previous))
+        if _is_factor(token) and not bound and "verbatim" not in groups:
+            run.append(token)
+            continue
+        flush(token)
+        out.append(token)
+        if token == "{":
+            groups.append("verbatim" if previous in ("^", "_") or previous == "\\text" else "math")
+        elif token == "}" and groups:
+            groups.pop()
+    flush("")
+    return out
+
+
+def _split_top_level(tokens, separators):
+    """Split on separator tokens outside any brace, parenthesis or bracket"""
+    parts = [[]]
+    depth = 0
+    for token in tokens:
+        if token in ("{", "(", "["):
+            depth += 1
+        elif token in ("}", ")", "]"):
+            depth -= 1
+        if depth == 0 and token in separators:
+            parts.append([])
+        else:
+            parts[-1].append(token)
+    return parts
+
+
+def _canonical_side(tokens):
+    if any(token in ("-", "\\pm", "\\mp") for token in tokens):
+        return tokens
+    terms = _split_top_level(tokens, ("+",))
+    if len(terms) < 2 or not all(terms):
+        return tokens
+    ordered = sorted(" ".join(term) for term in terms)
+    return " + ".join(ordered).split(" ")
+
+
+def canonical_latex(source):
+    """A whitespace-separated canonical form of a LaTeX formula"""
+    tokens = _sort_factors(_unwrap_scripts(_tokens(source)))
+    sides = _split_top_level(tokens, ("=",))
+    sides = [" ".join(_canonical_side(side)) for side in sides]
+    if len(sides) == 2:
+        sides.sort()
+    return " = ".join(sides)
+
+
+def title_key(title):
+    return " ".join(_TITLE_WORD.findall(title.casefold()))
+
+
+def _digest(*parts):
+    return hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def latex_hash(source):
+    return _digest(canonical_latex(source))
+
+
+def duplicate_key(category, title, source):
+    return _digest(category, title_key(title), canonical_latex(source))
+
+
+class Deduper:
+    """Streaming exact-duplicate filter; aliases maps dropped ids to kept ones
+
+    Records must arrive in build order. The dict of seen keys grows with the
+    corpus, like validate()'s set of ids.
+    """
+
+    def __init__(self):
+        self.first = {}
+        self.aliases = {}
+
+    def check(self, record_id, category, title, source):
+        """Return the id this record duplicates (recording an alias), else None"""
+        key = duplicate_key(category, title, source)
+        kept = self.first.setdefault(key, record_id)
+        if kept == record_id:
+            return None
+        self.aliases[record_id] = kept
+        return kept
+
+
+def report(records):
+    """{"exact", "sameFormula", "sameTitle"}: lists of id groups"""
+    by_key, by_latex, by_title = {}, {}, {}
+    for record in records:
+        canonical = latex_hash(record.latex)
+        by_key.setdefault(duplicate_key(record.category, record.title, record.latex), []).append(record)
+        by_latex.setdefault(canonical, []).append(record)
+        by_title.setdefault(title_key(record.title), {}).setdefault(canonical, []).append(record)
+
+    def groups(values):
+        return [[record.id for record in group] for group in values if len(group) > 1]
+
+    exact = groups(by_key.values())
+    exact_ids = {record_id for group in exact for record_id in group}
+    same_formula = [
+        group for group in groups(by_latex.values())
+        if not set(group) <= exact_ids
+    ]
+    same_title = [
+        [record.id for variants in by_canonical.values() for record in variants]
+        for by_canonical in by_title.values()
+        if len(by_canonical) > 1
+    ]
+    return {"exact": exact, "sameFormula": same_formula, "sameTitle": same_title}
+
+
+def main(argv=None):
+    from pipeline import iter_source, normalize
+
+    parser = argparse.ArgumentParser(description="Report duplicate formulas in the corpus sources")
+    parser.parse_args(argv)
+    records = list(normalize(iter_source()))
+    titles = {record.id: f"{record.title} ({record.category})" for record in records}
+    sections = report(records)
+    labels = {
+        "exact": "Exact duplicates (aliased in the build)",
+        "sameFormula": "Same formula under another title or category",
+        "sameTitle": "Same title, different formula",
+    }
+    for name, label in labels.items():
+        print(f"{label}: {len(sections[name])}")
+        for group in sections[name]:
+            print("    " + " | ".join(f"{record_id} {titles[record_id]}" for record_id in group))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Atomic file writes for generated assets"""
+
+import hashlib
+import os
+import tempfile
+
+
+def _target_mode(path):
+    """Mode for a replacement file: keep the existing file's, else honour the umask"""
+    try:
+        return os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def write_atomic(path, data):
+    """Write bytes to path via a temp file in the same directory and a rename
+
+    Readers see either the old file or the new one, never a partial write.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, _target_mode(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def write_if_changed(path, data):
+    """Atomically write bytes unless the file already holds exactly them
+
+    Returns True when the file was written. Skipping the write leaves the
+    mtime alone, so Flutter does not re-bundle an unchanged asset.
+    """
+    return write_stream_if_changed(path, [data])
+
+
+def _file_digest(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            h.update(block)
+    return h.digest()
+
+
+def write_stream_if_changed(path, chunks, encoding="utf-8"):
+    """Stream text or bytes chunks to path atomically unless the content is unchanged
+
+    Chunks go straight to a temp file while being hashed, so memory stays
+    flat however large the output is. The temp file replaces path only if
+    its digest differs from the existing file's. Returns True when written.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp"
+    )
+    try:
+        h = hashlib.sha256()
+        size = 0
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                if isinstance(chunk, str):
+                    chunk = chunk.encode(encoding)
+                h.update(chunk)
+                size += len(chunk)
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            unchanged = os.path.getsize(path) == size and _file_digest(path) == h.digest()
+        except FileNotFoundError:
+            unchanged = False
+        if unchanged:
+            os.unlink(tmp_path)
+            return False
+        os.chmod(tmp_path, _target_mode(path))
+        os.replace(tmp_path, path)
+        return True
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
@@ -0,0 +1,198 @@
+"""Memory-mappable binary formula pack and a lazy reader for it
+
+Layout (little-endian):
+
+    header       magic b"FDPK", u16 version, u16 reserved, u32 count,
+                 u64 offset table position, u64 id index position,
+                 u32 id index slots, u64 aliases position, u32 aliases length
+    records      one blob per record: u16 id length, id (UTF-8),
+                 u32 body length, body (compact UTF-8 JSON without the id)
+    offsets      count x u64 absolute record positions, in asset order
+    id index     open-addressing hash table of u32 (ordinal + 1, 0 = empty)
+                 slots keyed by crc32(id), linear probing
+    aliases      compact UTF-8 JSON {dropped id: kept id} (the asset's
+                 "aliases"), empty when there are none
+
+FormulaPack maps the file and decodes nothing up front: record(i) and
+get(id) read one blob each, so opening a pack costs the same whatever the
+corpus size. The aliases are decoded the first time an id misses the index.
+
+    with FormulaPack("assets/formulas.pack") as pack:
+        pack.get("mech_289")["title"]
+"""
+
+import json
+import mmap
+import struct
+import zlib
+
+from assetdoc import dumps
+from fileio import write_if_changed
+from records import aliases_of
+
+MAGIC = b"FDPK"
+VERSION = 2
+
+_HEADER = struct.Struct("<4sHHIQQIQI")
+_ID_LEN = struct.Struct("<H")
+_BODY_LEN = struct.Struct("<I")
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+
+
+def _slot_count(count):
+    slots = 1
+    while slots < count * 2:
+        slots *= 2
+    return slots
+
+
+def encode(records):
+    """Serialize FormulaRecords into pack bytes"""
+    blobs = bytearray()
+    offsets = []
+    ids = []
+    for record in records:
+        offsets.append(_HEADER.size + len(blobs))
+        record_id = record.id.encode("utf-8")
+        body = dumps(record.body_dict()).encode("utf-8")
+        blobs += _ID_LEN.pack(len(record_id)) + record_id + _BODY_LEN.pack(len(body)) + body
+        ids.append(record_id)
+
+    slots = _slot_count(len(ids))
+    table = [0] * slots
+    for ordinal, record_id in enumerate(ids):
+        slot = zlib.crc32(record_id) & (slots - 1)
+        while table[slot]:
+            slot = (slot + 1) & (slots - 1)
+        table[slot] = ordinal + 1
+
+    aliases = aliases_of(records)
+    alias_blob = (
+        dumps(aliases).encode("utf-8")
+        if aliases else b""
+    )
+    offsets_pos = _HEADER.size + len(blobs)
+    index_pos = offsets_pos + len(offsets) * _U64.size
+    aliases_pos = index_pos + slots * _U32.size
+    header = _HEADER.pack(
+        MAGIC, VERSION, 0, len(ids), offsets_pos, index_pos, slots, aliases_pos, len(alias_blob)
+    )
+    return b"".join([
+        header,
+        bytes(blobs),
+        struct.pack(f"<{len(offsets)}Q", *offsets),
+        struct.pack(f"<{slots}I", *table),
+        alias_blob,
+    ])
+
+
+def emit(records, path):
+    """Write the pack for records; returns whether the file changed"""
+    return write_if_changed(path, encode(records))
+
+
+class FormulaPack:
+    """Read-only, lazily decoded view of a formula pack"""
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            self._file.close()
+            raise ValueError(f"{path} is not a formula pack") from None
+        if len(self._map) < _HEADER.size:
+            self.close()
+            raise ValueError(f"{path} is not a formula pack")
+        magic, version, _, count, offsets_pos, index_pos, slots, aliases_pos, aliases_len = (
+            _HEADER.unpack_from(self._map, 0)
+        )
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a v{VERSION} formula pack")
+        self._count = count
+        self._offsets_pos = offsets_pos
+        self._index_pos = index_pos
+        self._slots = slots
+        self._aliases_span = (aliases_pos, aliases_pos + aliases_len)
+        self._aliases = None
+
+    def close(self):
+        if getattr(self, "_map", None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self._count
+
+    def _record_pos(self, ordinal):
+        return _U64.unpack_from(self._map, self._offsets_pos + ordinal * _U64.size)[0]
+
+    def _read_id(self, pos):
+        (length,) = _ID_LEN.unpack_from(self._map, pos)
+        start = pos + _ID_LEN.size
+        return self._map[start:start + length], start + length
+
+    def record_id(self, ordinal):
+        if not 0 <= ordinal < self._count:
+            raise IndexError(ordinal)
+        return self._read_id(self._record_pos(ordinal))[0].decode("utf-8")
+
+    def record(self, ordinal):
+        """Decode the record at ordinal into a dict in asset key order"""
+        if not 0 <= ordinal < self._count:
+            raise IndexError(ordinal)
+        record_id, pos = self._read_id(self._record_pos(ordinal))
+        (length,) = _BODY_LEN.unpack_from(self._map, pos)
+        start = pos + _BODY_LEN.size
+        body = json.loads(self._map[start:start + length].decode("utf-8"))
+        return {"id": record_id.decode("utf-8"), **body}
+
+    __getitem__ = record
+
+    @property
+    def aliases(self):
+        """{dropped id: kept id}, decoded on first use"""
+        if self._aliases is None:
+            start, end = self._aliases_span
+            self._aliases = json.loads(self._map[start:end].decode("utf-8")) if end > start else {}
+        return self._aliases
+
+    def ordinal(self, record_id):
+        """Return the ordinal of record_id, or None if the pack has no such id
+
+        Ids of dropped duplicates resolve to the formula they repeat.
+        """
+        ordinal = self._find(record_id)
+        if ordinal is None and record_id in self.aliases:
+            ordinal = self._find(self.aliases[record_id])
+        return ordinal
+
+    def _find(self, record_id):
+        key = record_id.encode("utf-8")
+        mask = self._slots - 1
+        slot = zlib.crc32(key) & mask
+        for _ in range(self._slots):
+            (entry,) = _U32.unpack_from(self._map, self._index_pos + slot * _U32.size)
+            if entry == 0:
+                return None
+            if self._read_id(self._record_pos(entry - 1))[0] == key:
+                return entry - 1
+            slot = (slot + 1) & mask
+        return None
+
+    def get(self, record_id, default=None):
+        ordinal = self.ordinal(record_id)
+        return default if ordinal is None else self.record(ordinal)
+
+    def __iter__(self):
+        for ordinal in range(self._count):
+            yield self.record(ordinal)
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""Typo-tolerant title search over a precomputed trigram index
+
+The generator's "fuzzy" variant writes formulas.fuzzy.json:
+
+    {"format": "formulas.fuzzy", "version": 1, "ids": [...],
+     "titleWords": [title word count per formula],
+     "words": [sorted title vocabulary], "postings": [[ordinal gap, ...]],
+     "trigrams": {trigram: [word index gap, ...]}}
+
+Each title word is padded as "$$word$" and split into character trigrams.
+A misspelt query word is resolved to vocabulary words that share enough
+trigrams with it. An insertion, deletion or substitution changes at most
+three of the query's trigrams and a swap of two adjacent letters four, so
+anything within the allowed distance shares at least
+len(trigrams) - 4 * distance of them. Where that bound drops below one
+(two edits in a short word) a candidate must still share one trigram.
+Only candidates get a real edit distance check (optimal string
+alignment, so a swap counts as one edit).
+
+The vocabulary grows much more slowly than the corpus, so the work per
+query word stays small. Formulas must match every query word. They are
+ranked by total edit distance, then title length, then asset order. Run
+this script for recall and latency at growing sizes:
+
+    python3 scripts/fuzzy_index.py --sizes 10000 100000 200000
+"""
+
+import argparse
+import json
+import random
+import statistics
+import time
+
+from assetdoc import DocumentReader, check_format, dumps, gaps, ungap
+from fileio import write_if_changed
+from search_index import tokenize
+
+FORMAT = "formulas.fuzzy"
+VERSION = 1
+# Query trigrams one edit can change: a swap of two adjacent letters touches four.
+TRIGRAMS_PER_EDIT = 4
+
+
+def trigrams(word):
+    padded = f"$${word}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def max_distance(word):
+    """Edits tolerated for a query word of this length"""
+    if len(word) <= 3:
+        return 0
+    if len(word) <= 5:
+        return 1
+    return 2
+
+
+def edit_distance(a, b, limit):
+    """Optimal string alignment distance, or limit + 1 once it must exceed limit"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        row_min = i
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (
+                previous2 is not None and j > 1
+                and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]
+            ):
+                value = min(value, previous2[j - 2] + 1)
+            current[j] = value
+            row_min = min(row_min, value)
+        if row_min > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+def build(records):
+    """Return the fuzzy index document for records, in asset order"""
+    by_word = {}
+    for ordinal, record in enumerate(records):
+        for word in set(tokenize(record.title)):
+            by_word.setdefault(word, []).append(ordinal)
+    words = sorted(by_word)
+    by_trigram = {}
+    for index, word in enumerate(words):
+        for trigram in trigrams(word):
+            by_trigram.setdefault(trigram, []).append(index)
+    return {
+        "format": FORMAT,
+        "version": VERSION,
+        "ids": [record.id for record in records],
+        "titleWords": [len(tokenize(record.title)) for record in records],
+        "words": words,
+        "postings": [gaps(by_word[word]) for word in words],
+        "trigrams": {trigram: gaps(by_trigram[trigram]) for trigram in sorted(by_trigram)},
+    }
+
+
+def emit(records, path):
+    return write_if_changed(path, dumps(build(records)).encode("utf-8"))
+
+
+class FuzzyIndex(DocumentReader):
+    """Title search that tolerates a few typos per word"""
+
+    def __init__(self, doc):
+        check_format(doc, FORMAT, VERSION)
+        self.ids = doc["ids"]
+        self.title_words = doc["titleWords"]
+        self.words = doc["words"]
+        self._word_index = {word: i for i, word in enumerate(self.words)}
+        self._raw_postings = doc["postings"]
+        self._raw_trigrams = doc["trigrams"]
+        self._postings = {}
+        self._trigrams = {}
+
+    def _words_with(self, trigram):
+        words = self._trigrams.get(trigram)
+        if words is None:
+            words = ungap(self._raw_trigrams.get(trigram, ()))
+            self._trigrams[trigram] = words
+        return words
+
+    def postings(self, word_index):
+        ordinals = self._postings.get(word_index)
+        if ordinals is None:
+            ordinals = ungap(self._raw_postings[word_index])
+            self._postings[word_index] = ordinals
+        return ordinals
+
+    def similar_words(self, word, limit=None):
+        """[(distance, vocabulary word)] within the tolerated distance, closest first"""
+        if limit is None:
+            limit = max_distance(word)
+        exact = self._word_index.get(word)
+        if limit == 0:
+            return [(0, word)] if exact is not None else []
+        grams = trigrams(word)
+        shared = {}
+        for trigram in grams:
+            for index in self._words_with(trigram):
+                shared[index] = shared.get(index, 0) + 1
+        needed = max(1, len(grams) - TRIGRAMS_PER_EDIT * limit)
+        found = []
+        for index, count in shared.items():
+            if count < needed:
+                continue
+            candidate = self.words[index]
+            distance = edit_distance(word, candidate, limit)
+            if distance <= limit:
+                found.append((distance, candidate))
+        found.sort()
+        return found
+
+    def search_scored(self, query, limit=None):
+        """[(id, total edit distance)] for formulas matching every query word"""
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        distances = None
+        for token in tokens:
+            best = {}
+            for distance, word in self.similar_words(token):
+                for ordinal in self.postings(self._word_index[word]):
+                    if distance < best.get(ordinal, distance + 1):
+                        best[ordinal] = distance
+            if distances is None:
+                distances = best
+            else:
+                distances = {
+                    ordinal: total + best[ordinal]
+                    for ordinal, total in distances.items()
+                    if ordinal in best
+                }
+            if not distances:
+                return []
+        ranked = sorted(
+            distances.items(),
+            key=lambda item: (item[1], self.title_words[item[0]], item[0]),
+        )
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [(self.ids[ordinal], distance) for ordinal, distance in ranked]
+
+    def search(self, query, limit=None):
+        """Ids of formulas matching query despite typos, closest first"""
+        return [record_id for record_id, _ in self.search_scored(query, limit)]
+
+
+def misspell(rng, word):
+    """Apply one random deletion, insertion, substitution or transposition"""
+    i = rng.randrange(1, len(word))
+    letter = rng.choice("abcdefghijklmnopqrstuvwxyz")
+    edit = rng.choice(("delete", "insert", "substitute", "transpose"))
+    if edit == "delete":
+        return word[:i] + word[i + 1:]
+    if edit == "insert":
+        return word[:i] + letter + word[i:]
+    if edit == "substitute":
+        return word[:i] + letter + word[i + 1:]
+    return word[:i - 1] + word[i] + word[i - 1] + word[i + 1:]
+
+
+def typo_queries(records, count, seed=0):
+    """(clean, misspelt) query pairs of one or two title words, one typo each"""
+    rng = random.Random(seed)
+    pairs = []
+    while len(pairs) < count:
+        words = [w for w in tokenize(rng.choice(records).title) if w.isalpha()]
+        if not words:
+            continue
+        start = rng.randrange(len(words))
+        clean = words[start:start + rng.choice((1, 2))]
+        long_words = [i for i, w in enumerate(clean) if len(w) >= 6]
+        if not long_words:
+            continue
+        typo = list(clean)
+        i = rng.choice(long_words)
+        typo[i] = misspell(rng, typo[i])
+        pairs.append((" ".join(clean), " ".join(typo)))
+    return pairs
+
+
+def bench(count, queries, seed=0):
+    import app_model
+    from bench_corpus import synthesize
+    from pipeline import normalize
+
+    records = list(normalize(synthesize(count)))
+    formulas = [app_model.Formula.from_json(record.to_dict()) for record in records]
+    start = time.perf_counter()
+    text = dumps(build(records))
+    build_ms = (time.perf_counter() - start) * 1000
+    index = FuzzyIndex(json.loads(text))
+
+    recalls, scan_recalls, samples, scan_samples = [], [], [], []
+    for clean, typo in typo_queries(records, queries, seed):
+        # Ground truth: formulas whose titles contain the clean words exactly.
+        expected = {record_id for record_id, distance in index.search_scored(clean) if distance == 0}
+        start = time.perf_counter()
+        found = index.search(typo)
+        samples.append(time.perf_counter() - start)
+        recalls.append(len(expected.intersection(found)) / len(expected))
+
+        start = time.perf_counter()
+        scanned = app_model.search_formulas(formulas, typo)
+        scan_samples.append(time.perf_counter() - start)
+        scan_recalls.append(len(expected.intersection(f.id for f in scanned)) / len(expected))
+    samples.sort()
+    return {
+        "count": count,
+        "build_ms": build_ms,
+        "index_bytes": len(text.encode("utf-8")),
+        "vocabulary": len(index.words),
+        "queries": len(samples),
+        "recall": statistics.mean(recalls),
+        "median_ms": statistics.median(samples) * 1000,
+        "p99_ms": samples[int(len(samples) * 0.99)] * 1000,
+        "scan_recall": statistics.mean(scan_recalls),
+        "scan_median_ms": statistics.median(scan_samples) * 1000,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark typo-tolerant search recall and latency")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 200_000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    results = [bench(count, args.queries) for count in args.sizes]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for r in results:
+        print(
+            f"{r['count']:>9,} formulas: {r['vocabulary']:,} title words, "
+            f"index {r['index_bytes'] / 1024:.0f} KiB built in {r['build_ms']:.0f} ms; "
+            f"{r['queries']} typo queries: recall {r['recall']:.1%}, "
+            f"median {r['median_ms']:.2f} ms, p99 {r['p99_ms']:.2f} ms "
+            f"(substring scan: recall {r['scan_recall']:.1%}, median {r['scan_median_ms']:.2f} ms)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Two-tier split of the formulas asset: list heads and detail bodies
+
+    formulas.head.json  {"formulas": [{"id", "title", "category", "latex"}]}
+                        in asset order: everything a list row draws, and
+                        the asset's "aliases" map when it has one
+    formulas.body.json  {"bodies": {id: {"description", "variables",
+                        "calculator"}}}: the detail-screen fields
+
+The list can render after decoding only the head file; the body file is
+decoded when a detail screen first opens.
+"""
+
+from assetdoc import dumps
+from fileio import write_if_changed
+from records import aliases_of
+
+HEAD_FIELDS = ("id", "title", "category", "latex")
+BODY_FIELDS = ("description", "variables", "calculator")
+
+
+def split(records):
+    """Return the (head, body) documents for records"""
+    heads = []
+    bodies = {}
+    for record in records:
+        data = record.to_dict()
+        heads.append({key: data[key] for key in HEAD_FIELDS})
+        bodies[record.id] = {key: data[key] for key in BODY_FIELDS}
+    head = {"formulas": heads}
+    aliases = aliases_of(records)
+    if aliases:
+        head["aliases"] = aliases
+    return head, {"bodies": bodies}
+
+
+def merge(head, body):
+    """Rebuild asset-ordered record dicts from head and body documents"""
+    bodies = body["bodies"]
+    return [{**item, **bodies[item["id"]]} for item in head["formulas"]]
+
+
+def body_path(head_path):
+    if not head_path.endswith(".head.json"):
+        raise ValueError(f"Head path must end in .head.json: {head_path}")
+    return head_path[: -len(".head.json")] + ".body.json"
+
+
+def emit(records, head_path):
+    """Write the head file and its sibling body file; returns whether either changed"""
+    head, body = split(records)
+    if merge(head, body) != [record.to_dict() for record in records]:
+        raise ValueError("Head/body split does not reproduce the records")
+    changed = write_if_changed(head_path, dumps(head).encode("utf-8"))
+    changed |= write_if_changed(body_path(head_path), dumps(body).encode("utf-8"))
+    return changed
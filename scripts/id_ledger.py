@@ -0,0 +1,142 @@
+"""Persisted ledger of stable formula ids
+
+Every formula the generator has ever emitted has a ledger entry: its id,
+category, title, a hash of its LaTeX and an occurrence number that tells
+identical (title, LaTeX) pairs within a category apart. A build reuses ids
+by matching records against the ledger, per category:
+
+    1. same title and LaTeX (and occurrence)
+    2. same title, edited LaTeX
+    3. same LaTeX, edited title
+
+Matched entries are updated to the record's current title and LaTeX.
+Records that match nothing get "<prefix>_<next>", where next only ever
+grows, so ids of removed formulas are never handed out again. New ids are
+allocated in build order; with an empty ledger that reproduces the old
+running-counter numbering exactly.
+
+The ledger lives in scripts/formula_ids.json and is committed with the
+corpus.
+"""
+
+import hashlib
+import json
+import os
+
+from fileio import write_if_changed
+
+VERSION = 1
+DEFAULT_LEDGER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "formula_ids.json")
+
+
+def latex_hash(latex):
+    return hashlib.sha1(latex.encode("utf-8")).hexdigest()[:12]
+
+
+class FrozenIdsError(ValueError):
+    pass
+
+
+class IdLedger:
+    def __init__(self, path=DEFAULT_LEDGER_PATH, frozen=False):
+        self.path = path
+        self.frozen = frozen
+        self.allocated = []
+        self._matched = {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            data = {"version": VERSION, "next": 1, "ids": []}
+        if data.get("version") != VERSION:
+            raise ValueError(f"{path}: unsupported ledger version {data.get('version')!r}")
+        self.next = data["next"]
+        self.entries = data["ids"]
+        self._dirty = False
+
+    def _match(self, category, keys_by_section):
+        """Match a whole category against the ledger
+
+        Returns {section: [[id or None, title, latex hash, occurrence], ...]}.
+        """
+        result = {}
+        occurrences = {}
+        for section, keys in keys_by_section.items():
+            slots = result[section] = []
+            for title, latex in keys:
+                digest = latex_hash(latex)
+                occurrence = occurrences.get((title, digest), 0)
+                occurrences[(title, digest)] = occurrence + 1
+                slots.append([None, title, digest, occurrence])
+
+        by_exact, by_title, by_latex = {}, {}, {}
+        for entry in self.entries:
+            if entry["category"] != category:
+                continue
+            by_exact[(entry["title"], entry["latex"], entry["occurrence"])] = entry
+            by_title.setdefault(entry["title"], []).append(entry)
+            by_latex.setdefault(entry["latex"], []).append(entry)
+
+        claimed = set()
+        passes = [
+            lambda title, digest, occurrence: [by_exact.get((title, digest, occurrence))],
+            lambda title, digest, occurrence: by_title.get(title, ()),
+            lambda title, digest, occurrence: by_latex.get(digest, ()),
+        ]
+        for candidates_for in passes:
+            for slots in result.values():
+                for slot in slots:
+                    if slot[0] is not None:
+                        continue
+                    _, title, digest, occurrence = slot
+                    for entry in candidates_for(title, digest, occurrence):
+                        if entry is None or entry["id"] in claimed:
+                            continue
+                        claimed.add(entry["id"])
+                        slot[0] = entry["id"]
+                        if (entry["title"], entry["latex"], entry["occurrence"]) != (title, digest, occurrence):
+                            entry.update(title=title, latex=digest, occurrence=occurrence)
+                            self._dirty = True
+                        break
+        return result
+
+    def section_ids(self, category, prefix, section, load_keys):
+        """Ids for one section of a category, allocating new ones in order
+
+        load_keys() returns {section: [(title, latex), ...]} for every
+        section of the category. It is called once per category, which is
+        matched as a whole so edits are resolved across sections.
+        """
+        if category not in self._matched:
+            self._matched[category] = self._match(category, load_keys())
+        slots = self._matched[category][section]
+        for slot in slots:
+            if slot[0] is None:
+                slot[0] = self._allocate(category, prefix, *slot[1:])
+        return [slot[0] for slot in slots]
+
+    def _allocate(self, category, prefix, title, digest, occurrence):
+        record_id = f"{prefix}_{self.next}"
+        if self.frozen:
+            raise FrozenIdsError(f"{category} formula {title!r} needs a new id; ledger is frozen")
+        self.entries.append({
+            "id": record_id, "category": category, "title": title,
+            "latex": digest, "occurrence": occurrence,
+        })
+        self.next += 1
+        self.allocated.append(record_id)
+        self._dirty = True
+        return record_id
+
+    def save(self):
+        """Write the ledger if it changed, one entry per line for readable diffs"""
+        if not self._dirty:
+            return False
+        lines = [json.dumps(entry, ensure_ascii=False) for entry in self.entries]
+        text = (
+            f'{{\n  "version": {VERSION},\n  "next": {self.next},\n  "ids": [\n    '
+            + ",\n    ".join(lines)
+            + "\n  ]\n}\n"
+        )
+        self._dirty = False
+        return write_if_changed(self.path, text.encode("utf-8"))
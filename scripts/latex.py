@@ -0,0 +1,318 @@
+"""LaTeX lexing for the corpus's math strings
+
+tokenize() splits a formula's latex into (kind, text, position) tokens:
+
+    command   \\frac, \\sigma, and control symbols such as \\, or \\%
+    letter    a single ASCII letter
+    number    a run of digits (with a decimal point); as an argument or
+              script only its first digit is taken, as in KaTeX:
+              \\frac12 is \\frac{1}{2} and x^10 is x^{1}0
+    open      {        close   }
+    sub       _        sup     ^
+    space     whitespace
+    other     any other single character: = + - ( ) ' ! | ...
+
+The corpus writes math the way KaTeX reads it, so letters are tokenized one
+at a time: "mv" is m times v.
+
+parse() builds a tree of Node(kind, text, children, position) on top of the
+tokens, mirroring how KaTeX groups them:
+
+    symbol       a letter, number, operator or argument-less command
+    group        {...}; children is (body,)
+    command      a command with arguments, children one body per argument:
+                 \\frac{a}{b} -> (a, b); \\sqrt[n]{x} -> (x, n)
+    text         \\text{...} and friends; text is the verbatim content
+    scripts      children (base, sub, sup), any of them possibly empty
+    delimited    \\left( ... \\right); text is the (left, right) pair
+    environment  \\begin{name} ... \\end{name}; text is the name and
+                 children are rows of cells (split on & and \\\\)
+
+Bodies are lists of nodes; whitespace is dropped, so two letters whose
+positions are not adjacent had space between them. Structural mistakes
+(unbalanced braces, a missing argument, \\left without \\right, a double
+superscript) raise LatexSyntaxError; commands KaTeX does not know parse as
+symbols and are left to the caller (see COMMANDS).
+"""
+
+import re
+from collections import namedtuple
+
+GREEK = frozenset((
+    "alpha", "beta", "gamma", "delta", "epsilon", "varepsilon", "zeta", "eta",
+    "theta", "vartheta", "iota", "kappa", "lambda", "mu", "nu", "xi", "pi",
+    "varpi", "rho", "varrho", "sigma", "varsigma", "tau", "upsilon", "phi",
+    "varphi", "chi", "psi", "omega",
+    "Gamma", "Delta", "Theta", "Lambda", "Xi", "Pi", "Sigma", "Upsilon",
+    "Phi", "Psi", "Omega",
+))
+
+_TOKEN = re.compile(
+    r"(?P<command>\\(?:[A-Za-z]+|.))"
+    r"|(?P<letter>[A-Za-z])"
+    r"|(?P<number>\d+(?:\.\d+)?)"
+    r"|(?P<open>\{)|(?P<close>\})"
+    r"|(?P<sub>_)|(?P<sup>\^)"
+    r"|(?P<space>\s+)"
+    r"|(?P<other>.)",
+    re.DOTALL,
+)
+
+
+def tokenize(latex):
+    """Return the (kind, text, position) tokens of a latex string"""
+    return [(m.lastgroup, m.group(), m.start()) for m in _TOKEN.finditer(latex)]
+
+
+def is_greek(command):
+    return command[1:] in GREEK
+
+
+# Commands KaTeX renders, by number of arguments. \\sqrt also takes an
+# optional [index]; TEXT_COMMANDS, \\left/\\right and \\begin/\\end are
+# parsed separately.
+COMMANDS = {
+    **{"\\" + name: 0 for name in GREEK},
+    **dict.fromkeys((
+        # control symbols and spacing
+        "\\ ", "\\,", "\\;", "\\:", "\\!", "\\\\", "\\%", "\\{", "\\}", "\\|", "\\&",
+        "\\_", "\\#", "\\$", "\\quad", "\\qquad",
+        # big operators and named functions
+        "\\sum", "\\prod", "\\int", "\\iint", "\\iiint", "\\oint", "\\lim", "\\limsup",
+        "\\liminf", "\\max", "\\min", "\\sup", "\\inf", "\\sin", "\\cos", "\\tan",
+        "\\cot", "\\sec", "\\csc", "\\arcsin", "\\arccos", "\\arctan", "\\sinh",
+        "\\cosh", "\\tanh", "\\coth", "\\ln", "\\log", "\\exp", "\\det", "\\dim",
+        "\\ker", "\\deg", "\\gcd", "\\arg", "\\Pr",
+        # binary operators and relations
+        "\\cdot", "\\times", "\\div", "\\pm", "\\mp", "\\ast", "\\star", "\\circ",
+        "\\bullet", "\\oplus", "\\otimes", "\\cup", "\\cap", "\\setminus", "\\wedge",
+        "\\vee", "\\land", "\\lor", "\\neg", "\\leq", "\\geq", "\\le", "\\ge",
+        "\\neq", "\\ne", "\\approx", "\\equiv", "\\sim", "\\simeq", "\\cong",
+        "\\propto", "\\ll", "\\gg", "\\in", "\\notin", "\\subset", "\\subseteq",
+        "\\supset", "\\supseteq", "\\perp", "\\parallel", "\\mid",
+        # arrows
+        "\\to", "\\rightarrow", "\\leftarrow", "\\leftrightarrow", "\\Rightarrow",
+        "\\Leftarrow", "\\Leftrightarrow", "\\implies", "\\iff", "\\mapsto",
+        "\\rightleftharpoons",
+        # other symbols and delimiters
+        "\\infty", "\\partial", "\\nabla", "\\hbar", "\\ell", "\\Re", "\\Im",
+        "\\emptyset", "\\forall", "\\exists", "\\angle", "\\triangle", "\\degree",
+        "\\prime", "\\dots", "\\ldots", "\\cdots", "\\vdots", "\\ddots",
+        "\\langle", "\\rangle", "\\lfloor", "\\rfloor", "\\lceil", "\\rceil",
+        "\\vert", "\\Vert", "\\lvert", "\\rvert",
+        # delimiter sizing
+        "\\big", "\\Big", "\\bigg", "\\Bigg", "\\bigl", "\\bigr", "\\Bigl", "\\Bigr",
+    ), 0),
+    **dict.fromkeys((
+        "\\vec", "\\hat", "\\bar", "\\tilde", "\\dot", "\\ddot", "\\overline",
+        "\\underline", "\\overrightarrow", "\\mathbf", "\\mathit", "\\mathcal",
+        "\\mathbb", "\\boldsymbol", "\\sqrt",
+    ), 1),
+    **dict.fromkeys(("\\frac", "\\dfrac", "\\tfrac", "\\binom", "\\overset", "\\underset"), 2),
+}
+TEXT_COMMANDS = frozenset(("\\text", "\\textrm", "\\textbf", "\\textit", "\\mathrm", "\\operatorname"))
+ENVIRONMENTS = frozenset((
+    "cases", "matrix", "pmatrix", "bmatrix", "Bmatrix", "vmatrix", "Vmatrix", "aligned",
+    "gathered", "array",
+))
+
+Node = namedtuple("Node", "kind text children position")
+
+
+class LatexSyntaxError(ValueError):
+    """A structural error KaTeX would reject; position indexes the source"""
+
+    def __init__(self, message, position):
+        super().__init__(message)
+        self.position = position
+
+
+class _Parser:
+    def __init__(self, source):
+        self.source = source
+        # Whitespace never matters outside text, which is sliced from source.
+        self.tokens = [token for token in tokenize(source) if token[0] != "space"]
+        self.tokens.append(None)
+        self.i = 0
+
+    def peek(self):
+        """The next token, or None at the end"""
+        return self.tokens[self.i]
+
+    def take(self):
+        token = self.tokens[self.i]
+        if token is not None:
+            self.i += 1
+        return token
+
+    def body(self, stops=(), in_environment=False):
+        """Nodes up to (not including) a token whose text is in stops"""
+        nodes = []
+        tokens = self.tokens
+        while True:
+            token = tokens[self.i]
+            if token is None or token[1] in stops:
+                return nodes
+            kind, text, position = token
+            if kind == "close":
+                raise LatexSyntaxError("unmatched }", position)
+            if text == "&" and not in_environment:
+                raise LatexSyntaxError("& outside an environment", position)
+            if kind in ("sub", "sup"):
+                base = []
+            elif kind in ("letter", "number", "other"):
+                # Most tokens are plain symbols; skip atom() for them.
+                self.i += 1
+                base = [Node("symbol", text, (), position)]
+            else:
+                base = [self.atom()]
+            following = tokens[self.i]
+            if following is not None and following[0] in ("sub", "sup"):
+                nodes.append(self.scripts(base))
+            else:
+                nodes.extend(base)
+
+    def scripts(self, base):
+        position = base[0].position if base else self.peek()[2]
+        sub = sup = None
+        while self.peek() is not None and self.peek()[0] in ("sub", "sup"):
+            kind, text, at = self.take()
+            if (sub if kind == "sub" else sup) is not None:
+                raise LatexSyntaxError(f"double {'subscript' if kind == 'sub' else 'superscript'}", at)
+            argument = self.argument(f"{text} expects an argument", at)
+            if kind == "sub":
+                sub = argument
+            else:
+                sup = argument
+        return Node("scripts", None, (base, sub or [], sup or []), position)
+
+    def argument(self, message, position):
+        """One argument: a group's body or a single atom"""
+        token = self.peek()
+        if (
+            token is None or token[0] in ("close", "sub", "sup")
+            or token[1] in ("&", "\\\\", "\\right", "\\end")
+        ):
+            raise LatexSyntaxError(message, position)
+        if token[0] == "open":
+            return self.atom().children[0]
+        if token[0] == "number" and len(token[1]) > 1:
+            return [self.digit()]
+        return [self.atom()]
+
+    def digit(self):
+        """Split the first digit off the next (number) token and return it"""
+        _, text, position = self.tokens[self.i]
+        rest = [
+            (kind, value, position + 1 + at) for kind, value, at in tokenize(text[1:])
+        ]
+        self.tokens[self.i:self.i + 1] = rest
+        return Node("symbol", text[0], (), position)
+
+    def group(self, open_position):
+        body = self.body(("}",))
+        if self.take() is None:
+            raise LatexSyntaxError("unbalanced {", open_position)
+        return body
+
+    def raw_group(self, command, position):
+        """Verbatim content of a braced argument, for text and environment names"""
+        token = self.peek()
+        if token is None or token[0] != "open":
+            raise LatexSyntaxError(f"{command} expects a {{...}} argument", position)
+        self.i += 1
+        depth = 1
+        while self.tokens[self.i] is not None:
+            kind, _, end = self.tokens[self.i]
+            depth += {"open": 1, "close": -1}.get(kind, 0)
+            self.i += 1
+            if not depth:
+                return self.source[token[2] + 1:end]
+        raise LatexSyntaxError("unbalanced {", token[2])
+
+    def atom(self):
+        kind, text, position = self.take()
+        if kind == "open":
+            return Node("group", None, (self.group(position),), position)
+        if kind != "command":
+            return Node("symbol", text, (), position)
+        if text in TEXT_COMMANDS:
+            return Node("text", self.raw_group(text, position), (), position)
+        if text == "\\left":
+            return self.delimited(position)
+        if text == "\\begin":
+            return self.environment(position)
+        if text in ("\\right", "\\end"):
+            opener = "\\left" if text == "\\right" else "\\begin"
+            raise LatexSyntaxError(f"{text} without a matching {opener}", position)
+        arity = COMMANDS.get(text, 0)
+        if not arity:
+            return Node("symbol", text, (), position)
+        index = None
+        if text == "\\sqrt" and self.peek() is not None and self.peek()[1] == "[":
+            self.take()
+            index = self.body(("]",))
+            if self.take() is None:
+                raise LatexSyntaxError("unbalanced [ in \\sqrt", position)
+        message = f"{text} expects {arity} argument{'s' if arity > 1 else ''}"
+        arguments = [self.argument(message, position) for _ in range(arity)]
+        if index is not None:
+            arguments.append(index)
+        return Node("command", text, tuple(arguments), position)
+
+    def delimiter(self, command, position):
+        token = self.take()
+        if token is None or token[0] in ("sub", "sup"):
+            raise LatexSyntaxError(f"{command} expects a delimiter", position)
+        return token[1]
+
+    def delimited(self, position):
+        left = self.delimiter("\\left", position)
+        body = self.body(("\\right",))
+        if self.take() is None:
+            raise LatexSyntaxError("\\left without a matching \\right", position)
+        right = self.delimiter("\\right", position)
+        return Node("delimited", (left, right), (body,), position)
+
+    def environment(self, position):
+        name = self.raw_group("\\begin", position)
+        if name == "array":
+            self.raw_group("array", position)
+        rows = [[]]
+        while True:
+            cell = self.body(("&", "\\\\", "\\end"), in_environment=True)
+            rows[-1].append(cell)
+            token = self.take()
+            if token is None:
+                raise LatexSyntaxError(f"\\begin{{{name}}} without a matching \\end", position)
+            if token[1] == "\\\\":
+                rows.append([])
+            elif token[1] == "\\end":
+                end = self.raw_group("\\end", token[2])
+                if end != name:
+                    raise LatexSyntaxError(f"\\begin{{{name}}} ended by \\end{{{end}}}", token[2])
+                break
+        if rows[-1] == [[]] and len(rows) > 1:
+            rows.pop()
+        return Node("environment", name, tuple(tuple(row) for row in rows), position)
+
+
+def parse(latex):
+    """Return the list of top-level Nodes of a latex string
+
+    Raises LatexSyntaxError on structural errors.
+    """
+    return _Parser(latex).body()
+
+
+def walk(nodes):
+    """Yield every node of a parsed body, depth first"""
+    for node in nodes:
+        yield node
+        if node.kind == "environment":
+            for row in node.children:
+                for cell in row:
+                    yield from walk(cell)
+        else:
+            for body in node.children:
+                yield from walk(body)
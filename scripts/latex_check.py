@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""Build-time LaTeX validation, so no formula fails to parse on-device
+
+check() parses a formula's latex (see latex.parse) and returns its issues:
+
+    error    syntax            unbalanced braces, missing arguments,
+                               \\left without \\right, double scripts ...
+             unknown-command   a command KaTeX does not render
+             unknown-environment
+    warning  prose             words separated by spaces in math mode,
+                               which KaTeX sets as one run of italic
+                               letters ("System shifts to counteract change")
+             word              a word set in math italics outside \\text
+                               ("\\frac{opposite}{hypotenuse}")
+
+Script labels (R_{total}) and \\text / \\mathrm arguments are not checked
+for words. The generator checks every formula as it streams through the
+build (pipeline.check_latex) and a LatexGate stops the build before the
+asset is written on errors (with --strict-latex, on warnings too).
+check_records() checks an existing asset; jobs > 1 spreads it over a
+process pool. Run this script to list every issue
+in the asset, and with --sizes to time larger corpora:
+
+    python3 scripts/latex_check.py --sizes 10000 100000 --jobs 0
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import latex
+
+Issue = namedtuple("Issue", "severity code position message")
+FormulaRef = namedtuple("FormulaRef", "id title")
+
+# A run of letters reads as a word: a capital or small letter then 3+ small ones.
+_WORD = re.compile(r"[A-Za-z][a-z]{3,}")
+
+
+def _letter(node):
+    """The letter symbol a node sets, looking through scripts (mass_{solute}), else None"""
+    if node.kind == "scripts" and len(node.children[0]) == 1:
+        node = node.children[0][0]
+    if node.kind == "symbol" and len(node.text) == 1 and node.text.isalpha():
+        return node
+    return None
+
+
+def _letter_runs(body):
+    """Yield runs of adjacent letter symbols in a body as [(word, position)] phrases
+
+    Letters in one word are adjacent in the source; words in one phrase are
+    separated by whitespace only (the parser drops it, leaving a gap).
+    """
+    phrase = []
+    end = None
+    for node in body:
+        letter = _letter(node)
+        if letter is None:
+            if phrase:
+                yield phrase
+            phrase, end = [], None
+            continue
+        if end == letter.position:
+            word, start = phrase[-1]
+            phrase[-1] = (word + letter.text, start)
+        else:
+            phrase.append((letter.text, letter.position))
+        end = letter.position + 1
+    if phrase:
+        yield phrase
+
+
+def _math_bodies(nodes):
+    """Yield every body set in math italics, skipping script labels and text"""
+    yield nodes
+    for node in nodes:
+        if node.kind == "environment":
+            for row in node.children:
+                for cell in row:
+                    yield from _math_bodies(cell)
+        elif node.kind == "scripts":
+            yield from _math_bodies(node.children[0])
+        else:
+            for body in node.children:
+                yield from _math_bodies(body)
+
+
+def check(source):
+    """Return the Issues of one latex string, errors first"""
+    try:
+        nodes = latex.parse(source)
+    except latex.LatexSyntaxError as e:
+        return [Issue("error", "syntax", e.position, str(e))]
+
+    errors = []
+    for node in latex.walk(nodes):
+        if node.kind in ("symbol", "command") and node.text.startswith("\\"):
+            if node.text not in latex.COMMANDS:
+                errors.append(Issue("error", "unknown-command", node.position, f"unknown command {node.text}"))
+        elif node.kind == "environment" and node.text not in latex.ENVIRONMENTS:
+            message = f"unknown environment {node.text}"
+            errors.append(Issue("error", "unknown-environment", node.position, message))
+
+    phrases, words = [], []
+    for body in _math_bodies(nodes):
+        for phrase in _letter_runs(body):
+            # "u dv" is a product; "implies local min" is prose.
+            if len(phrase) > 1 and any(len(word) > 2 for word, _ in phrase):
+                phrases.append((" ".join(word for word, _ in phrase), phrase[0][1]))
+            else:
+                words += [(word, position) for word, position in phrase if _WORD.fullmatch(word)]
+    warnings = []
+    labels = (("prose", "prose in math mode", phrases), ("word", "words in math italics", words))
+    for code, label, found in labels:
+        if found:
+            listed = ", ".join(dict.fromkeys(repr(text) for text, _ in found))
+            warnings.append(Issue("warning", code, min(p for _, p in found), f"{label}: {listed}"))
+    return errors + warnings
+
+
+def _check_all(sources):
+    return [check(source) for source in sources]
+
+
+def check_records(records, jobs=1):
+    """[(record, issues)] for records with issues, in record order
+
+    jobs > 1 (or None for one per CPU) checks chunks on a process pool.
+    """
+    sources = [record.latex for record in records]
+    if jobs == 1:
+        results = _check_all(sources)
+    else:
+        workers = jobs or os.cpu_count() or 1
+        # A few chunks per worker balances load without pickling per formula.
+        size = max(1, -(-len(sources) // (workers * 4)))
+        chunks = [sources[i:i + size] for i in range(0, len(sources), size)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = [issues for chunk in pool.map(_check_all, chunks) for issues in chunk]
+    return [(record, issues) for record, issues in zip(records, results) if issues]
+
+
+def summarize(flagged):
+    """{"errors", "warnings", "formulas", "byCode": {code: count}}"""
+    by_code = {}
+    errors = warnings = 0
+    for _, issues in flagged:
+        for issue in issues:
+            by_code[issue.code] = by_code.get(issue.code, 0) + 1
+            if issue.severity == "error":
+                errors += 1
+            else:
+                warnings += 1
+    return {"errors": errors, "warnings": warnings, "formulas": len(flagged), "byCode": by_code}
+
+
+def format_issue(record, issue):
+    return f"{issue.severity}: {record.id} ({record.title}) col {issue.position + 1}: {issue.message}"
+
+
+class LatexCheckError(ValueError):
+    def __init__(self, failures):
+        super().__init__(f"{len(failures)} LaTeX issue(s) fail the build")
+        self.failures = failures
+
+
+class LatexGate:
+    """Collects the LaTeX issues of formulas as a build streams them
+
+    enforce() passes the build's (id, fragment) pairs through and raises
+    LatexCheckError after the last one when any issue fails the build, so
+    the streaming write is abandoned and the asset keeps its old contents.
+    """
+
+    def __init__(self, strict=False):
+        self.strict = strict
+        self.flagged = []
+
+    def add(self, record_id, title, issues):
+        if issues:
+            self.flagged.append((FormulaRef(record_id, title), issues))
+
+    def failures(self):
+        failing = ("error", "warning") if self.strict else ("error",)
+        return [
+            format_issue(record, issue)
+            for record, issues in self.flagged for issue in issues if issue.severity in failing
+        ]
+
+    def enforce(self, pairs):
+        yield from pairs
+        failures = self.failures()
+        if failures:
+            raise LatexCheckError(failures)
+
+
+def bench(count, jobs=None):
+    """Time check_records() serially and on a pool of jobs (None: one per CPU) workers"""
+    from bench_corpus import synthesize
+    from pipeline import normalize
+
+    records = list(normalize(synthesize(count)))
+    results = {"count": count, "workers": jobs or os.cpu_count()}
+    for label, workers in (("serial_s", 1), ("pool_s", jobs)):
+        start = time.perf_counter()
+        flagged = check_records(records, workers)
+        results[label] = time.perf_counter() - start
+    results["flagged"] = len(flagged)
+    return results
+
+
+def main(argv=None):
+    from records import read_records
+
+    parser = argparse.ArgumentParser(description="List LaTeX issues in the asset and time the checker")
+    parser.add_argument("--asset", default="assets/formulas.json")
+    parser.add_argument("--sizes", type=int, nargs="*", default=[])
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1,
+        help="worker processes; 0 means one per CPU (default: 1)",
+    )
+    parser.add_argument("--json", action="store_true", help="print issues as JSON")
+    args = parser.parse_args(argv)
+    jobs = args.jobs if args.jobs > 0 else None
+
+    flagged = check_records(read_records(args.asset), jobs)
+    if args.json:
+        print(json.dumps([
+            {"id": record.id, "issues": [issue._asdict() for issue in issues]}
+            for record, issues in flagged
+        ], indent=2))
+    else:
+        for record, issues in flagged:
+            for issue in issues:
+                print(format_issue(record, issue))
+        summary = summarize(flagged)
+        print(
+            f"{args.asset}: {summary['errors']} error(s), {summary['warnings']} warning(s) "
+            f"in {summary['formulas']} formula(s)"
+        )
+    for count in args.sizes:
+        # A one-worker pool would only time the serial path again.
+        r = bench(count, None if jobs == 1 else jobs)
+        print(
+            f"{r['count']:>9,} formulas: serial {r['serial_s']:.2f} s, "
+            f"pool of {r['workers']} {r['pool_s']:.2f} s, {r['flagged']:,} flagged"
+        )
+    return 1 if any(i.severity == "error" for _, issues in flagged for i in issues) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""Category-ordered formulas with precomputed lookup tables
+
+The generator's "lookup" variant writes formulas.lookup.json:
+
+    {"format": "formulas.lookup", "version": 2,
+     "formulas": [records sorted by category name, asset order within one],
+     "categories": [{"name", "start", "end"}],
+     "idHash": {"buckets": [displacement, ...], "ordinals": [...]},
+     "byTitle": [ordinals in title order],
+     "byCategoryTitle": [ordinals in (category, title) order],
+     "aliases": {dropped id: kept id}, when the asset has any}
+
+Because records are grouped by category, a category is the slice
+[start, end) and categories are already in getCategories() order. The
+same ranges apply to byCategoryTitle, so a category's alphabetical view is
+a slice too. Titles sort case-insensitively, ties in asset order.
+
+idHash is a minimal perfect hash of the ids (hash and displace). For an id
+with UTF-8 bytes key, where h(key, seed) is the 8-byte BLAKE2b digest of
+key salted with seed (16 bytes, little-endian) as a little-endian integer:
+
+    bucket = h(key, SEED) % len(buckets)
+    seed, shift = divmod(buckets[bucket], n)
+    slot = (h(key, seed) + shift) % n
+    ordinal = ordinals[slot]
+
+Each seed gives independent slots; the shift then moves a bucket's ids
+together into free slots.
+
+Every id gets its own slot in 0..n-1, so one lookup plus one id comparison
+finds a record (an unknown id lands on some other record's slot). Ids of
+dropped duplicates are resolved through aliases first. Run this
+script to benchmark against the app's scans:
+
+    python3 scripts/lookup_tables.py --sizes 10000 100000
+"""
+
+import argparse
+import bisect
+import hashlib
+import json
+import time
+from itertools import chain, islice
+
+from assetdoc import DocumentReader, check_format, dumps, median_us
+from fileio import write_if_changed
+from records import aliases_of
+
+FORMAT = "formulas.lookup"
+VERSION = 2
+SEED = 0x9E3779B9
+# Average ids per displacement bucket: fewer buckets means a smaller table
+# but a longer search for displacements at build time.
+BUCKET_LOAD = 4
+MAX_SEEDS = 1 << 12
+
+
+def _hash(key, seed):
+    digest = hashlib.blake2b(key, digest_size=8, salt=seed.to_bytes(16, "little")).digest()
+    return int.from_bytes(digest, "little")
+
+
+def _bucket(key, bucket_count):
+    return _hash(key, SEED) % bucket_count
+
+
+def build_id_hash(ids):
+    """Return {"buckets", "ordinals"}, a minimal perfect hash of ids"""
+    count = len(ids)
+    bucket_count = max(1, -(-count // BUCKET_LOAD))
+    buckets = [[] for _ in range(bucket_count)]
+    for ordinal, record_id in enumerate(ids):
+        key = record_id.encode("utf-8")
+        buckets[_bucket(key, bucket_count)].append((key, ordinal))
+
+    displacements = [0] * bucket_count
+    ordinals = [None] * count
+    free = list(range(count))
+    filled = 0
+    # Place crowded buckets first, while the table is still mostly free.
+    for bucket in sorted(range(bucket_count), key=lambda b: -len(buckets[b])):
+        members = buckets[bucket]
+        if not members:
+            break
+        placed = None
+        for seed in range(MAX_SEEDS):
+            bases = [_hash(key, seed) % count for key, _ in members]
+            # A shift moves the whole bucket, so ids that share a base never separate.
+            if len(set(bases)) < len(bases):
+                continue
+            if len(free) > 2 * (count - filled):
+                free = [slot for slot in free if ordinals[slot] is None]
+            # Try the shifts that put the first id in a free slot, from its own slot on.
+            start = bisect.bisect_left(free, bases[0])
+            for target in chain(islice(free, start, None), islice(free, start)):
+                shift = (target - bases[0]) % count
+                if all(ordinals[(base + shift) % count] is None for base in bases):
+                    placed = seed, shift
+                    break
+            if placed:
+                break
+        else:
+            raise ValueError(f"No displacement places bucket {bucket} ({len(members)} ids)")
+        seed, shift = placed
+        displacements[bucket] = seed * count + shift
+        for base, (_, ordinal) in zip(bases, members):
+            ordinals[(base + shift) % count] = ordinal
+        filled += len(members)
+    return {"buckets": displacements, "ordinals": ordinals}
+
+
+def _title_key(record):
+    return record.title.casefold()
+
+
+def build(records):
+    """Return the lookup document for records"""
+    ordered = sorted(records, key=lambda record: record.category)
+    categories = []
+    for ordinal, record in enumerate(ordered):
+        if not categories or categories[-1]["name"] != record.category:
+            categories.append({"name": record.category, "start": ordinal, "end": ordinal})
+        categories[-1]["end"] = ordinal + 1
+    ordinals = range(len(ordered))
+    doc = {
+        "format": FORMAT,
+        "version": VERSION,
+        "formulas": [record.to_dict() for record in ordered],
+        "categories": categories,
+        "idHash": build_id_hash([record.id for record in ordered]),
+        "byTitle": sorted(ordinals, key=lambda i: _title_key(ordered[i])),
+        "byCategoryTitle": sorted(ordinals, key=lambda i: (ordered[i].category, _title_key(ordered[i]))),
+    }
+    aliases = aliases_of(records)
+    if aliases:
+        doc["aliases"] = aliases
+    return doc
+
+
+def emit(records, path):
+    return write_if_changed(path, dumps(build(records)).encode("utf-8"))
+
+
+class LookupTables(DocumentReader):
+    """FormulaService lookups as O(1) hashes and slices"""
+
+    def __init__(self, doc):
+        check_format(doc, FORMAT, VERSION)
+        self.formulas = doc["formulas"]
+        self._ranges = {c["name"]: (c["start"], c["end"]) for c in doc["categories"]}
+        self._names = [c["name"] for c in doc["categories"]]
+        self._buckets = doc["idHash"]["buckets"]
+        self._slots = doc["idHash"]["ordinals"]
+        self._by_title = doc["byTitle"]
+        self._by_category_title = doc["byCategoryTitle"]
+        self._aliases = doc.get("aliases", {})
+
+    def ordinal(self, formula_id):
+        """Position of a formula in self.formulas, or None"""
+        count = len(self.formulas)
+        if not count:
+            return None
+        formula_id = self._aliases.get(formula_id, formula_id)
+        key = formula_id.encode("utf-8")
+        seed, shift = divmod(self._buckets[_bucket(key, len(self._buckets))], count)
+        ordinal = self._slots[(_hash(key, seed) + shift) % count]
+        return ordinal if self.formulas[ordinal]["id"] == formula_id else None
+
+    def get_formula_by_id(self, formula_id):
+        ordinal = self.ordinal(formula_id)
+        return self.formulas[ordinal] if ordinal is not None else None
+
+    def get_categories(self):
+        return list(self._names)
+
+    def get_formulas_by_category(self, category):
+        start, end = self._ranges.get(category, (0, 0))
+        return self.formulas[start:end]
+
+    def alphabetical(self, category=None):
+        """Formulas in title order, optionally within one category"""
+        if category is None:
+            return [self.formulas[i] for i in self._by_title]
+        start, end = self._ranges.get(category, (0, 0))
+        return [self.formulas[i] for i in self._by_category_title[start:end]]
+
+
+def bench(count, runs):
+    import random
+
+    import app_model
+    from bench_corpus import synthesize
+    from pipeline import normalize
+
+    records = list(normalize(synthesize(count)))
+    formulas = [app_model.Formula.from_json(record.to_dict()) for record in records]
+    start = time.perf_counter()
+    tables = LookupTables(json.loads(dumps(build(records))))
+    build_s = time.perf_counter() - start
+
+    rng = random.Random(0)
+    ids = [record.id for record in rng.sample(records, min(100, count))]
+    category = records[0].category
+
+    def lookups(get):
+        return lambda: [get(formula_id) for formula_id in ids]
+
+    return {
+        "count": count,
+        "build_s": build_s,
+        "hash_slots_per_id": (len(tables._buckets) + len(tables._slots)) / count,
+        "by_id_scan_us": median_us(lookups(lambda i: app_model.get_formula_by_id(formulas, i)), runs) / len(ids),
+        "by_id_hash_us": median_us(lookups(tables.get_formula_by_id), runs) / len(ids),
+        "category_scan_us": median_us(lambda: app_model.get_formulas_by_category(formulas, category), runs),
+        "category_slice_us": median_us(lambda: tables.get_formulas_by_category(category), runs),
+        "categories_scan_us": median_us(lambda: app_model.get_categories(formulas), runs),
+        "categories_table_us": median_us(tables.get_categories, runs),
+        "sort_scan_us": median_us(lambda: sorted(formulas, key=lambda f: f.title.casefold()), runs),
+        "sort_table_us": median_us(tables.alphabetical, runs),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark lookup tables against the app's scans")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    results = [bench(count, args.runs) for count in args.sizes]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    rows = [
+        ("getFormulaById", "by_id_scan_us", "by_id_hash_us"),
+        ("getFormulasByCategory", "category_scan_us", "category_slice_us"),
+        ("getCategories", "categories_scan_us", "categories_table_us"),
+        ("sort by title", "sort_scan_us", "sort_table_us"),
+    ]
+    for r in results:
+        print(
+            f"{r['count']:>9,} formulas: tables built in {r['build_s']:.1f} s, "
+            f"id hash {r['hash_slots_per_id']:.2f} ints per id"
+        )
+        for label, scan, table in rows:
+            print(f"    {label:<22} scan {r[scan]:>10.1f} us   table {r[table]:>8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
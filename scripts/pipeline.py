@@ -0,0 +1,190 @@
+"""Streaming record pipeline: source -> normalize -> validate -> check_latex -> serialize
+
+Every stage is a generator over records, so a build holds one record at a
+time no matter how large the corpus is. The serialized chunks concatenate to
+exactly what json.dump(doc, indent=2, ensure_ascii=False) writes for the
+{"formulas": [...]} document.
+"""
+
+import json
+
+import latex_check
+from corpus import SECTIONS, get_source, select_sources
+from id_ledger import IdLedger
+from records import FormulaRecord
+
+
+def iter_sections(categories=None):
+    """Yield (source, section) for the selected categories in build order"""
+    selected = select_sources(categories)
+    for section in SECTIONS:
+        for source in selected:
+            yield source, section
+
+
+def entry_keys(entries):
+    """The (title, latex) pairs the id ledger matches records on"""
+    return [(entry["title"], entry["latex"]) for entry in entries]
+
+
+def source_keys(source):
+    return {section: entry_keys(source.entries(section)) for section in SECTIONS}
+
+
+def iter_source(categories=None, ledger=None):
+    """Yield (record_id, source, entry) for every selected record
+
+    Ids come from the id ledger; without one the committed ledger is read
+    (and any new ids are not saved).
+    """
+    if ledger is None:
+        ledger = IdLedger()
+    for source, section in iter_sections(categories):
+        ids = ledger.section_ids(
+            source.category, source.prefix, section, lambda: source_keys(source)
+        )
+        for record_id, entry in zip(ids, source.entries(section)):
+            yield record_id, source, entry
+
+
+def normalize(items):
+    """Turn (record_id, source, entry) triples into FormulaRecords"""
+    for record_id, source, entry in items:
+        yield FormulaRecord.from_entry(record_id, source.category, entry)
+
+
+def drop_duplicates(records, deduper):
+    """Drop records that exactly duplicate an earlier one (see dedupe.Deduper)"""
+    for record in records:
+        if deduper.check(record.id, record.category, record.title, record.latex) is None:
+            yield record
+
+
+def check_record(record):
+    """Return a list of schema problems with a record (empty when valid)"""
+    problems = []
+    for key in ("id", "title", "category", "latex", "description"):
+        if not isinstance(getattr(record, key), str):
+            problems.append(f"{key} is not a string")
+    if isinstance(record.id, str) and not record.id:
+        problems.append("id is empty")
+    if isinstance(record.title, str) and not record.title.strip():
+        problems.append("title is empty")
+
+    for variable in record.variables:
+        if not isinstance(variable.name, str) or not isinstance(variable.type, str):
+            problems.append(f"variable {variable.to_dict()!r} needs string name and type")
+
+    calculator = record.calculator
+    if calculator is not None:
+        if not all(isinstance(i, str) for i in calculator.inputs):
+            problems.append("calculator.inputs is not a list of strings")
+        if not isinstance(calculator.output, str):
+            problems.append("calculator.output is not a string")
+    return problems
+
+
+def validate(records, seen=None):
+    """Pass records through, raising ValueError on the first invalid or duplicate one
+
+    The set of seen ids is the only pipeline state that grows with the
+    corpus; pass one in to check uniqueness across several streams.
+    """
+    if seen is None:
+        seen = set()
+    for record in records:
+        problems = check_record(record)
+        record_id = record.id
+        if not problems and record_id in seen:
+            problems.append("duplicate id")
+        if problems:
+            raise ValueError(f"Invalid formula {record_id!r}: {'; '.join(problems)}")
+        seen.add(record_id)
+        yield record
+
+
+def check_latex(records, issues):
+    """Pass records through, appending each one's LaTeX issues to issues
+
+    Parsing happens before serialization, so a build can fail on a formula
+    the app could not render before the asset is written.
+    """
+    for record in records:
+        issues.append(latex_check.check(record.latex))
+        yield record
+
+
+# Records sit two levels deep in the document, so each is rendered with
+# indent=2 and shifted right by four spaces.
+_ITEM_INDENT = "    "
+
+
+def serialize_body(body):
+    """Render a record body as the tail of a list item, after its id line"""
+    text = json.dumps(body, indent=2, ensure_ascii=False)
+    return _ITEM_INDENT + text[2:].replace("\n", "\n" + _ITEM_INDENT)
+
+
+def serialize(records):
+    """Yield (id, fragment) pairs; the fragment excludes the id line"""
+    for record in records:
+        yield record.id, serialize_body(record.body_dict())
+
+
+def splice_id(record_id, fragment):
+    id_line = json.dumps(record_id, ensure_ascii=False)
+    return f'{_ITEM_INDENT}{{\n{_ITEM_INDENT}  "id": {id_line},\n{fragment}'
+
+
+def iter_document(pairs, aliases=None):
+    """Yield the text chunks of the formulas document for (id, fragment) pairs
+
+    aliases (dropped id -> kept id, see dedupe) is read after the last pair,
+    so it may be filled in while the pairs stream; when non-empty it follows
+    the formulas list.
+    """
+    first = True
+    for record_id, fragment in pairs:
+        yield ('{\n  "formulas": [\n' if first else ",\n")
+        yield splice_id(record_id, fragment)
+        first = False
+    tail = '{\n  "formulas": []' if first else "\n  ]"
+    if aliases:
+        text = json.dumps(aliases, indent=2, ensure_ascii=False)
+        tail += ',\n  "aliases": ' + text.replace("\n", "\n  ")
+    yield tail + "\n}"
+
+
+def serialize_source(name, sections=SECTIONS):
+    """Process-pool task: run one source's sections through the pipeline
+
+    Returns (prefix, category, {section: (fragments, keys, LaTeX issues)}). Fragments
+    carry no ids; records get placeholder ids for validation here and the
+    parent assigns real ones from the id ledger when it merges results in
+    build order.
+    """
+    source = get_source(name)
+    result = {}
+    for section in sections:
+        entries = source.entries(section)
+        stream = (
+            (f"{name}:{section}:{offset}", source, entry)
+            for offset, entry in enumerate(entries)
+        )
+        issues = []
+        records = check_latex(validate(normalize(stream)), issues)
+        fragments = [fragment for _, fragment in serialize(records)]
+        result[section] = (fragments, entry_keys(entries), issues)
+    return source.prefix, source.category, result
+
+
+class Tally:
+    """Counts items as they stream past"""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, items):
+        for item in items:
+            self.count += 1
+            yield item
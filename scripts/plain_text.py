@@ -0,0 +1,460 @@
+#!/usr/bin/env python3
+"""Unicode plain-text renderings of formulas, for rows that skip LaTeX layout
+
+to_plain_text() flattens a formula's latex (see latex.parse) into a string
+a Text widget can draw:
+
+    A=\\pi r^2                      A = πr²
+    x=\\frac{-b\\pm\\sqrt{b^2-4ac}}{2a}  x = (−b ± √(b² − 4ac))/(2a)
+    \\sum_{i=1}^{n} x_i              ∑ᵢ₌₁ⁿ xᵢ
+    KE=\\frac{1}{2}mv^2              KE = ½mv²
+
+Greek letters, operators and relations map to their Unicode characters,
+scripts to superscript and subscript characters, and fractions to a/b with
+parentheses where precedence needs them. A formula is exact when every
+part had a faithful form. Otherwise the text is a best effort and the
+formula is marked inexact, for example:
+
+    - a script with a character that has no super/subscript form: x_{cm}
+      becomes x_(cm), e^{i\\pi} becomes e^(iπ)
+    - matrices and cases, which are written out as rows: (a, b; c, d)
+    - \\binom, \\overset and commands KaTeX does not know
+    - LaTeX that does not parse, which is passed through as is
+
+The generator's "plain" variant writes formulas.plain.json:
+
+    {"format": "formulas.plain", "version": 1, "ids": [...],
+     "text": [plain text per formula], "exact": [true/false per formula]}
+
+PlainText.find() searches the texts by visible content: "πr2" finds
+"A = πr²". Run this script to list the inexact formulas, or pass LaTeX
+strings to convert them:
+
+    python3 scripts/plain_text.py 'E=mc^2' '\\frac{a}{b}'
+"""
+
+import argparse
+import unicodedata
+
+import latex
+from assetdoc import DocumentReader, check_format, dumps
+from fileio import write_if_changed
+
+FORMAT = "formulas.plain"
+VERSION = 1
+
+SUPERSCRIPTS = dict(zip(
+    "0123456789+-−=()abcdefghijklmnoprstuvwxyzABDEGHIJKLMNOPRTUVWαβγδεθιφχ",
+    "⁰¹²³⁴⁵⁶⁷⁸⁹⁺⁻⁻⁼⁽⁾ᵃᵇᶜᵈᵉᶠᵍʰⁱʲᵏˡᵐⁿᵒᵖʳˢᵗᵘᵛʷˣʸᶻᴬᴮᴰᴱᴳᴴᴵᴶᴷᴸᴹᴺᴼᴾᴿᵀᵁⱽᵂᵅᵝᵞᵟᵋᶿᶥᵠᵡ",
+))
+SUBSCRIPTS = dict(zip(
+    "0123456789+-−=()aehijklmnoprstuvxβγρφχ",
+    "₀₁₂₃₄₅₆₇₈₉₊₋₋₌₍₎ₐₑₕᵢⱼₖₗₘₙₒₚᵣₛₜᵤᵥₓᵦᵧᵨᵩᵪ",
+))
+GREEK = {
+    "alpha": "α", "beta": "β", "gamma": "γ", "delta": "δ", "epsilon": "ϵ", "varepsilon": "ε",
+    "zeta": "ζ", "eta": "η", "theta": "θ", "vartheta": "ϑ", "iota": "ι", "kappa": "κ",
+    "lambda": "λ", "mu": "μ", "nu": "ν", "xi": "ξ", "pi": "π", "varpi": "ϖ", "rho": "ρ",
+    "varrho": "ϱ", "sigma": "σ", "varsigma": "ς", "tau": "τ", "upsilon": "υ", "phi": "ϕ",
+    "varphi": "φ", "chi": "χ", "psi": "ψ", "omega": "ω", "Gamma": "Γ", "Delta": "Δ",
+    "Theta": "Θ", "Lambda": "Λ", "Xi": "Ξ", "Pi": "Π", "Sigma": "Σ", "Upsilon": "Υ",
+    "Phi": "Φ", "Psi": "Ψ", "Omega": "Ω",
+}
+# Command -> (text, kind). Kinds drive spacing: "rel" and "bin" get spaces
+# around them, "op" (big operators, named functions) a space before a
+# following letter.
+SYMBOLS = {
+    **{"\\" + name: (char, "ord") for name, char in GREEK.items()},
+    **{command: (char, "rel") for command, char in (
+        ("\\leq", "≤"), ("\\le", "≤"), ("\\geq", "≥"), ("\\ge", "≥"), ("\\neq", "≠"),
+        ("\\ne", "≠"), ("\\approx", "≈"), ("\\equiv", "≡"), ("\\sim", "∼"), ("\\simeq", "≃"),
+        ("\\cong", "≅"), ("\\propto", "∝"), ("\\ll", "≪"), ("\\gg", "≫"), ("\\in", "∈"),
+        ("\\notin", "∉"), ("\\subset", "⊂"), ("\\subseteq", "⊆"), ("\\supset", "⊃"),
+        ("\\supseteq", "⊇"), ("\\perp", "⊥"), ("\\parallel", "∥"), ("\\mid", "∣"),
+        ("\\to", "→"), ("\\rightarrow", "→"), ("\\leftarrow", "←"), ("\\leftrightarrow", "↔"),
+        ("\\Rightarrow", "⇒"), ("\\Leftarrow", "⇐"), ("\\Leftrightarrow", "⇔"),
+        ("\\implies", "⟹"), ("\\iff", "⟺"), ("\\mapsto", "↦"), ("\\rightleftharpoons", "⇌"),
+    )},
+    **{command: (char, "bin") for command, char in (
+        ("\\cdot", "·"), ("\\times", "×"), ("\\div", "÷"), ("\\pm", "±"), ("\\mp", "∓"),
+        ("\\ast", "∗"), ("\\star", "⋆"), ("\\circ", "∘"), ("\\bullet", "•"), ("\\oplus", "⊕"),
+        ("\\otimes", "⊗"), ("\\cup", "∪"), ("\\cap", "∩"), ("\\setminus", "∖"),
+        ("\\wedge", "∧"), ("\\vee", "∨"), ("\\land", "∧"), ("\\lor", "∨"),
+    )},
+    **{command: (char, "op") for command, char in (
+        ("\\sum", "∑"), ("\\prod", "∏"), ("\\int", "∫"), ("\\iint", "∬"), ("\\iiint", "∭"),
+        ("\\oint", "∮"),
+    )},
+    **{command: (char, "ord") for command, char in (
+        ("\\infty", "∞"), ("\\partial", "∂"), ("\\nabla", "∇"), ("\\hbar", "ℏ"), ("\\ell", "ℓ"),
+        ("\\Re", "ℜ"), ("\\Im", "ℑ"), ("\\emptyset", "∅"), ("\\forall", "∀"), ("\\exists", "∃"),
+        ("\\neg", "¬"), ("\\angle", "∠"), ("\\triangle", "△"), ("\\degree", "°"),
+        ("\\prime", "′"), ("\\dots", "…"), ("\\ldots", "…"), ("\\cdots", "⋯"), ("\\vdots", "⋮"),
+        ("\\ddots", "⋱"), ("\\vert", "|"), ("\\Vert", "‖"), ("\\lvert", "|"), ("\\rvert", "|"),
+        ("\\%", "%"), ("\\&", "&"), ("\\#", "#"), ("\\$", "$"), ("\\_", "_"), ("\\|", "‖"),
+    )},
+    **{command: (char, "open") for command, char in (
+        ("\\langle", "⟨"), ("\\lfloor", "⌊"), ("\\lceil", "⌈"), ("\\{", "{"),
+    )},
+    **{command: (char, "close") for command, char in (
+        ("\\rangle", "⟩"), ("\\rfloor", "⌋"), ("\\rceil", "⌉"), ("\\}", "}"),
+    )},
+    **dict.fromkeys(("\\,", "\\:", "\\;", "\\ ", "\\quad", "\\qquad"), (" ", "space")),
+    **dict.fromkeys(("\\!", "\\big", "\\Big", "\\bigg", "\\Bigg", "\\bigl", "\\bigr", "\\Bigl", "\\Bigr"), ("", "space")),
+}
+NAMED_OPERATORS = frozenset((
+    "\\sin", "\\cos", "\\tan", "\\cot", "\\sec", "\\csc", "\\arcsin", "\\arccos", "\\arctan",
+    "\\sinh", "\\cosh", "\\tanh", "\\coth", "\\ln", "\\log", "\\exp", "\\det", "\\dim", "\\ker",
+    "\\deg", "\\gcd", "\\arg", "\\Pr", "\\lim", "\\limsup", "\\liminf", "\\max", "\\min",
+    "\\sup", "\\inf",
+))
+CHARACTERS = {
+    "-": ("−", "bin"), "+": ("+", "bin"), "*": ("∗", "bin"),
+    "=": ("=", "rel"), "<": ("<", "rel"), ">": (">", "rel"), ":": (":", "rel"),
+    ",": (",", "punct"), ";": (";", "punct"),
+    "(": ("(", "open"), "[": ("[", "open"), ")": (")", "close"), "]": ("]", "close"),
+    "'": ("′", "ord"),
+}
+# Combining marks for accents over a single character.
+ACCENTS = {
+    "\\vec": "⃗", "\\overrightarrow": "⃗", "\\hat": "̂", "\\bar": "̄",
+    "\\overline": "̅", "\\tilde": "̃", "\\dot": "̇", "\\ddot": "̈",
+    "\\underline": "̲",
+}
+VULGAR_FRACTIONS = {
+    ("1", "2"): "½", ("1", "3"): "⅓", ("2", "3"): "⅔", ("1", "4"): "¼", ("3", "4"): "¾",
+    ("1", "5"): "⅕", ("1", "6"): "⅙", ("1", "8"): "⅛",
+}
+# Marks that bind to the factor before them rather than forming their own.
+POSTFIX = frozenset(("′", "!"))
+ROOTS = {"": "√", "2": "√", "3": "∛", "4": "∜"}
+ENVIRONMENT_BRACKETS = {
+    "pmatrix": ("(", ")"), "bmatrix": ("[", "]"), "Bmatrix": ("{", "}"), "vmatrix": ("|", "|"),
+    "Vmatrix": ("‖", "‖"), "cases": ("{", ""),
+}
+
+
+class _Flattener:
+    """Turns parse trees into (text, kind) pieces, noting anything flattened lossily"""
+
+    def __init__(self):
+        self.exact = True
+
+    def body(self, nodes):
+        pieces = []
+        previous = None
+        for node in nodes:
+            # Words the source separates with spaces keep them (prose entries).
+            # A space after a command only ends its name: \\omega t is ωt.
+            if (
+                previous is not None and node.kind == previous.kind == "symbol"
+                and (node.text.isalpha() or previous.text.isalpha())
+                and not previous.text.startswith("\\")
+                and node.position > previous.position + len(previous.text)
+            ):
+                pieces.append((" ", "space"))
+            pieces += self.node(node)
+            previous = node
+        return pieces
+
+    def text(self, nodes):
+        """Compact text of a body, without spacing around operators"""
+        return "".join(text for text, _ in self.body(nodes))
+
+    def node(self, node):
+        kind = node.kind
+        if kind == "symbol":
+            return [self.symbol(node.text)]
+        if kind == "group":
+            return self.body(node.children[0])
+        if kind == "text":
+            return [(node.text, "ord")]
+        if kind == "scripts":
+            return self.scripts(node)
+        if kind == "delimited":
+            left, right = (d if d != "." else "" for d in node.text)
+            left = SYMBOLS.get(left, (left, "open"))[0]
+            right = SYMBOLS.get(right, (right, "close"))[0]
+            return [(left, "open"), *self.body(node.children[0]), (right, "close")]
+        if kind == "environment":
+            return [self.environment(node)]
+        return self.command(node)
+
+    def symbol(self, text):
+        if text in SYMBOLS:
+            return SYMBOLS[text]
+        if text in NAMED_OPERATORS:
+            return text[1:], "op"
+        if text in CHARACTERS:
+            return CHARACTERS[text]
+        if text.startswith("\\"):
+            self.exact = False
+            return text[1:], "ord"
+        return text, "ord"
+
+    def script(self, nodes, table, marker):
+        text = self.text(nodes)
+        if text and all(char in table for char in text):
+            return "".join(table[char] for char in text)
+        self.exact = False
+        return marker + (text if len(text) == 1 else f"({text})")
+
+    def scripts(self, node):
+        base, sub, sup = node.children
+        pieces = self.body(base) or [("", "ord")]
+        scripted = pieces[-1][0]
+        if sub:
+            scripted += self.script(sub, SUBSCRIPTS, "_")
+        if sup:
+            scripted += self.script(sup, SUPERSCRIPTS, "^")
+        return pieces[:-1] + [(scripted, pieces[-1][1])]
+
+    def environment(self, node):
+        self.exact = False
+        rows = "; ".join(", ".join(self.text(cell) for cell in row) for row in node.children)
+        left, right = ENVIRONMENT_BRACKETS.get(node.text, ("", ""))
+        return left + rows + right, "ord"
+
+    def command(self, node):
+        name, arguments = node.text, node.children
+        if name in ("\\frac", "\\dfrac", "\\tfrac"):
+            return [self.fraction(*arguments)]
+        if name == "\\sqrt":
+            return [self.root(*arguments)]
+        if name in ACCENTS:
+            text = self.text(arguments[0])
+            if len(text) != 1:
+                self.exact = False
+            return [("".join(char + ACCENTS[name] for char in text), "ord")]
+        if name == "\\binom":
+            self.exact = False
+            return [(f"C({self.text(arguments[0])}, {self.text(arguments[1])})", "ord")]
+        if name in ("\\overset", "\\underset"):
+            self.exact = False
+            return self.body(arguments[1])
+        # Font commands (\mathbf, \mathcal) keep their letters.
+        return self.body(arguments[0])
+
+    def fraction(self, numerator, denominator):
+        top, bottom = self.body(numerator), self.body(denominator)
+        top_text, bottom_text = _join(top, compact=False), _join(bottom, compact=False)
+        if (top_text, bottom_text) in VULGAR_FRACTIONS:
+            return VULGAR_FRACTIONS[top_text, bottom_text], "ord"
+        if top_text[:1] in ("d", "∂") and bottom_text[:1] == top_text[0] and len(bottom) < 4:
+            # Leibniz notation: d/dx, dy/dt, ∂²/∂t²
+            return f"{top_text}/{bottom_text}", "op"
+        # a/b reads left to right, so a product on top needs no parentheses,
+        # but below a product of several factors does: b/(2a), yet n!/(n − r)!
+        # An operator takes everything after it: (sin x)/x, (∑xᵢ)/n.
+        if not _is_product(top) or _has_operator(top):
+            top_text = f"({top_text})"
+        if not _is_product(bottom) or _factors(bottom) > 1 or _has_operator(bottom):
+            bottom_text = f"({bottom_text})"
+        return f"{top_text}/{bottom_text}", "frac"
+
+    def root(self, radicand, index=()):
+        inner = self.body(radicand)
+        text = _join(inner, compact=False)
+        if len(inner) != 1 or inner[0][1] != "ord":
+            text = f"({text})"
+        degree = self.text(index)
+        if degree in ROOTS:
+            return ROOTS[degree] + text, "ord"
+        return self.script(index, SUPERSCRIPTS, "^") + "√" + text, "ord"
+
+
+def _is_product(pieces):
+    """Whether pieces have no operator outside brackets (a leading sign is fine)"""
+    depth = 0
+    for i, (_, kind) in enumerate(pieces):
+        if kind == "open":
+            depth += 1
+        elif kind == "close":
+            depth -= 1
+        elif depth == 0 and kind not in ("ord", "op", "frac", "space") and not (i == 0 and kind == "bin"):
+            return False
+    return True
+
+
+def _has_operator(pieces):
+    """Whether an operator outside brackets applies to more than one final bracket group
+
+    sin(A) reads the same after a slash; sin x, ∑xᵢ and ∑(x)(y) do not.
+    """
+    depth = 0
+    for i, (text, kind) in enumerate(pieces):
+        if kind == "open":
+            depth += 1
+        elif kind == "close":
+            depth -= 1
+        elif depth == 0 and kind == "op":
+            if not (text[:1].isalpha() and _closes_at_end(pieces, i + 1)):
+                return True
+    return False
+
+
+def _closes_at_end(pieces, start):
+    """Whether pieces[start:] is one ( ... ) group"""
+    if start >= len(pieces) or pieces[start][0] != "(":
+        return False
+    depth = 0
+    for i in range(start, len(pieces)):
+        kind = pieces[i][1]
+        if kind == "open":
+            depth += 1
+        elif kind == "close":
+            depth -= 1
+            if not depth:
+                return i == len(pieces) - 1
+    return False
+
+
+def _factors(pieces):
+    """How many factors sit side by side outside brackets: 2a -> 2, g(x) -> 1
+
+    Parentheses right after a Latin letter, operator or prime read as function
+    application (g(x), sin(A), f′(x)); other bracket groups are factors of
+    their own, including one after a factorial: r!(n − r)! -> 2.
+    """
+    depth = count = 0
+    last = ("", None)
+    for text, kind in pieces:
+        if kind == "open":
+            if depth == 0 and not (
+                text == "(" and (last[1] == "op" or last[0][:1].isascii() and last[0][:1].isalpha()
+                                 or last[0] == "′")
+            ):
+                count += 1
+            depth += 1
+        elif kind == "close":
+            depth -= 1
+        elif depth == 0 and kind in ("ord", "op", "frac") and text not in POSTFIX:
+            count += 1
+        if depth == 0:
+            last = (text, kind)
+    return count
+
+
+def _join(pieces, compact=True):
+    """Join (text, kind) pieces, spacing relations and binary operators unless compact"""
+    out = []
+    previous = None
+    for i, (text, kind) in enumerate(pieces):
+        if kind == "space":
+            if out and not out[-1].endswith(" ") and text:
+                out.append(" ")
+            continue
+        if kind == "frac":
+            # A fraction followed by a factor would read as a/(b c): (a/b)c.
+            following = pieces[i + 1][1] if i + 1 < len(pieces) else None
+            if following in ("ord", "op", "frac", "open"):
+                text = f"({text})"
+            kind = "ord"
+        infix = kind == "rel" or (kind == "bin" and previous in ("ord", "close"))
+        if infix and not compact:
+            if out and not out[-1].endswith(" "):
+                out.append(" ")
+            out.append(text + " ")
+        elif kind == "punct" and not compact:
+            out.append(text + " ")
+        else:
+            # sin θ, n log(a): named operators stand apart from letters.
+            if not compact and out and not out[-1].endswith(" ") and (
+                (previous == "op" and kind in ("ord", "op"))
+                or (kind == "op" and previous in ("ord", "close"))
+            ):
+                out.append(" ")
+            out.append(text)
+        previous = "sign" if kind == "bin" and not infix else kind
+    return "".join(out).strip()
+
+
+def to_plain_text(source):
+    """(text, exact) for a latex string"""
+    try:
+        nodes = latex.parse(source)
+    except latex.LatexSyntaxError:
+        return source, False
+    flattener = _Flattener()
+    text = _join(flattener.body(nodes), compact=False)
+    return text, flattener.exact
+
+
+def build(records):
+    """Return the plain-text document for records, in asset order"""
+    texts, exact = [], []
+    for record in records:
+        text, faithful = to_plain_text(record.latex)
+        texts.append(text)
+        exact.append(faithful)
+    return {
+        "format": FORMAT,
+        "version": VERSION,
+        "ids": [record.id for record in records],
+        "text": texts,
+        "exact": exact,
+    }
+
+
+def emit(records, path):
+    return write_if_changed(path, dumps(build(records)).encode("utf-8"))
+
+
+def search_key(text):
+    """Fold super/subscripts, vulgar fractions, case and spaces: "½mv²" -> "1/2mv2" """
+    folded = unicodedata.normalize("NFKC", text).casefold().replace("\u2044", "/")
+    return "".join(folded.split())
+
+
+class PlainText(DocumentReader):
+    """Plain-text lookups and visible-content search"""
+
+    def __init__(self, doc):
+        check_format(doc, FORMAT, VERSION)
+        self.ids = doc["ids"]
+        self.texts = doc["text"]
+        self._exact = doc["exact"]
+        self._ordinals = {record_id: i for i, record_id in enumerate(self.ids)}
+        self._keys = None
+
+    def text(self, formula_id):
+        """(text, exact) for a formula, or None"""
+        ordinal = self._ordinals.get(formula_id)
+        if ordinal is None:
+            return None
+        return self.texts[ordinal], self._exact[ordinal]
+
+    def find(self, query):
+        """Ids of formulas whose text contains query, in asset order"""
+        if self._keys is None:
+            self._keys = [search_key(text) for text in self.texts]
+        key = search_key(query)
+        return [self.ids[i] for i, text in enumerate(self._keys) if key in text]
+
+
+def main(argv=None):
+    from records import read_records
+
+    parser = argparse.ArgumentParser(description="Convert LaTeX to plain text, or list inexact formulas")
+    parser.add_argument("latex", nargs="*", help="LaTeX strings to convert")
+    parser.add_argument("--asset", default="assets/formulas.json")
+    parser.add_argument("--all", action="store_true", help="list every formula, not only inexact ones")
+    args = parser.parse_args(argv)
+
+    if args.latex:
+        for source in args.latex:
+            text, exact = to_plain_text(source)
+            print(f"{text}{'' if exact else '    (inexact)'}")
+        return
+    records = read_records(args.asset)
+    inexact = 0
+    for record in records:
+        text, exact = to_plain_text(record.latex)
+        inexact += not exact
+        if args.all or not exact:
+            print(f"{'  ' if exact else '~ '}{record.id:<12} {text}")
+    print(f"{args.asset}: {len(records) - inexact} exact, {inexact} inexact")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""Compact in-memory formula records
+
+The generator handles formulas as __slots__ objects rather than nested
+dicts. Repeated strings (categories, variable types and names) are interned,
+and identical variables and calculator specs are shared flyweights. Records
+become plain dicts only at the serialization edge, via to_dict()/body_dict(),
+which reproduce the key order of the JSON asset.
+"""
+
+import json
+import sys
+
+_intern = sys.intern
+
+
+class Variable:
+    __slots__ = ("name", "type", "unit", "description")
+
+    _shared = {}
+
+    def __init__(self, name, type, unit=None, description=None):
+        self.name = name
+        self.type = type
+        self.unit = unit
+        self.description = description
+
+    @classmethod
+    def of(cls, name, type, unit=None, description=None):
+        """Return the shared Variable for these fields"""
+        key = (name, type, unit, description)
+        variable = cls._shared.get(key)
+        if variable is None:
+            variable = cls._shared[key] = cls(
+                _intern(name) if isinstance(name, str) else name,
+                _intern(type) if isinstance(type, str) else type,
+                unit,
+                description,
+            )
+        return variable
+
+    @classmethod
+    def from_dict(cls, data):
+        unknown = set(data) - set(cls.__slots__)
+        if unknown:
+            raise ValueError(f"Unknown variable field(s): {', '.join(sorted(unknown))}")
+        return cls.of(data.get("name"), data.get("type"), data.get("unit"), data.get("description"))
+
+    def to_dict(self):
+        data = {"name": self.name, "type": self.type}
+        if self.unit is not None:
+            data["unit"] = self.unit
+        if self.description is not None:
+            data["description"] = self.description
+        return data
+
+
+class Calculator:
+    __slots__ = ("inputs", "output", "formula")
+
+    _shared = {}
+
+    def __init__(self, inputs, output, formula=None):
+        self.inputs = inputs
+        self.output = output
+        self.formula = formula
+
+    @classmethod
+    def of(cls, inputs, output, formula=None):
+        """Return the shared Calculator for these fields; inputs become a tuple"""
+        inputs = tuple(_intern(i) if isinstance(i, str) else i for i in inputs)
+        key = (inputs, output, formula)
+        calculator = cls._shared.get(key)
+        if calculator is None:
+            calculator = cls._shared[key] = cls(inputs, output, formula)
+        return calculator
+
+    @classmethod
+    def from_dict(cls, data):
+        unknown = set(data) - set(cls.__slots__)
+        if unknown:
+            raise ValueError(f"Unknown calculator field(s): {', '.join(sorted(unknown))}")
+        inputs = data.get("inputs")
+        if not isinstance(inputs, (list, tuple)):
+            raise ValueError("calculator.inputs is not a list")
+        return cls.of(inputs, data.get("output"), data.get("formula"))
+
+    def to_dict(self):
+        data = {"inputs": list(self.inputs), "output": self.output}
+        if self.formula is not None:
+            data["formula"] = self.formula
+        return data
+
+
+class FormulaRecord:
+    __slots__ = ("id", "title", "category", "latex", "description", "variables", "calculator")
+
+    def __init__(self, id, title, category, latex, description, variables=(), calculator=None):
+        self.id = id
+        self.title = title
+        self.category = category
+        self.latex = latex
+        self.description = description
+        self.variables = variables
+        self.calculator = calculator
+
+    @classmethod
+    def from_entry(cls, record_id, category, entry):
+        """Build a record from a corpus entry dict"""
+        return cls(
+            record_id,
+            entry["title"],
+            _intern(category),
+            entry["latex"],
+            entry["description"],
+            tuple(Variable.from_dict(v) for v in entry["variables"] or ()),
+            Calculator.from_dict(entry["calculator"]) if entry["calculator"] is not None else None,
+        )
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a record from a decoded asset object"""
+        return cls.from_entry(data["id"], data["category"], data)
+
+    def body_dict(self):
+        """The record as a JSON-ready dict without its id"""
+        return {
+            "title": self.title,
+            "category": self.category,
+            "latex": self.latex,
+            "description": self.description,
+            "variables": [v.to_dict() for v in self.variables],
+            "calculator": self.calculator.to_dict() if self.calculator is not None else None,
+        }
+
+    def to_dict(self):
+        return {"id": self.id, **self.body_dict()}
+
+
+class Records(list):
+    """FormulaRecords in asset order, plus the asset's aliases (dropped id -> kept id)"""
+
+    def __init__(self, records=(), aliases=None):
+        super().__init__(records)
+        self.aliases = dict(aliases) if aliases else {}
+
+
+def aliases_of(records):
+    """The aliases read along with records; a plain list has none"""
+    return getattr(records, "aliases", {})
+
+
+def read_records(path):
+    """Decode a formulas.json asset into Records, keeping its "aliases" map"""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return Records((FormulaRecord.from_dict(item) for item in data["formulas"]), data.get("aliases"))
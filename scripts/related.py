@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""Precomputed "related formulas" graph via MinHash and LSH
+
+The generator's "related" variant writes formulas.related.json:
+
+    {"format": "formulas.related", "version": 1, "k": 5, "ids": [...],
+     "related": [[ordinal, score, ordinal, score, ...] per formula]}
+
+Scores are similarities in percent, best first. A formula's features are
+its symbols (declared variables plus LaTeX commands, letters and
+subscripted variables, see symbol_index) and its category. The category
+counts as CATEGORY_WEIGHT features, so a shared category is worth a few
+shared symbols. Features carried by more than MAX_FEATURE_SHARE of the corpus
+(=, \\frac, x) say little about relatedness and are dropped. Similarity is
+the Jaccard index of the feature sets.
+
+Comparing every pair is quadratic, so candidates come from locality
+sensitive hashing. Each formula gets a MinHash signature, and the signature
+is cut into BANDS bands of ROWS rows. Formulas that agree on any whole band
+share a bucket and become candidates. With 32 bands of 2 rows, a pair at
+Jaccard 0.3 is a candidate with probability 1 - (1 - 0.3^2)^32, about 95%.
+Large buckets are windowed (see WINDOW), so each formula gets a bounded
+number of candidates. Only candidates are scored exactly. Run this script to compare against the
+exact all-pairs top-k and to time larger corpora:
+
+    python3 scripts/related.py --sizes 10000 100000
+"""
+
+import argparse
+import hashlib
+import heapq
+import time
+
+from assetdoc import DocumentReader, check_format, dumps
+from fileio import write_if_changed
+from symbol_index import record_symbols
+
+FORMAT = "formulas.related"
+VERSION = 1
+DEFAULT_K = 5
+MIN_SCORE = 0.2
+CATEGORY_WEIGHT = 3
+MAX_FEATURE_SHARE = 0.2
+BANDS = 32
+ROWS = 2
+# A bucket with more members than 2 * WINDOW + 1 is sorted by full signature
+# and each member is paired only with the next WINDOW. Members whose whole
+# signatures agree most end up adjacent, and the pair count stays linear in
+# the bucket size instead of quadratic.
+WINDOW = 4
+
+_PRIME = (1 << 61) - 1
+
+
+def features(records):
+    """Feature sets per record, without features too common to discriminate"""
+    sets = []
+    counts = {}
+    for record in records:
+        feature_set = {f"s:{symbol}" for symbol in record_symbols(record)}
+        for symbol in feature_set:
+            counts[symbol] = counts.get(symbol, 0) + 1
+        sets.append(feature_set)
+    limit = max(2, MAX_FEATURE_SHARE * len(records))
+    common = {feature for feature, count in counts.items() if count > limit}
+    for record, feature_set in zip(records, sets):
+        feature_set -= common
+        feature_set.update(f"c:{record.category}:{i}" for i in range(CATEGORY_WEIGHT))
+    return sets
+
+
+class MinHasher:
+    """BANDS * ROWS universal hash functions, applied per distinct feature once"""
+
+    def __init__(self, seed=1):
+        self._coefficients = []
+        for i in range(BANDS * ROWS):
+            digest = hashlib.blake2b(f"minhash:{seed}:{i}".encode(), digest_size=16).digest()
+            a = int.from_bytes(digest[:8], "little") % (_PRIME - 1) + 1
+            b = int.from_bytes(digest[8:], "little") % _PRIME
+            self._coefficients.append((a, b))
+        self._cache = {}
+
+    def hashes(self, feature):
+        values = self._cache.get(feature)
+        if values is None:
+            x = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+            values = [(a * x + b) % _PRIME for a, b in self._coefficients]
+            self._cache[feature] = values
+        return values
+
+    def signature(self, feature_set):
+        return list(map(min, zip(*(self.hashes(feature) for feature in feature_set))))
+
+
+def jaccard(a, b):
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared)
+
+
+def candidate_pairs(signatures):
+    """Ordinal pairs (i < j) that share at least one LSH bucket, encoded as i * n + j"""
+    count = len(signatures)
+    pairs = set()
+    for band in range(BANDS):
+        buckets = {}
+        start = band * ROWS
+        for ordinal, signature in enumerate(signatures):
+            buckets.setdefault(tuple(signature[start:start + ROWS]), []).append(ordinal)
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            window = len(members)
+            if window > 2 * WINDOW + 1:
+                members = sorted(members, key=signatures.__getitem__)
+                window = WINDOW
+            for x, i in enumerate(members):
+                for j in members[x + 1:x + 1 + window]:
+                    pairs.add(i * count + j if i < j else j * count + i)
+    return pairs
+
+
+def neighbors(records, k=DEFAULT_K, pairs=None):
+    """{ordinal: [(score, other ordinal), ...]} for records, best first
+
+    pairs defaults to LSH candidates; pass every pair for the exact answer.
+    Ties go to the lower ordinal.
+    """
+    sets = features(records)
+    if pairs is None:
+        hasher = MinHasher()
+        count = len(records)
+        pairs = (divmod(pair, count) for pair in candidate_pairs([hasher.signature(s) for s in sets]))
+    # Min-heaps of (score, -other) capped at k: the root is the weakest kept neighbor.
+    heaps = {}
+    for i, j in pairs:
+        score = jaccard(sets[i], sets[j])
+        if score < MIN_SCORE:
+            continue
+        for ordinal, other in ((i, j), (j, i)):
+            heap = heaps.setdefault(ordinal, [])
+            if len(heap) < k:
+                heapq.heappush(heap, (score, -other))
+            elif (score, -other) > heap[0]:
+                heapq.heapreplace(heap, (score, -other))
+    return {
+        ordinal: [(score, -other) for score, other in sorted(heap, reverse=True)]
+        for ordinal, heap in heaps.items()
+    }
+
+
+def build(records, k=DEFAULT_K):
+    """Return the related-formulas document for records, in asset order"""
+    top = neighbors(records, k)
+    related = []
+    for ordinal in range(len(records)):
+        flat = []
+        for score, other in top.get(ordinal, ()):
+            flat += (other, round(score * 100))
+        related.append(flat)
+    return {
+        "format": FORMAT,
+        "version": VERSION,
+        "k": k,
+        "ids": [record.id for record in records],
+        "related": related,
+    }
+
+
+def emit(records, path):
+    return write_if_changed(path, dumps(build(records)).encode("utf-8"))
+
+
+class RelatedFormulas(DocumentReader):
+    """Related-formula lookups by id"""
+
+    def __init__(self, doc):
+        check_format(doc, FORMAT, VERSION)
+        self.ids = doc["ids"]
+        self._ordinals = {record_id: i for i, record_id in enumerate(self.ids)}
+        self._related = doc["related"]
+
+    def related(self, formula_id):
+        """[(id, similarity 0-1)] for a formula, most similar first"""
+        ordinal = self._ordinals.get(formula_id)
+        if ordinal is None:
+            return []
+        flat = self._related[ordinal]
+        return [(self.ids[flat[i]], flat[i + 1] / 100) for i in range(0, len(flat), 2)]
+
+
+def recall(records, k=DEFAULT_K):
+    """Share of the exact all-pairs top-k neighbors that LSH also finds"""
+    count = len(records)
+    exact = neighbors(records, k, ((i, j) for i in range(count) for j in range(i + 1, count)))
+    approximate = neighbors(records, k)
+    wanted = found = 0
+    for ordinal, best in exact.items():
+        expected = {other for _, other in best}
+        got = {other for _, other in approximate.get(ordinal, ())}
+        wanted += len(expected)
+        found += len(expected & got)
+    return found / wanted if wanted else 1.0
+
+
+def bench(count):
+    from bench_corpus import synthesize
+    from pipeline import normalize
+
+    records = list(normalize(synthesize(count)))
+    start = time.perf_counter()
+    sets = features(records)
+    hasher = MinHasher()
+    signatures = [hasher.signature(s) for s in sets]
+    candidates = len(candidate_pairs(signatures))
+    lsh_s = time.perf_counter() - start
+    start = time.perf_counter()
+    text = dumps(build(records))
+    build_s = time.perf_counter() - start
+    return {
+        "count": count,
+        "candidates": candidates,
+        "all_pairs": count * (count - 1) // 2,
+        "lsh_s": lsh_s,
+        "build_s": build_s,
+        "asset_bytes": len(text.encode("utf-8")),
+    }
+
+
+def main(argv=None):
+    from records import read_records
+
+    parser = argparse.ArgumentParser(description="Check LSH recall and time the related-formulas build")
+    parser.add_argument("--asset", default="assets/formulas.json")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args(argv)
+
+    records = read_records(args.asset)
+    print(f"{args.asset}: recall of exact top-{DEFAULT_K} neighbors {recall(records):.1%}")
+    for count in args.sizes:
+        r = bench(count)
+        print(
+            f"{r['count']:>9,} formulas: {r['candidates']:,} candidate pairs of {r['all_pairs']:,} "
+            f"({r['candidates'] / r['all_pairs']:.3%}); signatures and buckets {r['lsh_s']:.1f} s, "
+            f"full build {r['build_s']:.1f} s, asset {r['asset_bytes'] / 1024:.0f} KiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""Per-formula render-cost metrics and classes as rendering hints
+
+metrics() measures a formula's latex from its parse tree (see latex.parse):
+
+    tokens         lexer tokens, without whitespace
+    depth          layout nesting: fraction and root arguments, scripts,
+                   \\left...\\right bodies and environment cells each add a level
+    fractions      \\frac, \\dfrac, \\tfrac, \\binom
+    roots          \\sqrt
+    bigOperators   \\sum, \\prod, \\int and friends, \\lim
+    environments   \\begin{...} blocks (matrices, cases)
+    width          estimated width in em at the app's text style, where
+                   fraction arguments and scripts shrink to 70%
+
+score() weighs these into one number and cost_class() buckets it into
+light, medium or heavy: F=ma and A=\\pi r^2 are light, \\frac{1}{2}mv^2 is
+medium, and the quadratic formula and the Binomial Theorem are heavy. The
+generator's "render" variant writes formulas.render.json:
+
+    {"format": "formulas.render", "version": 1,
+     "classes": ["light", "medium", "heavy"], "fields": [metric names],
+     "ids": [...], "cost": [class index per formula],
+     "metrics": [[value per field] per formula]}
+
+A list can read "cost" to draw heavy rows cheaply while scrolling. LaTeX
+that does not parse counts as heavy. Run this script for a report of the
+most expensive formulas:
+
+    python3 scripts/render_cost.py --top 20
+"""
+
+import argparse
+import json
+
+import latex
+from assetdoc import DocumentReader, check_format, dumps
+from fileio import write_if_changed
+
+FORMAT = "formulas.render"
+VERSION = 1
+CLASSES = ("light", "medium", "heavy")
+FIELDS = ("tokens", "depth", "fractions", "roots", "bigOperators", "environments", "width")
+# score() at or above these is medium and heavy respectively. Picked from the
+# corpus' score distribution: about 30% of formulas are light, 20% heavy.
+MEDIUM_SCORE = 16
+HEAVY_SCORE = 36
+
+FRACTIONS = frozenset(("\\frac", "\\dfrac", "\\tfrac", "\\binom"))
+BIG_OPERATORS = frozenset((
+    "\\sum", "\\prod", "\\int", "\\iint", "\\iiint", "\\oint", "\\lim", "\\limsup", "\\liminf",
+))
+SCRIPT_SCALE = 0.7
+MIN_SCALE = 0.5
+
+# Rough advance widths in em, for estimating only.
+_LETTER_EM = 0.55
+_DIGIT_EM = 0.5
+_RELATION_EM = 1.05
+_BINARY_EM = 0.95
+_RELATIONS = frozenset("=<>") | {
+    "\\approx", "\\leq", "\\geq", "\\le", "\\ge", "\\neq", "\\ne", "\\equiv", "\\sim", "\\propto",
+    "\\to", "\\rightarrow", "\\Rightarrow", "\\implies", "\\iff", "\\rightleftharpoons",
+}
+_BINARIES = frozenset("+-*") | {"\\cdot", "\\times", "\\pm", "\\mp", "\\div", "\\cup", "\\cap"}
+_SPACES = {"\\,": 0.17, "\\:": 0.22, "\\;": 0.28, "\\ ": 0.33, "\\quad": 1.0, "\\qquad": 2.0, "\\!": -0.17}
+# Named operators, set upright letter by letter.
+_NAMED = frozenset((
+    "sin", "cos", "tan", "cot", "sec", "csc", "arcsin", "arccos", "arctan", "sinh", "cosh", "tanh",
+    "coth", "ln", "log", "exp", "det", "dim", "ker", "deg", "gcd", "arg", "max", "min", "sup", "inf",
+))
+_SILENT = frozenset(("\\big", "\\Big", "\\bigg", "\\Bigg", "\\bigl", "\\bigr", "\\Bigl", "\\Bigr"))
+
+
+def _symbol_width(text):
+    if text in _RELATIONS:
+        return _RELATION_EM
+    if text in _BINARIES:
+        return _BINARY_EM
+    if text in _SPACES:
+        return _SPACES[text]
+    if text in _SILENT:
+        return 0.0
+    if text in BIG_OPERATORS:
+        return 1.0 if text != "\\lim" else 1.4
+    if text.startswith("\\"):
+        # Greek letters and symbols are about a letter wide; \sin and other
+        # named operators are set upright, letter by letter, plus spacing.
+        name = text[1:]
+        if latex.is_greek(text) or len(name) < 2 or name not in _NAMED:
+            return 0.6
+        return len(name) * 0.45 + 0.17
+    if text.isdigit() or text.replace(".", "", 1).isdigit():
+        return len(text) * _DIGIT_EM
+    if text in ("(", ")", "[", "]", "|"):
+        return 0.39
+    return _LETTER_EM
+
+
+class _Measure:
+    def __init__(self):
+        self.depth = 0
+        self.fractions = 0
+        self.roots = 0
+        self.big_operators = 0
+        self.environments = 0
+
+    def body(self, nodes, scale, level):
+        self.depth = max(self.depth, level)
+        return sum(self.node(node, scale, level) for node in nodes)
+
+    def node(self, node, scale, level):
+        kind = node.kind
+        if kind == "symbol":
+            if node.text in BIG_OPERATORS:
+                self.big_operators += 1
+            return _symbol_width(node.text) * scale
+        if kind == "group":
+            return self.body(node.children[0], scale, level)
+        if kind == "text":
+            return len(node.text) * 0.5 * scale
+        inner = max(MIN_SCALE, scale * SCRIPT_SCALE)
+        if kind == "scripts":
+            base, sub, sup = node.children
+            width = self.body(base, scale, level)
+            return width + max(self.body(sub, inner, level + 1), self.body(sup, inner, level + 1))
+        if kind == "delimited":
+            return self.body(node.children[0], scale, level + 1) + 0.8 * scale
+        if kind == "environment":
+            self.environments += 1
+            columns = {}
+            for row in node.children:
+                for column, cell in enumerate(row):
+                    width = self.body(cell, scale, level + 1)
+                    columns[column] = max(columns.get(column, 0.0), width)
+            return sum(columns.values()) + len(columns) * scale + 0.8 * scale
+        # kind == "command"
+        if node.text in FRACTIONS:
+            self.fractions += 1
+            numerator, denominator = node.children
+            return max(self.body(numerator, inner, level + 1), self.body(denominator, inner, level + 1)) + 0.24
+        if node.text == "\\sqrt":
+            self.roots += 1
+            width = self.body(node.children[0], scale, level + 1) + 0.85 * scale
+            if len(node.children) > 1:
+                width += self.body(node.children[1], MIN_SCALE, level + 1)
+            return width
+        # Accents (\vec, \bar) and font commands keep their argument's width.
+        return sum(self.body(argument, scale, level) for argument in node.children)
+
+
+def metrics(source):
+    """{field: value} for a latex string, or None when it does not parse"""
+    try:
+        nodes = latex.parse(source)
+    except latex.LatexSyntaxError:
+        return None
+    measure = _Measure()
+    width = measure.body(nodes, 1.0, 0)
+    return {
+        "tokens": sum(1 for kind, _, _ in latex.tokenize(source) if kind != "space"),
+        "depth": measure.depth,
+        "fractions": measure.fractions,
+        "roots": measure.roots,
+        "bigOperators": measure.big_operators,
+        "environments": measure.environments,
+        "width": round(width, 1),
+    }
+
+
+def score(values):
+    """One number for ranking: tokens, plus weights for the structures that are slow to lay out"""
+    return (
+        values["tokens"]
+        + 4 * (values["fractions"] + values["roots"] + values["bigOperators"])
+        + 12 * values["environments"]
+        + 3 * max(0, values["depth"] - 1)
+        + max(0.0, values["width"] - 12)
+    )
+
+
+def cost_class(values):
+    """"light", "medium" or "heavy"; None (unparsable) is heavy"""
+    if values is None:
+        return "heavy"
+    points = score(values)
+    if points >= HEAVY_SCORE:
+        return "heavy"
+    if points >= MEDIUM_SCORE:
+        return "medium"
+    return "light"
+
+
+def build(records):
+    """Return the render-cost document for records, in asset order"""
+    cost, rows = [], []
+    for record in records:
+        values = metrics(record.latex)
+        cost.append(CLASSES.index(cost_class(values)))
+        rows.append([values[field] for field in FIELDS] if values is not None else None)
+    return {
+        "format": FORMAT,
+        "version": VERSION,
+        "classes": list(CLASSES),
+        "fields": list(FIELDS),
+        "ids": [record.id for record in records],
+        "cost": cost,
+        "metrics": rows,
+    }
+
+
+def emit(records, path):
+    return write_if_changed(path, dumps(build(records)).encode("utf-8"))
+
+
+class RenderHints(DocumentReader):
+    """Render-cost lookups by id"""
+
+    def __init__(self, doc):
+        check_format(doc, FORMAT, VERSION)
+        self.classes = doc["classes"]
+        self.fields = doc["fields"]
+        self.ids = doc["ids"]
+        self._ordinals = {record_id: i for i, record_id in enumerate(self.ids)}
+        self._cost = doc["cost"]
+        self._metrics = doc["metrics"]
+
+    def cost_class(self, formula_id):
+        ordinal = self._ordinals.get(formula_id)
+        return self.classes[self._cost[ordinal]] if ordinal is not None else None
+
+    def metrics(self, formula_id):
+        ordinal = self._ordinals.get(formula_id)
+        if ordinal is None or self._metrics[ordinal] is None:
+            return None
+        return dict(zip(self.fields, self._metrics[ordinal]))
+
+
+def report(records, top=15):
+    """{"classes": {class: count}, "top": [{"id", "title", "class", "score", **metrics}]}
+
+    Formulas that do not parse have no metrics and a None score; they rank first.
+    """
+    counts = dict.fromkeys(CLASSES, 0)
+    ranked = []
+    for record in records:
+        values = metrics(record.latex)
+        counts[cost_class(values)] += 1
+        points = score(values) if values is not None else None
+        ranked.append((points, record, values))
+    ranked.sort(key=lambda item: (item[0] is not None, -(item[0] or 0)))
+    return {
+        "classes": counts,
+        "top": [
+            {"id": record.id, "title": record.title, "class": cost_class(values),
+             "score": points, **(values or {})}
+            for points, record, values in ranked[:top]
+        ],
+    }
+
+
+def main(argv=None):
+    from records import read_records
+
+    parser = argparse.ArgumentParser(description="Report the formulas that are most expensive to render")
+    parser.add_argument("--asset", default="assets/formulas.json")
+    parser.add_argument("--top", type=int, default=15, help="how many formulas to list")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    result = report(read_records(args.asset), args.top)
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+    total = sum(result["classes"].values())
+    print(f"{args.asset}: " + ", ".join(
+        f"{count} {name} ({count / total:.0%})" for name, count in result["classes"].items()
+    ))
+    columns = ("tok", "dep", "frac", "root", "big", "env")
+    print(f"{'score':>6} {'class':<7} " + " ".join(f"{c:>4}" for c in columns) + f" {'em':>5}  formula")
+    for row in result["top"]:
+        if row.get("tokens") is None:
+            print(f"{'-':>6} {row['class']:<7} does not parse  {row['id']} {row['title']}")
+            continue
+        print(
+            f"{row['score']:>6.0f} {row['class']:<7} {row['tokens']:>4} {row['depth']:>4} "
+            f"{row['fractions']:>4} {row['roots']:>4} {row['bigOperators']:>4} {row['environments']:>4} "
+            f"{row['width']:>5.1f}  {row['id']} {row['title']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""Prebuilt inverted index with BM25 scores for formula search
+
+The generator's "search" variant writes formulas.search.json:
+
+    {"format": "formulas.search", "version": 1, "k1", "b", "fieldWeights",
+     "scoreScale", "docCount", "avgDocLength", "ids": [...],
+     "terms": [sorted terms], "postings": [[gap, score, gap, score, ...]]}
+
+Title, description and category are tokenized into lowercase words. A
+word's frequency in a formula is its count per field times the field's
+weight, so title matches rank above description matches. postings[i] lists
+the formulas containing terms[i] as (ordinal gap, score) pairs. Each score
+is the term's full BM25 contribution to that formula, times scoreScale and
+rounded, so a query only adds up integers from the posting lists it touches.
+
+SearchIndex is the query engine. Every query word must match (like the
+app's substring scan, which needs the whole query to occur). The last word
+also matches as a prefix, because the app searches as the user types.
+Results come back best first. Run this script to benchmark it against
+app_model.search_formulas:
+
+    python3 scripts/search_index.py --sizes 500 10000 100000
+"""
+
+import argparse
+import bisect
+import json
+import math
+import re
+import statistics
+import time
+from collections import Counter
+
+from assetdoc import DocumentReader, check_format, dumps, median_ms
+from fileio import write_if_changed
+
+FORMAT = "formulas.search"
+VERSION = 1
+K1 = 1.2
+B = 0.75
+FIELD_WEIGHTS = {"title": 3, "category": 2, "description": 1}
+SCORE_SCALE = 100
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+def tokenize(text):
+    return _WORD.findall(text.lower())
+
+
+def build(records):
+    """Return the index document for records, in asset order"""
+    frequencies = []
+    lengths = []
+    for record in records:
+        counts = Counter()
+        for field, weight in FIELD_WEIGHTS.items():
+            for token in tokenize(getattr(record, field)):
+                counts[token] += weight
+        frequencies.append(counts)
+        lengths.append(sum(counts.values()))
+
+    doc_count = len(frequencies)
+    avg_length = sum(lengths) / doc_count if doc_count else 0.0
+    postings = {}
+    for ordinal, counts in enumerate(frequencies):
+        for token, tf in counts.items():
+            postings.setdefault(token, []).append((ordinal, tf))
+
+    terms = sorted(postings)
+    encoded = []
+    for term in terms:
+        posting = postings[term]
+        idf = math.log(1 + (doc_count - len(posting) + 0.5) / (len(posting) + 0.5))
+        flat = []
+        previous = 0
+        for ordinal, tf in posting:
+            norm = K1 * (1 - B + B * lengths[ordinal] / avg_length)
+            score = idf * tf * (K1 + 1) / (tf + norm)
+            flat += (ordinal - previous, max(1, round(score * SCORE_SCALE)))
+            previous = ordinal
+        encoded.append(flat)
+
+    return {
+        "format": FORMAT,
+        "version": VERSION,
+        "k1": K1,
+        "b": B,
+        "fieldWeights": FIELD_WEIGHTS,
+        "scoreScale": SCORE_SCALE,
+        "docCount": doc_count,
+        "avgDocLength": round(avg_length, 3),
+        "ids": [record.id for record in records],
+        "terms": terms,
+        "postings": encoded,
+    }
+
+
+def emit(records, path):
+    return write_if_changed(path, dumps(build(records)).encode("utf-8"))
+
+
+class SearchIndex(DocumentReader):
+    """Ranked search over an index document
+
+    Posting lists are decoded the first time a query touches their term.
+    """
+
+    def __init__(self, doc):
+        check_format(doc, FORMAT, VERSION)
+        self.ids = doc["ids"]
+        self.terms = doc["terms"]
+        self.scale = doc["scoreScale"]
+        self._raw = doc["postings"]
+        self._term_index = {term: i for i, term in enumerate(self.terms)}
+        self._decoded = {}
+
+    def postings(self, term_index):
+        """{ordinal: score} for one term"""
+        posting = self._decoded.get(term_index)
+        if posting is None:
+            flat = self._raw[term_index]
+            posting = {}
+            ordinal = 0
+            for i in range(0, len(flat), 2):
+                ordinal += flat[i]
+                posting[ordinal] = flat[i + 1]
+            self._decoded[term_index] = posting
+        return posting
+
+    def _matches(self, token, prefix):
+        """{ordinal: score} for a query word; a prefix keeps each formula's best term"""
+        if not prefix:
+            i = self._term_index.get(token)
+            return self.postings(i) if i is not None else {}
+        start = bisect.bisect_left(self.terms, token)
+        end = bisect.bisect_left(self.terms, token + "\U0010ffff", start)
+        if end - start == 1:
+            return self.postings(start)
+        best = {}
+        for i in range(start, end):
+            for ordinal, score in self.postings(i).items():
+                if score > best.get(ordinal, 0):
+                    best[ordinal] = score
+        return best
+
+    def search_scored(self, query, limit=None):
+        """[(id, score)] for formulas matching every query word, best first"""
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        matches = [
+            self._matches(token, prefix=(i == len(tokens) - 1))
+            for i, token in enumerate(tokens)
+        ]
+        matches.sort(key=len)
+        scores = dict(matches[0])
+        for match in matches[1:]:
+            scores = {
+                ordinal: score + match[ordinal]
+                for ordinal, score in scores.items()
+                if ordinal in match
+            }
+            if not scores:
+                return []
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [(self.ids[ordinal], score / self.scale) for ordinal, score in ranked]
+
+    def search(self, query, limit=None):
+        """Ids of formulas matching query, best first"""
+        return [record_id for record_id, _ in self.search_scored(query, limit)]
+
+
+def bench(count, runs):
+    import app_model
+    from bench_corpus import SEARCH_QUERIES, synthesize
+    from pipeline import iter_document, normalize, serialize
+
+    records = list(normalize(synthesize(count)))
+    formulas = app_model.decode_formulas("".join(iter_document(serialize(records))))
+
+    start = time.perf_counter()
+    text = dumps(build(records))
+    build_ms = (time.perf_counter() - start) * 1000
+    index = SearchIndex(json.loads(text))
+
+    queries = {}
+    for query in SEARCH_QUERIES:
+        # The first query on a term pays for decoding its postings; time warm queries.
+        index.search(query)
+        queries[query] = {
+            "scan_ms": median_ms(lambda: app_model.search_formulas(formulas, query), runs),
+            "index_ms": median_ms(lambda: index.search(query), runs),
+            "scan_hits": len(app_model.search_formulas(formulas, query)),
+            "index_hits": len(index.search(query)),
+        }
+    return {
+        "count": count,
+        "build_ms": build_ms,
+        "index_bytes": len(text.encode("utf-8")),
+        "terms": len(index.terms),
+        "scan_ms": statistics.median(q["scan_ms"] for q in queries.values()),
+        "index_ms": statistics.median(q["index_ms"] for q in queries.values()),
+        "queries": queries,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the BM25 index against the linear scan")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 10_000, 100_000])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    results = [bench(count, args.runs) for count in args.sizes]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for r in results:
+        print(
+            f"{r['count']:>9,} formulas: index {r['index_bytes'] / 1024:.0f} KiB, "
+            f"{r['terms']:,} terms, built in {r['build_ms']:.0f} ms; "
+            f"median query: scan {r['scan_ms']:.3f} ms, index {r['index_ms']:.3f} ms"
+        )
+        for query, q in r["queries"].items():
+            print(
+                f"    {query!r:<20} scan {q['scan_ms']:8.3f} ms ({q['scan_hits']:>6} hits)"
+                f"  index {q['index_ms']:8.3f} ms ({q['index_hits']:>6} hits)"
+            )
+
+
+if __name__ == "__main__":
+    main()
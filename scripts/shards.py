@@ -0,0 +1,89 @@
+"""Per-category shards of the formulas asset plus a manifest
+
+    <dir>/manifest.json   category name, shard file, record count, byte size
+                          and sha256 of every shard, sorted by category name,
+                          and the asset's "aliases" map when it has one
+    <dir>/<slug>.json     {"formulas": [...]} for one category, compact
+
+The manifest alone answers getCategories() and category counts; a shard is
+decoded only when its category is first opened.
+"""
+
+import hashlib
+import json
+import os
+import re
+
+from assetdoc import dumps
+from fileio import write_if_changed
+from records import aliases_of
+
+MANIFEST = "manifest.json"
+VERSION = 1
+
+
+def shard_name(category):
+    return re.sub(r"[^a-z0-9]+", "_", category.lower()).strip("_") + ".json"
+
+
+def encode_shard(records):
+    doc = {"formulas": [record.to_dict() for record in records]}
+    return dumps(doc).encode("utf-8")
+
+
+def build_shards(records):
+    """Return (manifest, {file name: bytes}) for records grouped by category"""
+    by_category = {}
+    for record in records:
+        by_category.setdefault(record.category, []).append(record)
+
+    files = {}
+    entries = []
+    for category in sorted(by_category):
+        data = encode_shard(by_category[category])
+        name = shard_name(category)
+        if name in files:
+            raise ValueError(f"Categories map to the same shard file {name}")
+        files[name] = data
+        entries.append({
+            "name": category,
+            "file": name,
+            "count": len(by_category[category]),
+            "bytes": len(data),
+            "sha256": hashlib.sha256(data).hexdigest(),
+        })
+    manifest = {"version": VERSION, "count": len(records), "categories": entries}
+    aliases = aliases_of(records)
+    if aliases:
+        manifest["aliases"] = aliases
+    return manifest, files
+
+
+def read_manifest(directory):
+    with open(os.path.join(directory, MANIFEST), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def emit(records, directory):
+    """Write shards and manifest into directory; returns whether anything changed
+
+    Shards listed by the previous manifest but not the new one are removed.
+    """
+    manifest, files = build_shards(records)
+    try:
+        previous = {entry["file"] for entry in read_manifest(directory)["categories"]}
+    except (FileNotFoundError, ValueError, KeyError):
+        previous = set()
+
+    changed = False
+    for name, data in files.items():
+        changed |= write_if_changed(os.path.join(directory, name), data)
+    for name in previous - set(files):
+        try:
+            os.unlink(os.path.join(directory, name))
+            changed = True
+        except FileNotFoundError:
+            pass
+    manifest_bytes = json.dumps(manifest, indent=2, ensure_ascii=False).encode("utf-8")
+    changed |= write_if_changed(os.path.join(directory, MANIFEST), manifest_bytes)
+    return changed
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Corpus version file and a reference warm-start cache for decoded formulas
+
+The generator's "version" variant writes formulas.version.json:
+
+    {"version": 1, "corpusHash": "<sha256>", "count": N}
+
+corpusHash is the sha256 of the canonical (minified) JSON of the records and
+aliases, so it changes whenever either does and never for formatting alone. The app
+can keep the hash of the corpus it last decoded in Hive next to a
+pre-decoded snapshot and compare one short string at start-up:
+
+    hash matches   -> load the snapshot, skip JSON parsing
+    hash differs   -> parse formulas.json, store a new snapshot and hash
+
+SnapshotStore and load_formulas() below are that flow in Python, with the
+Hive box modelled as a directory. Run this script to benchmark it:
+
+    python3 scripts/snapshot_cache.py --sizes 1000 10000 100000
+"""
+
+import argparse
+import hashlib
+import json
+import marshal
+import os
+import tempfile
+
+import app_model
+from assetdoc import median_ms
+from compression import minify
+from fileio import write_atomic, write_if_changed
+
+VERSION = 1
+HASH_KEY = "formulas_corpus_hash"
+
+
+def corpus_hash(records):
+    return hashlib.sha256(minify(records)).hexdigest()
+
+
+def version_doc(records):
+    return {"version": VERSION, "corpusHash": corpus_hash(records), "count": len(records)}
+
+
+def emit(records, path):
+    """Write the corpus version file; returns whether it changed"""
+    data = json.dumps(version_doc(records), indent=2).encode("utf-8")
+    return write_if_changed(path, data)
+
+
+def _to_rows(formulas):
+    return [
+        (
+            f.id, f.title, f.category, f.latex, f.description,
+            [(v.name, v.type, v.unit, v.description) for v in f.variables],
+            (f.calculator.inputs, f.calculator.output, f.calculator.formula)
+            if f.calculator is not None else None,
+        )
+        for f in formulas
+    ]
+
+
+def _from_rows(rows):
+    Variable, Calculator = app_model.Variable, app_model.CalculatorConfig
+    return [
+        app_model.Formula(
+            id, title, category, latex, description,
+            [Variable(*v) for v in variables],
+            Calculator(*calculator) if calculator is not None else None,
+        )
+        for id, title, category, latex, description, variables, calculator in rows
+    ]
+
+
+class SnapshotStore:
+    """Stand-in for a Hive box holding the corpus hash and decoded formulas"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._meta_path = os.path.join(directory, "meta.json")
+        self._snapshot_path = os.path.join(directory, "formulas.snapshot")
+
+    def stored_hash(self):
+        try:
+            with open(self._meta_path, "r", encoding="utf-8") as f:
+                return json.load(f).get(HASH_KEY)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def load(self):
+        with open(self._snapshot_path, "rb") as f:
+            return _from_rows(marshal.loads(f.read()))
+
+    def save(self, hash_value, formulas):
+        # Snapshot first: a crash between the writes leaves a stale hash,
+        # which only costs one extra full parse.
+        write_atomic(self._snapshot_path, marshal.dumps(_to_rows(formulas)))
+        write_atomic(self._meta_path, json.dumps({HASH_KEY: hash_value}).encode("utf-8"))
+
+
+def load_formulas(asset_path, version_path, store):
+    """Return (formulas, "snapshot" | "asset"), refreshing the snapshot on a hash change"""
+    with open(version_path, "r", encoding="utf-8") as f:
+        current = json.load(f)["corpusHash"]
+    if store.stored_hash() == current:
+        try:
+            return store.load(), "snapshot"
+        except (OSError, ValueError, EOFError, TypeError):
+            pass
+    formulas = app_model.load_formulas(asset_path)
+    store.save(current, formulas)
+    return formulas, "asset"
+
+
+def bench(count, runs, workdir):
+    from bench_corpus import synthesize
+    from pipeline import iter_document, normalize, serialize
+    from fileio import write_stream_if_changed
+
+    records = list(normalize(synthesize(count)))
+    asset = os.path.join(workdir, f"formulas_{count}.json")
+    version = os.path.join(workdir, f"formulas_{count}.version.json")
+    write_stream_if_changed(asset, iter_document(serialize(records)))
+    emit(records, version)
+    store = SnapshotStore(os.path.join(workdir, f"hive_{count}"))
+
+    def cold():
+        store.save(None, [])
+        formulas, source = load_formulas(asset, version, store)
+        assert source == "asset" and len(formulas) == count
+
+    def warm():
+        formulas, source = load_formulas(asset, version, store)
+        assert source == "snapshot" and len(formulas) == count
+
+    parse_ms = median_ms(lambda: app_model.load_formulas(asset), runs)
+    cold_ms = median_ms(cold, runs)
+    load_formulas(asset, version, store)
+    warm_ms = median_ms(warm, runs)
+    return {"count": count, "parse_ms": parse_ms, "cold_ms": cold_ms, "warm_ms": warm_ms}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark hash-check-then-load against a full parse")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="formula_snapshot_") as workdir:
+        results = [bench(count, args.runs, workdir) for count in args.sizes]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for r in results:
+        print(
+            f"{r['count']:>9,} formulas: full parse {r['parse_ms']:.1f} ms, "
+            f"cold (parse + snapshot) {r['cold_ms']:.1f} ms, "
+            f"warm (hash check + snapshot) {r['warm_ms']:.1f} ms "
+            f"({r['parse_ms'] / r['warm_ms']:.1f}x faster than parsing)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""Reverse index from math symbols to formulas
+
+The generator's "symbols" variant writes formulas.symbols.json:
+
+    {"format": "formulas.symbols", "version": 1, "ids": [...],
+     "symbols": [sorted symbols], "postings": [[ordinal gap, ...]]}
+
+A formula's symbols come from its latex and its declared variables:
+
+    commands       \\int, \\frac, \\sigma (layout commands such as \\left
+                   and \\, are skipped, and so are the letters inside
+                   \\text{...} and \\mathrm{...})
+    variables      single letters and Greek letters: x, \\theta
+    subscripted    x_1, R_total, v_{\\text{rms}} -> v_rms, \\theta_c; each is
+                   also indexed under its base (x, R, v, \\theta)
+    operators      ! ' | < >
+    variables[]    names, normalized the same way: "x1" -> x_1,
+                   "theta" -> \\theta
+
+SymbolIndex answers AND/OR queries such as "\\sigma", "\\sin OR \\cos" and
+"\\int AND x". Words next to each other are ANDed, and AND binds tighter
+than OR. Posting lists become integer bitmaps on first use, so a query costs
+a few big-int operations whatever the corpus size. Run this script to time
+queries:
+
+    python3 scripts/symbol_index.py --sizes 10000 100000
+"""
+
+import argparse
+import json
+import re
+import time
+
+import latex
+from assetdoc import DocumentReader, check_format, dumps, gaps, median_us
+from fileio import write_if_changed
+
+FORMAT = "formulas.symbols"
+VERSION = 1
+
+LAYOUT_COMMANDS = frozenset((
+    "\\left", "\\right", "\\text", "\\mathrm", "\\begin", "\\end",
+    "\\quad", "\\qquad", "\\,", "\\;", "\\:", "\\!", "\\ ", "\\\\", "\\%",
+))
+OPERATORS = frozenset("!'|<>")
+_SUBSCRIPT = re.compile(r"[A-Za-z0-9]+")
+_NAME_WITH_INDEX = re.compile(r"([A-Za-z])(\d+)")
+_NONZERO_BYTE = re.compile(rb"[^\x00]")
+_BYTE_BITS = [tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256)]
+
+
+def _subscript(body):
+    """The text of a simple subscript (1, c, total, \\text{rms}), else None"""
+    if len(body) == 1 and body[0].kind == "text":
+        text = body[0].text.strip()
+    elif all(node.kind == "symbol" for node in body):
+        text = "".join(node.text for node in body)
+    else:
+        return None
+    return text if _SUBSCRIPT.fullmatch(text) else None
+
+
+def _is_variable(node):
+    return node.kind == "symbol" and (
+        (len(node.text) == 1 and node.text.isascii() and node.text.isalpha())
+        or latex.is_greek(node.text)
+    )
+
+
+def latex_symbols(source):
+    """The set of symbols in a latex string
+
+    Text-mode groups (\\text{if}, \\mathrm{proj}) are prose, not variables,
+    so their letters are skipped.
+    """
+    try:
+        nodes = latex.parse(source)
+    except latex.LatexSyntaxError:
+        # The build rejects these; index what the tokens show.
+        return {
+            text for kind, text, _ in latex.tokenize(source)
+            if kind in ("command", "letter") and text not in LAYOUT_COMMANDS
+        }
+    symbols = set()
+    # walk() yields a scripts node before its subscript; x_{ab} is one symbol.
+    subscripts = set()
+    for node in latex.walk(nodes):
+        if id(node) in subscripts:
+            continue
+        if node.kind == "command":
+            symbols.add(node.text)
+        elif node.kind == "symbol":
+            if _is_variable(node) or (node.text.startswith("\\") and node.text not in LAYOUT_COMMANDS):
+                symbols.add(node.text)
+            elif node.text in OPERATORS:
+                symbols.add(node.text)
+        elif node.kind == "scripts":
+            base, sub, _ = node.children
+            if len(base) == 1 and _is_variable(base[0]) and sub:
+                subscript = _subscript(sub)
+                if subscript is not None:
+                    symbols.add(f"{base[0].text}_{subscript}")
+                    subscripts.update(id(part) for part in latex.walk(sub))
+    return symbols
+
+
+def normalize_symbol(name):
+    """Map a variable name or query word onto the index's spelling"""
+    if name in latex.GREEK:
+        return "\\" + name
+    match = _NAME_WITH_INDEX.fullmatch(name)
+    if match:
+        return f"{match.group(1)}_{match.group(2)}"
+    return name
+
+
+def record_symbols(record):
+    symbols = latex_symbols(record.latex)
+    for variable in record.variables:
+        symbols.add(normalize_symbol(variable.name))
+    return symbols
+
+
+def build(records):
+    """Return the symbol index document for records, in asset order"""
+    postings = {}
+    for ordinal, record in enumerate(records):
+        for symbol in record_symbols(record):
+            postings.setdefault(symbol, []).append(ordinal)
+    symbols = sorted(postings)
+    return {
+        "format": FORMAT,
+        "version": VERSION,
+        "ids": [record.id for record in records],
+        "symbols": symbols,
+        "postings": [gaps(postings[symbol]) for symbol in symbols],
+    }
+
+
+def emit(records, path):
+    return write_if_changed(path, dumps(build(records)).encode("utf-8"))
+
+
+def parse_query(query):
+    """"a b OR c AND d" -> [["a", "b"], ["c", "d"]]: an OR of ANDs"""
+    clauses = [[]]
+    for word in query.split():
+        if word == "OR":
+            clauses.append([])
+        elif word != "AND":
+            clauses[-1].append(word)
+    return [clause for clause in clauses if clause]
+
+
+class SymbolIndex(DocumentReader):
+    """AND/OR queries over the symbol index"""
+
+    def __init__(self, doc):
+        check_format(doc, FORMAT, VERSION)
+        self.ids = doc["ids"]
+        self.symbols = doc["symbols"]
+        self._symbol_index = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self._raw = doc["postings"]
+        self._bitmaps = {}
+
+    def resolve(self, word):
+        """The indexed spelling of a query word ("sigma", "\\sigma", "x1"), or None
+
+        A bare word means the command first: "sum" is \\sum, not a variable
+        named sum.
+        """
+        candidates = (word, normalize_symbol(word))
+        if word.isalpha():
+            candidates = ("\\" + word,) + candidates
+        for candidate in candidates:
+            if candidate in self._symbol_index:
+                return candidate
+        return None
+
+    def bitmap(self, symbol):
+        """An int whose bit n is set when formula n uses symbol"""
+        resolved = self.resolve(symbol)
+        if resolved is None:
+            return 0
+        bits = self._bitmaps.get(resolved)
+        if bits is None:
+            flags = bytearray((len(self.ids) + 7) // 8)
+            ordinal = 0
+            for gap in self._raw[self._symbol_index[resolved]]:
+                ordinal += gap
+                flags[ordinal >> 3] |= 1 << (ordinal & 7)
+            bits = int.from_bytes(flags, "little")
+            self._bitmaps[resolved] = bits
+        return bits
+
+    def match(self, query):
+        """Bitmap of formulas matching an AND/OR query"""
+        result = 0
+        for clause in parse_query(query):
+            bits = self.bitmap(clause[0])
+            for word in clause[1:]:
+                if not bits:
+                    break
+                bits &= self.bitmap(word)
+            result |= bits
+        return result
+
+    def count(self, query):
+        return self.match(query).bit_count()
+
+    def query(self, query, limit=None):
+        """Ids of formulas matching an AND/OR query, in asset order"""
+        bits = self.match(query)
+        if limit is None:
+            # bin() is most significant bit first; reversed, position n is formula n.
+            flags = bin(bits)[:1:-1]
+            return [self.ids[n] for n in _positions(flags)]
+        # For a first page, skip zero bytes without rendering the whole bitmap.
+        flags = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+        ids = []
+        for match in _NONZERO_BYTE.finditer(flags):
+            base = match.start() * 8
+            for bit in _BYTE_BITS[flags[match.start()]]:
+                if len(ids) >= limit:
+                    return ids
+                ids.append(self.ids[base + bit])
+        return ids
+
+
+def _positions(flags):
+    position = flags.find("1")
+    while position != -1:
+        yield position
+        position = flags.find("1", position + 1)
+
+
+BENCH_QUERIES = ["\\sigma", "\\int", "\\sin OR \\cos", "\\int AND x", "\\frac AND \\sqrt AND \\pi", "x_1 y_1"]
+
+
+def bench(count, runs):
+    from bench_corpus import synthesize
+    from pipeline import normalize
+
+    records = list(normalize(synthesize(count)))
+    start = time.perf_counter()
+    text = dumps(build(records))
+    build_ms = (time.perf_counter() - start) * 1000
+    index = SymbolIndex(json.loads(text))
+    queries = {}
+    for query in BENCH_QUERIES:
+        # The first query on a symbol pays for building its bitmap; time warm queries.
+        index.match(query)
+        queries[query] = {
+            "hits": index.count(query),
+            "match_us": median_us(lambda: index.match(query), runs),
+            "first_20_us": median_us(lambda: index.query(query, 20), runs),
+            "all_ids_us": median_us(lambda: index.query(query), runs),
+        }
+    return {
+        "count": count,
+        "build_ms": build_ms,
+        "index_bytes": len(text.encode("utf-8")),
+        "symbols": len(index.symbols),
+        "queries": queries,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark AND/OR symbol queries")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    results = [bench(count, args.runs) for count in args.sizes]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for r in results:
+        print(
+            f"{r['count']:>9,} formulas: {r['symbols']:,} symbols, "
+            f"index {r['index_bytes'] / 1024:.0f} KiB built in {r['build_ms']:.0f} ms"
+        )
+        for query, q in r["queries"].items():
+            print(
+                f"    {query!r:<32} {q['hits']:>7,} hits  match {q['match_us']:7.1f} us  "
+                f"first 20 ids {q['first_20_us']:7.1f} us  all ids {q['all_ids_us']:9.1f} us"
+            )
+
+
+if __name__ == "__main__":
+    main()
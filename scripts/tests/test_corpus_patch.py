@@ -0,0 +1,106 @@
+import copy
+import json
+
+import pytest
+
+import corpus_patch
+from pipeline import iter_document, serialize
+
+
+def formula(record_id, title, latex="x=1", category="Algebra"):
+    return {
+        "id": record_id, "title": title, "category": category, "latex": latex,
+        "description": f"{title} description", "variables": [], "calculator": None,
+    }
+
+
+OLD = [formula("alg_1", "Slope"), formula("alg_2", "Midpoint"), formula("alg_3", "Distance")]
+
+
+def round_trip(old, new, old_aliases=None, new_aliases=None):
+    patch = json.loads(json.dumps(corpus_patch.diff(old, new, old_aliases, new_aliases)))
+    rebuilt, aliases = corpus_patch.apply(copy.deepcopy(old), patch, old_aliases)
+    assert rebuilt == new
+    assert aliases == (new_aliases or {})
+    return patch
+
+
+def test_unchanged_corpus_gives_an_empty_patch():
+    patch = round_trip(OLD, OLD)
+    assert (patch["added"], patch["removed"], patch["modified"]) == ([], [], {})
+    assert "order" not in patch and "aliases" not in patch
+
+
+def test_modified_records_carry_changed_fields_only():
+    new = copy.deepcopy(OLD)
+    new[1]["latex"] = "M=\\frac{x_1+x_2}{2}"
+    patch = round_trip(OLD, new)
+    assert patch["modified"] == {"alg_2": {"latex": "M=\\frac{x_1+x_2}{2}"}}
+
+
+def test_added_and_removed_records():
+    new = [OLD[0], formula("alg_4", "Vertex"), OLD[2], formula("alg_5", "Circle")]
+    patch = round_trip(OLD, new)
+    assert patch["removed"] == ["alg_2"]
+    assert [(a["after"], a["record"]["id"]) for a in patch["added"]] == [
+        ("alg_1", "alg_4"), ("alg_3", "alg_5"),
+    ]
+
+
+def test_record_added_first():
+    round_trip(OLD, [formula("alg_4", "Vertex")] + OLD)
+
+
+def test_reorder_includes_the_full_order():
+    patch = round_trip(OLD, OLD[::-1])
+    assert patch["order"] == ["alg_3", "alg_2", "alg_1"]
+
+
+def test_aliases_round_trip():
+    new = OLD[:2]
+    patch = round_trip(OLD, new, {}, {"alg_3": "alg_1"})
+    assert patch["aliases"] == {"alg_3": "alg_1"}
+    round_trip(new, OLD, {"alg_3": "alg_1"}, {})
+
+
+def test_wrong_base_is_refused():
+    patch = corpus_patch.diff(OLD, OLD[:2])
+    with pytest.raises(ValueError, match="base corpus hash"):
+        corpus_patch.apply(OLD[1:], patch)
+
+
+def test_aliases_are_part_of_the_base_hash():
+    patch = corpus_patch.diff(OLD, OLD[:2], {"alg_9": "alg_1"}, {})
+    with pytest.raises(ValueError, match="base corpus hash"):
+        corpus_patch.apply(OLD, patch)
+
+
+def test_tampered_patch_fails_the_target_hash():
+    patch = corpus_patch.diff(OLD, OLD[:2])
+    patch["removed"] = []
+    with pytest.raises(ValueError, match="target hash"):
+        corpus_patch.apply(OLD, patch)
+
+
+def write_corpus(path, formulas, aliases=None):
+    records = corpus_patch._records(formulas)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("".join(iter_document(serialize(records), aliases)))
+
+
+def test_cli_rebuilds_the_target_byte_for_byte(tmp_path):
+    old, new = tmp_path / "old.json", tmp_path / "new.json"
+    write_corpus(old, OLD)
+    write_corpus(new, [OLD[0], formula("alg_4", "Vertex")], {"alg_2": "alg_1"})
+    patch, out = tmp_path / "update.patch.json", tmp_path / "out.json"
+    assert corpus_patch.main(["diff", str(old), str(new), "-o", str(patch)]) == 0
+    assert corpus_patch.main(["apply", str(old), str(patch), "-o", str(out)]) == 0
+    assert out.read_bytes() == new.read_bytes()
+
+
+def test_cli_refuses_fields_it_cannot_rebuild(tmp_path, capsys):
+    old, new = tmp_path / "old.json", tmp_path / "new.json"
+    write_corpus(old, OLD)
+    new.write_text(json.dumps({"formulas": OLD, "extra": {}}), encoding="utf-8")
+    assert corpus_patch.main(["diff", str(old), str(new), "-o", str(tmp_path / "p.json")]) == 1
+    assert "extra" in capsys.readouterr().err
@@ -0,0 +1,69 @@
+import json
+import os
+
+import pytest
+
+from dedupe import Deduper, canonical_latex
+from pipeline import drop_duplicates
+from records import FormulaRecord
+
+REPO = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+ASSET = os.path.join(REPO, "assets", "formulas.json")
+
+
+def _record(record_id, title, latex, category="Calculus"):
+    return FormulaRecord(record_id, title, category, latex, f"{title} description")
+
+
+@pytest.mark.parametrize("a, b", [
+    ("\\int u\\,dv = uv - \\int v\\,du", "\\int u\\,dv=uv-\\int v\\,du"),
+    ("\\left(a+b\\right)^{2}", "(a+b)^2"),
+    ("2\\pi r", "r 2\\pi"),
+    ("a+b=c", "c=b+a"),
+])
+def test_notation_only_differences_match(a, b):
+    assert canonical_latex(a) == canonical_latex(b)
+
+
+@pytest.mark.parametrize("a, b", [
+    ("a-b", "b-a"),
+    ("mc^2", "cm^2"),
+    ("\\frac{a}{b}c", "\\frac{a}{bc}"),
+])
+def test_different_formulas_differ(a, b):
+    assert canonical_latex(a) != canonical_latex(b)
+
+
+def test_exact_duplicate_is_aliased_to_the_first():
+    deduper = Deduper()
+    assert deduper.check("calc_68", "Calculus", "Integration by Parts", "\\int u\\,dv=uv-\\int v\\,du") is None
+    assert deduper.check("calc_287", "Calculus", "Integration  by parts", "\\int u\\,dv = uv - \\int v\\,du") == "calc_68"
+    assert deduper.aliases == {"calc_287": "calc_68"}
+
+
+def test_near_duplicates_are_kept():
+    records = [
+        _record("stat_1", "Mean", "\\bar{x}=\\frac{1}{n}\\sum x_i", "Statistics"),
+        _record("stat_2", "Sample Mean", "\\bar{x}=\\frac{1}{n}\\sum x_i", "Statistics"),
+        _record("alg_1", "Mean", "\\bar{x}=\\frac{1}{n}\\sum x_i", "Algebra"),
+        _record("stat_3", "Mean", "\\mu=\\frac{1}{N}\\sum x_i", "Statistics"),
+    ]
+    deduper = Deduper()
+    assert [record.id for record in drop_duplicates(records, deduper)] == ["stat_1", "stat_2", "alg_1", "stat_3"]
+    assert deduper.aliases == {}
+
+
+def test_repeated_duplicates_alias_the_surviving_id():
+    records = [_record(f"calc_{n}", "Power Rule", "\\frac{d}{dx}x^n=nx^{n-1}") for n in (5, 9, 12)]
+    deduper = Deduper()
+    assert [record.id for record in drop_duplicates(records, deduper)] == ["calc_5"]
+    assert deduper.aliases == {"calc_9": "calc_5", "calc_12": "calc_5"}
+
+
+def test_asset_aliases_point_at_kept_formulas():
+    with open(ASSET, encoding="utf-8") as f:
+        doc = json.load(f)
+    ids = {formula["id"] for formula in doc["formulas"]}
+    assert doc["aliases"] == {"calc_287": "calc_68", "wave_421": "wave_115", "thermo_469": "thermo_124"}
+    assert set(doc["aliases"].values()) <= ids
+    assert ids.isdisjoint(doc["aliases"])
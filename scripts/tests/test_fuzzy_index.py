@@ -0,0 +1,75 @@
+import json
+import os
+
+import pytest
+
+import fuzzy_index
+from records import read_records
+
+ASSET = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                     "assets", "formulas.json")
+
+
+@pytest.fixture(scope="module")
+def index():
+    doc = fuzzy_index.build(read_records(ASSET))
+    return fuzzy_index.FuzzyIndex(json.loads(fuzzy_index.dumps(doc)))
+
+
+def swaps(word):
+    for i in range(1, len(word)):
+        if word[i - 1] != word[i]:
+            yield word[:i - 1] + word[i] + word[i - 1] + word[i + 1:]
+
+
+def one_edits(word):
+    """Every deletion and swap, and every insertion or substitution of an x"""
+    for i in range(len(word)):
+        yield word[:i] + word[i + 1:]
+        yield word[:i] + "x" + word[i:]
+        yield word[:i] + "x" + word[i + 1:]
+    yield from swaps(word)
+
+
+@pytest.mark.parametrize("typo, word", [("wrok", "work"), ("aera", "area"), ("enrgy", "energy")])
+def test_swap_typos_are_found(index, typo, word):
+    assert word in [candidate for _, candidate in index.similar_words(typo)]
+
+
+def test_every_swap_of_every_title_word_is_found(index):
+    missed = [
+        (typo, word)
+        for word in index.words if fuzzy_index.max_distance(word) > 0
+        for typo in swaps(word)
+        if fuzzy_index.max_distance(typo) > 0
+        and word not in [candidate for _, candidate in index.similar_words(typo)]
+    ]
+    assert missed == []
+
+
+def test_single_edits_are_found(index):
+    # Every fourth title word keeps this quick; swaps are covered for all of them.
+    missed = [
+        (typo, word)
+        for word in index.words[::4] if len(word) >= 4
+        for typo in one_edits(word)
+        if fuzzy_index.max_distance(typo) > 0
+        and word not in [candidate for _, candidate in index.similar_words(typo)]
+    ]
+    assert missed == []
+
+
+def test_two_swaps_in_a_long_word(index):
+    assert "pythagorean" in [w for _, w in index.similar_words("pyhtagoraen")]
+
+
+def test_osa_distance_counts_a_swap_as_one_edit():
+    assert fuzzy_index.edit_distance("wrok", "work", 2) == 1
+    assert fuzzy_index.edit_distance("kinetc", "kinetic", 2) == 1
+    assert fuzzy_index.edit_distance("abc", "xyz", 1) == 2
+
+
+def test_search_ranks_exact_matches_first(index):
+    results = index.search_scored("kinetc energy")
+    assert results and results[0][1] == 1
+    assert all(distance >= results[0][1] for _, distance in results)
@@ -0,0 +1,63 @@
+import os
+import shutil
+
+import pytest
+
+import generate_formulas
+from build_cache import BuildCache
+from id_ledger import DEFAULT_LEDGER_PATH, IdLedger
+from latex_check import LatexCheckError, LatexGate
+
+REPO = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+ASSET = os.path.join(REPO, "assets", "formulas.json")
+
+
+def _frozen_ledger(tmp_path):
+    ledger_path = tmp_path / "formula_ids.json"
+    shutil.copy(DEFAULT_LEDGER_PATH, ledger_path)
+    return IdLedger(str(ledger_path), frozen=True)
+
+
+def _asset_bytes():
+    with open(ASSET, "rb") as f:
+        return f.read()
+
+
+def test_committed_ledger_reproduces_the_asset(tmp_path):
+    ledger = _frozen_ledger(tmp_path)
+    output = tmp_path / "formulas.json"
+    generate_formulas.write_formulas(str(output), ledger=ledger)
+    assert output.read_bytes() == _asset_bytes()
+    assert ledger.allocated == []
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+@pytest.mark.parametrize("cache_state", ["none", "cold", "warm"])
+def test_builds_are_byte_identical(tmp_path, jobs, cache_state):
+    cache = None
+    if cache_state != "none":
+        cache = BuildCache(str(tmp_path / "build_cache.json"))
+        if cache_state == "warm":
+            generate_formulas.write_formulas(
+                str(tmp_path / "warmup.json"), cache=cache, ledger=_frozen_ledger(tmp_path)
+            )
+            cache = BuildCache(cache.path)
+    output = tmp_path / "formulas.json"
+    generate_formulas.write_formulas(str(output), cache=cache, jobs=jobs, ledger=_frozen_ledger(tmp_path))
+    assert output.read_bytes() == _asset_bytes()
+    if cache_state == "warm":
+        assert cache.hits and not cache.misses
+
+
+def test_failing_latex_check_writes_nothing(tmp_path):
+    ledger_path = tmp_path / "formula_ids.json"
+    shutil.copy(DEFAULT_LEDGER_PATH, ledger_path)
+    before = ledger_path.read_bytes()
+    output = tmp_path / "formulas.json"
+    gate = LatexGate(strict=True)
+    with pytest.raises(LatexCheckError) as raised:
+        generate_formulas.write_formulas(str(output), ledger=IdLedger(str(ledger_path)), gate=gate)
+    assert raised.value.failures
+    assert not output.exists()
+    assert os.listdir(tmp_path) == ["formula_ids.json"]
+    assert ledger_path.read_bytes() == before
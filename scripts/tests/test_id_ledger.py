@@ -0,0 +1,103 @@
+import json
+
+import pytest
+
+from id_ledger import FrozenIdsError, IdLedger
+
+
+def ids(ledger, core, additional=(), category="Algebra", prefix="alg"):
+    """Ids of both sections of one category, as a build assigns them"""
+    keys = {"core": list(core), "additional": list(additional)}
+    return (
+        ledger.section_ids(category, prefix, "core", lambda: keys),
+        ledger.section_ids(category, prefix, "additional", lambda: keys),
+    )
+
+
+def rebuild(tmp_path, core, additional=(), **kwargs):
+    """Build against the saved ledger and save it, like one generator run"""
+    ledger = IdLedger(str(tmp_path / "ids.json"), **kwargs)
+    result = ids(ledger, core, additional)
+    ledger.save()
+    return result
+
+
+CORE = [("Quadratic Formula", "x=\\frac{-b}{2a}"), ("Slope", "m=\\frac{y_2-y_1}{x_2-x_1}")]
+
+
+def test_empty_ledger_numbers_in_build_order(tmp_path):
+    assert rebuild(tmp_path, CORE, [("Distance", "d=vt")]) == (["alg_1", "alg_2"], ["alg_3"])
+
+
+def test_rebuild_reuses_saved_ids(tmp_path):
+    first = rebuild(tmp_path, CORE)
+    assert rebuild(tmp_path, CORE) == first
+    with open(tmp_path / "ids.json", encoding="utf-8") as f:
+        assert json.load(f)["next"] == 3
+
+
+def test_insert_keeps_existing_ids(tmp_path):
+    rebuild(tmp_path, CORE)
+    inserted = [CORE[0], ("Midpoint", "M=\\frac{x_1+x_2}{2}"), CORE[1]]
+    assert rebuild(tmp_path, inserted) == (["alg_1", "alg_3", "alg_2"], [])
+
+
+def test_rename_keeps_id(tmp_path):
+    rebuild(tmp_path, CORE)
+    renamed = [("Quadratic Equation Roots", CORE[0][1]), CORE[1]]
+    assert rebuild(tmp_path, renamed) == (["alg_1", "alg_2"], [])
+
+
+def test_latex_edit_keeps_id(tmp_path):
+    rebuild(tmp_path, CORE)
+    edited = [("Quadratic Formula", "x=\\frac{-b\\pm\\sqrt{b^2-4ac}}{2a}"), CORE[1]]
+    assert rebuild(tmp_path, edited) == (["alg_1", "alg_2"], [])
+
+
+def test_move_between_sections_keeps_id(tmp_path):
+    rebuild(tmp_path, CORE)
+    assert rebuild(tmp_path, CORE[:1], CORE[1:]) == (["alg_1"], ["alg_2"])
+
+
+def test_rename_and_edit_together_is_a_new_formula(tmp_path):
+    rebuild(tmp_path, CORE)
+    replaced = [("Vertex", "h=-\\frac{b}{2a}"), CORE[1]]
+    assert rebuild(tmp_path, replaced) == (["alg_3", "alg_2"], [])
+
+
+def test_removed_ids_are_never_reused(tmp_path):
+    rebuild(tmp_path, CORE)
+    rebuild(tmp_path, CORE[1:])
+    assert rebuild(tmp_path, [("Distance", "d=vt"), CORE[1]]) == (["alg_3", "alg_2"], [])
+
+
+def test_restored_formula_gets_its_old_id(tmp_path):
+    rebuild(tmp_path, CORE)
+    rebuild(tmp_path, CORE[1:])
+    assert rebuild(tmp_path, CORE) == (["alg_1", "alg_2"], [])
+
+
+def test_identical_pairs_are_told_apart_by_occurrence(tmp_path):
+    twice = [CORE[0], CORE[0]]
+    assert rebuild(tmp_path, twice) == (["alg_1", "alg_2"], [])
+    assert rebuild(tmp_path, twice + [CORE[1]]) == (["alg_1", "alg_2", "alg_3"], [])
+
+
+def test_categories_are_matched_separately(tmp_path):
+    ledger = IdLedger(str(tmp_path / "ids.json"))
+    ids(ledger, CORE)
+    assert ids(ledger, CORE, category="Geometry", prefix="geo") == (["geo_3", "geo_4"], [])
+
+
+def test_frozen_ledger_refuses_new_ids(tmp_path):
+    rebuild(tmp_path, CORE)
+    assert rebuild(tmp_path, CORE, frozen=True) == (["alg_1", "alg_2"], [])
+    with pytest.raises(FrozenIdsError):
+        rebuild(tmp_path, CORE + [("Distance", "d=vt")], frozen=True)
+
+
+def test_save_skips_unchanged_ledger(tmp_path):
+    rebuild(tmp_path, CORE)
+    ledger = IdLedger(str(tmp_path / "ids.json"))
+    ids(ledger, CORE)
+    assert ledger.save() is False
@@ -0,0 +1,52 @@
+import pytest
+
+import latex
+import latex_check
+from dedupe import canonical_latex
+from plain_text import to_plain_text
+
+
+def _symbols(nodes):
+    return [node.text for node in nodes]
+
+
+def test_argument_takes_one_digit():
+    (frac,) = latex.parse("\\frac12")
+    assert frac.kind == "command"
+    assert [_symbols(body) for body in frac.children] == [["1"], ["2"]]
+    assert latex_check.check("\\frac12") == []
+
+
+def test_script_takes_one_digit():
+    scripts, rest = latex.parse("x^10")
+    assert _symbols(scripts.children[2]) == ["1"]
+    assert rest.text == "0"
+    (grouped,) = latex.parse("x^{10}")
+    assert _symbols(grouped.children[2]) == ["10"]
+
+
+def test_split_digits_keep_their_positions():
+    _, point, five = latex.parse("x^1.5")
+    assert (point.text, point.position) == (".", 3)
+    assert (five.text, five.position) == ("5", 4)
+
+
+def test_numbers_outside_arguments_stay_whole():
+    assert _symbols(latex.parse("10x")) == ["10", "x"]
+
+
+@pytest.mark.parametrize("source", ["\\frac1", "x^"])
+def test_missing_argument_still_fails(source):
+    with pytest.raises(latex.LatexSyntaxError):
+        latex.parse(source)
+
+
+def test_dedupe_tells_grouped_digits_apart():
+    assert canonical_latex("x^{10}") != canonical_latex("x^10")
+    assert canonical_latex("x^{1}0") == canonical_latex("x^10")
+    assert canonical_latex("x^{2}") == canonical_latex("x^2")
+
+
+def test_plain_text_scripts_one_digit():
+    assert to_plain_text("x^{10}") == ("x¹⁰", True)
+    assert to_plain_text("x^10")[0] == "x¹0"
@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+import lookup_tables
+from records import FormulaRecord, Records
+
+
+@pytest.mark.parametrize("count", [1, 2, 3, 255, 256, 511, 512, 526, 1024, 2048, 4096])
+def test_id_hash_is_minimal_and_perfect(count):
+    ids = [f"alg_{i}" for i in range(1, count + 1)]
+    table = lookup_tables.build_id_hash(ids)
+    assert sorted(table["ordinals"]) == list(range(count))
+    assert len(table["buckets"]) == -(-count // lookup_tables.BUCKET_LOAD)
+
+
+def record(record_id, title, category):
+    return FormulaRecord(record_id, title, category, "x=1", f"{title} description")
+
+
+@pytest.fixture
+def tables():
+    records = Records(
+        [
+            record("mech_1", "Velocity", "Mechanics"),
+            record("alg_2", "slope", "Algebra"),
+            record("mech_3", "Acceleration", "Mechanics"),
+            record("alg_4", "Quadratic Formula", "Algebra"),
+        ],
+        {"alg_9": "alg_2"},
+    )
+    doc = json.loads(lookup_tables.dumps(lookup_tables.build(records)))
+    return lookup_tables.LookupTables(doc)
+
+
+@pytest.mark.parametrize("count", [512, 1024, 2048])
+def test_lookup_finds_every_id_at_power_of_two_sizes(count):
+    records = [record(f"alg_{i}", f"Formula {i}", "Algebra") for i in range(1, count + 1)]
+    tables = lookup_tables.LookupTables(json.loads(lookup_tables.dumps(lookup_tables.build(records))))
+    assert all(tables.get_formula_by_id(r.id)["id"] == r.id for r in records)
+    assert tables.get_formula_by_id("alg_0") is None
+
+
+def test_get_formula_by_id(tables):
+    assert tables.get_formula_by_id("mech_3")["title"] == "Acceleration"
+    assert tables.get_formula_by_id("geo_1") is None
+
+
+def test_dropped_ids_resolve_through_aliases(tables):
+    assert tables.get_formula_by_id("alg_9")["id"] == "alg_2"
+
+
+def test_categories_are_sorted_slices(tables):
+    assert tables.get_categories() == ["Algebra", "Mechanics"]
+    assert [f["id"] for f in tables.get_formulas_by_category("Mechanics")] == ["mech_1", "mech_3"]
+    assert tables.get_formulas_by_category("Optics") == []
+
+
+def test_alphabetical_orders(tables):
+    assert [f["title"] for f in tables.alphabetical()] == [
+        "Acceleration", "Quadratic Formula", "slope", "Velocity",
+    ]
+    assert [f["title"] for f in tables.alphabetical("Algebra")] == ["Quadratic Formula", "slope"]
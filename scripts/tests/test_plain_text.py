@@ -0,0 +1,23 @@
+import pytest
+
+from plain_text import to_plain_text
+
+
+@pytest.mark.parametrize("source, text", [
+    ("\\frac{n!}{r!(n-r)!}", "n!/(r!(n − r)!)"),
+    ("\\frac{n!}{(n-r)!}", "n!/(n − r)!"),
+    ("\\frac{-b}{2a}", "−b/(2a)"),
+    ("\\frac{a}{g(x)}", "a/g(x)"),
+    ("\\frac{1}{f'(x)}", "1/f′(x)"),
+    ("\\frac{1}{\\sin(A)}", "1/sin(A)"),
+    ("\\frac{\\sin x}{x}", "(sin x)/x"),
+    ("\\frac{\\sum_i x_i}{n}", "(∑ᵢ xᵢ)/n"),
+    ("\\frac{\\sum(x_i-\\bar{x})(y_i-\\bar{y})}{\\sum(x_i-\\bar{x})^2}",
+     "(∑(xᵢ − x\u0304)(yᵢ − y\u0304))/(∑(xᵢ − x\u0304)²)"),
+])
+def test_fraction_denominators(source, text):
+    assert to_plain_text(source) == (text, True)
+
+
+def test_empty_root():
+    assert to_plain_text("\\sqrt{}") == ("√()", True)
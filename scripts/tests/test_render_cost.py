@@ -0,0 +1,19 @@
+import json
+
+from records import FormulaRecord
+from render_cost import report
+
+
+def _record(record_id, latex):
+    return FormulaRecord(record_id, record_id, "Algebra", latex, "description")
+
+
+def test_report_is_valid_json_with_unparseable_formulas():
+    result = report([
+        _record("alg_1", "x=1"),
+        _record("alg_2", "\\frac{a}"),
+        _record("alg_3", "\\sum_{i=1}^{n}\\frac{\\sqrt{x_i}}{n}"),
+    ])
+    assert [row["id"] for row in result["top"]] == ["alg_2", "alg_3", "alg_1"]
+    assert result["top"][0]["score"] is None
+    json.loads(json.dumps(result, allow_nan=False))
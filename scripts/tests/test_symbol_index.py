@@ -0,0 +1,40 @@
+from records import FormulaRecord, Variable
+from symbol_index import SymbolIndex, build, latex_symbols
+
+
+def _record(record_id, latex, variables=()):
+    return FormulaRecord(
+        record_id, record_id, "Algebra", latex, "description",
+        tuple(Variable(name, "double") for name in variables),
+    )
+
+
+def test_text_groups_are_not_variables():
+    symbols = latex_symbols("f(x)=\\mathrm{proj}_u v \\text{ if } x>0")
+    assert {"i", "p", "r", "o", "j"}.isdisjoint(symbols)
+    assert {"f", "x", "u", "v", ">"} <= symbols
+
+
+def test_text_subscript_is_a_subscripted_symbol():
+    assert latex_symbols("v_{\\text{rms}}=\\sqrt{\\frac{3kT}{m}}") >= {"v", "v_rms", "k", "T", "m"}
+
+
+def test_subscript_letters_belong_to_the_subscript():
+    assert latex_symbols("R_{total}=\\theta_c") == {"R", "R_total", "\\theta", "\\theta_c"}
+
+
+def test_environment_names_are_not_variables():
+    assert latex_symbols("\\begin{pmatrix}a&b\\\\c&d\\end{pmatrix}") == {"a", "b", "c", "d"}
+
+
+def test_command_words_resolve_before_variable_names():
+    index = SymbolIndex(build([
+        _record("mean", "\\bar{x}=\\frac{sum}{n}", variables=("sum", "n")),
+        _record("series", "\\sum_{i=1}^{n} i"),
+        _record("normal", "\\sigma^2"),
+    ]))
+    assert index.resolve("sum") == "\\sum"
+    assert index.query("sum") == ["series"]
+    assert index.query("sigma") == ["normal"]
+    assert index.query("\\sigma") == ["normal"]
+    assert index.query("n") == ["mean", "series"]
@@ -0,0 +1,58 @@
+import 'dart:convert';
+
+import 'package:flutter_test/flutter_test.dart';
+import 'package:formula_deck/services/formula_service.dart';
+
+Map<String, dynamic> _formula(String id, String title) => {
+      'id': id,
+      'title': title,
+      'category': 'Calculus',
+      'latex': '\\int u\\,dv = uv - \\int v\\,du',
+      'description': 'Test description',
+      'variables': [],
+    };
+
+void main() {
+  group('FormulaService aliases', () {
+    setUp(() {
+      FormulaService.clearCache();
+      FormulaService.parseFormulas(json.encode({
+        'formulas': [
+          _formula('calc_68', 'Integration by Parts'),
+          _formula('calc_70', 'Fundamental Theorem'),
+        ],
+        'aliases': {'calc_287': 'calc_68'},
+      }));
+    });
+
+    tearDown(FormulaService.clearCache);
+
+    test('resolves dropped ids to the formula they repeat', () async {
+      final formula = await FormulaService.getFormulaById('calc_287');
+
+      expect(formula, isNotNull);
+      expect(formula!.id, 'calc_68');
+      expect(FormulaService.resolveId('calc_287'), 'calc_68');
+    });
+
+    test('leaves kept and unknown ids unchanged', () async {
+      expect(FormulaService.resolveId('calc_70'), 'calc_70');
+      expect(FormulaService.resolveId('missing'), 'missing');
+      expect(await FormulaService.getFormulaById('missing'), isNull);
+    });
+
+    test('resolves saved bookmark ids', () {
+      final resolved = FormulaService.resolveIds(['calc_287', 'calc_70', 'calc_68']);
+
+      expect(resolved, {'calc_68', 'calc_70'});
+    });
+
+    test('treats a document without aliases as having none', () {
+      FormulaService.parseFormulas(json.encode({
+        'formulas': [_formula('calc_68', 'Integration by Parts')],
+      }));
+
+      expect(FormulaService.resolveId('calc_287'), 'calc_287');
+    });
+  });
+}